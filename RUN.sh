@@ -292,6 +292,9 @@ case "$1" in
     daily-summary|summary-daily)
         run_daily_summary
         ;;
+    profile|profile-startup)
+        python3 main_eod_system.py --profile-startup
+        ;;
     *)
         # Interactive menu
         while true; do
@@ -46,6 +46,12 @@ MAX_SECTOR_EXPOSURE = 0.40  # 40% max per sector
 # Market Circuit Breaker (Exit all positions if market crashes)
 MARKET_CRASH_THRESHOLD = -0.035  # -3.5% - Exit all if NIFTY down >3.5% (more realistic)
 NIFTY_SYMBOL = "^NSEI"  # NIFTY 50 index symbol
+
+# Benchmark Series Cache (Nifty / index history downloaded ONCE and shared by RS, regime, sectors, MQS)
+BENCHMARK_SERIES_CONFIG = {
+    'HISTORY_PERIOD': '1y',  # One download covers every caller's lookback
+    'REFRESH_MINUTES': 15,  # Max age of cached index data (scanner also refreshes once per scan)
+}
 # Hybrid Trailing Stop (Breakeven + ATR-based)
 # NOTE: These are DEFAULT/SWING values - positional uses strategy-specific overrides in code
 # Swing: Quick profit-taking - tighter trailing stops
@@ -190,6 +196,11 @@ MIN_WAVE_BARS = 5  # Minimum bars for wave identification
 GANN_ANGLES = [1, 2, 3, 4, 8]  # 1x1, 1x2, 1x3, 1x4, 1x8
 GANN_SQUARE_OF_9_ENABLED = True
 
+# Support & Resistance (swing pivots: bar is the highest high / lowest low of ±SR_PIVOT_WINDOW bars)
+SR_LOOKBACK_BARS = 100
+SR_PIVOT_WINDOW = 5
+SR_CLUSTER_TOLERANCE = 0.0  # Merge pivot levels within this fraction of price (e.g. 0.01 = 1%) - 0 disables
+
 # ═══════════════════════════════════════════════════════════════
 # 🤖 MACHINE LEARNING SETTINGS
 # ═══════════════════════════════════════════════════════════════
@@ -512,6 +523,20 @@ DISCORD_MENTION_ON_HIGH_SCORE = True  # @everyone on score >= 8.5
 DISCORD_SWING_ALERTS_ENABLED = False  # 🔥 SWING: Alerts DISABLED (1% scalping, many trades)
 DISCORD_POSITIONAL_ALERTS_ENABLED = True  # 📈 POSITIONAL: Alerts ENABLED (keep existing alerts)
 
+# Alert delivery (queued + background sender - the trading loop never waits on Discord)
+DISCORD_DISPATCH_CONFIG = {
+    'ASYNC': True,  # False = blocking post per alert (old behaviour)
+    'QUEUE_FILE': 'data/discord_queue.json',  # Undelivered alerts (one discord_queue.<pid>.json per process), re-sent by the next run
+    'MAX_EMBEDS_PER_MESSAGE': 10,  # Discord limit: alerts queued together share one message
+    'MAX_EMBED_CHARS': 6000,  # Discord limit on the embeds of one message
+    'COALESCE_WAIT_SECONDS': 1.0,  # Wait after an alert arrives for others to batch with it
+    'MAX_RETRIES': 5,  # Network / 5xx failures before an alert is dropped (429s don't count)
+    'BACKOFF_SECONDS': 2.0,  # Retry delay, doubled per attempt...
+    'MAX_BACKOFF_SECONDS': 60.0,  # ...up to this
+    'TIMEOUT_SECONDS': 10,
+    'SHUTDOWN_FLUSH_SECONDS': 10,  # Time given to deliver the queue at exit (the rest stays queued on disk)
+}
+
 # Alert Frequency
 SEND_DAILY_SUMMARY = True
 SEND_WEEKLY_REPORT = True
@@ -525,6 +550,30 @@ PAPER_TRADING_ENABLED = True
 PAPER_TRADING_AUTO_EXECUTE = True  # Automatically execute signals in paper portfolio
 PAPER_TRADING_FILE = 'data/paper_portfolio.json'
 
+# Trade Journal (append-only log next to each portfolio file - O(1) writes per change)
+# The *_portfolio.json / *_trades.json files become snapshots, compacted periodically via atomic rename
+TRADE_JOURNAL_CONFIG = {
+    'ENABLED': True,
+    'SNAPSHOT_EVERY_RECORDS': 200,  # Compact after this many journal lines
+    'SNAPSHOT_MINUTES': 5,  # ...or this long after the first uncompacted change (always at exit)
+}
+
+# Trade Store (SQLite: positions, trades, signals, scans - indexed by symbol/date/strategy)
+# Existing JSON portfolios are migrated automatically the first time they are loaded
+TRADE_STORE_CONFIG = {
+    'ENABLED': True,
+    'PATH': 'data/trading.db',
+}
+
+# Trading Calendar (precomputed NSE session index - O(1) trading-day counts for holding periods)
+# Holidays come from HOLIDAYS_FILE (date,holiday CSV - add the next year's NSE list when it is published);
+# years after the last listed holiday count weekdays only
+TRADING_CALENDAR_CONFIG = {
+    'HOLIDAYS_FILE': 'config/nse_holidays.csv',  # Relative to the project root
+    'FIRST_YEAR': 2020,  # Session index range (dates outside fall back to numpy busday_count)
+    'LAST_YEAR': 2035,  # Warns while HOLIDAYS_FILE stops earlier (later years count weekdays only)
+}
+
 # ═══════════════════════════════════════════════════════════════
 # 🖥️ DASHBOARD
 # ═══════════════════════════════════════════════════════════════
@@ -548,6 +597,7 @@ SCAN_INTERVAL_MINUTES = 10  # Scan every 10 minutes during market hours (safer f
 POSITION_MONITOR_INTERVAL = 5  # Monitor positions every 5 minutes (legacy - use strategy-specific below)
 SWING_MONITOR_INTERVAL = 2  # Swing/Intraday: Monitor positions every 2 minutes (fast exits, balanced performance)
 POSITIONAL_MONITOR_INTERVAL = 2  # Positional: Monitor positions every 2 minutes (faster monitoring for better exits)
+EXIT_MONITOR_THREAD_ENABLED = True  # Run the monitors above on a background thread (exit latency independent of scan speed)
 
 # INTRADAY TIME-BASED EXITS (Swing/Intraday only)
 INTRADAY_PROFIT_EXIT_TIME = "15:00"  # 3:00 PM - Exit all profitable positions
@@ -568,6 +618,105 @@ API_RETRY_ATTEMPTS = 3  # Retry failed API calls 3 times
 API_RETRY_DELAY = 2  # Wait 2 seconds between retries
 API_REQUEST_DELAY = 0.1  # 100ms delay between requests (prevents rate limiting)
 
+# Yahoo Finance Rate Limiter (ONE token bucket shared by every yfinance caller in the process)
+# Replaces fixed per-stock sleeps - bursts up to BURST, then refills at REQUESTS_PER_SECOND
+YAHOO_RATE_LIMIT_CONFIG = {
+    'REQUESTS_PER_SECOND': 5.0,  # Steady-state request rate (max - adaptive rate never exceeds this)
+    'BURST': 10,  # Requests allowed back-to-back when the bucket is full
+    'MIN_REQUESTS_PER_SECOND': 0.5,  # Floor after repeated 429s
+    'BACKOFF_FACTOR': 0.5,  # Halve the rate on every 429 / rate limit error
+    'RECOVERY_DELAY_SECONDS': 60,  # Quiet period (no 429s) before the rate starts recovering
+    'RECOVERY_PER_MINUTE': 1.0,  # Requests/second regained per minute once recovering
+}
+
+# Batched Downloads (one Yahoo request per chunk of symbols instead of 2 per stock)
+BATCH_DOWNLOAD_ENABLED = True  # Scanner prefetches daily + 15m data in chunks (2 paced requests per symbol; falls back per-symbol on failure)
+BATCH_DOWNLOAD_CHUNK_SIZE = 50  # Symbols per chunk
+
+# Pipelined Scan (OPT-IN - fetch next symbols on a bounded thread pool while the current one is analysed)
+# Analysis stays one-by-one; all fetches share the rate limiter above, so API load does not increase
+PIPELINED_SCAN_ENABLED = False  # Set True to overlap network waits with indicator computation
+PIPELINE_FETCH_WORKERS = 4  # Max concurrent fetch threads (per-symbol mode; batched mode uses 1)
+PIPELINE_PREFETCH_DEPTH = 8  # Symbols fetched ahead of the analysis loop
+
+# Panel Indicators (batched mode: daily indicators for a whole chunk in ONE vectorized NumPy pass)
+PANEL_INDICATORS_ENABLED = True  # Same values as TechnicalIndicators.calculate_all, without per-stock pandas overhead
+
+# Streaming Indicators (per-stock O(1) state - rescans only apply the new/updated candle)
+STREAMING_INDICATORS_ENABLED = True  # Used when panel indicators aren't available (per-stock fetch mode)
+STREAMING_INDICATORS_VERIFY = False  # Debug: compare every streaming result with a full recompute
+
+# Analysis Pool (OPT-IN - per-stock analysis on worker processes while the scan loop keeps fetching)
+# Workers get compact NumPy arrays (not DataFrames) and results are consumed in scan order,
+# so signals are identical to the serial path for any worker count (scripts/verify_analysis_pool.py)
+ANALYSIS_POOL_CONFIG = {
+    'ENABLED': False,  # Set True on multi-core machines when analysis (not the network) is the bottleneck
+    'WORKERS': 0,  # Worker processes (0 = one per CPU core)
+    'MAX_IN_FLIGHT': 32,  # Symbols submitted ahead of the scan loop
+    'START_METHOD': None,  # multiprocessing start method (None = platform default, e.g. 'spawn' / 'forkserver')
+}
+
+# Analysis Memo (rescans reuse a symbol's previous signals when its bars are unchanged - post-close / weekends)
+# Fingerprint = last bars + market regime + Nifty history + all settings and analysis code
+ANALYSIS_MEMO_CONFIG = {
+    'ENABLED': True,
+    'FINGERPRINT_BARS': 100,  # Bars hashed per timeframe (covers the whole 75-day daily history)
+    'MAX_AGE_DAYS': 7,  # Forget symbols that haven't been scanned for this long
+}
+
+# Analysis Results (each scanned symbol's latest daily indicators, keyed by its last bar - saved in CACHE_FOLDER at scan end)
+# The Discord daily summary's position outlook reads them instead of re-fetching + recomputing per position
+ANALYSIS_RESULT_CACHE_CONFIG = {
+    'ENABLED': True,
+    'MAX_AGE_MINUTES': 60,  # Results for a bar that was still forming (stored before the close) expire after this
+}
+
+# Setup Pre-Filter (necessary swing/positional gates on a batch's latest indicators, before full analysis)
+# Only drops symbols that fail EVERY setup path - the signals found are unchanged
+SETUP_PREFILTER_CONFIG = {
+    'ENABLED': True,
+    'VERIFY': False,  # Debug: still analyse dropped symbols and report any that had a setup
+}
+
+# Scan Checkpoint (crash / restart mid-scan resumes from the last checkpoint instead of symbol 1)
+SCAN_CHECKPOINT_CONFIG = {
+    'ENABLED': True,
+    'PATH': 'data/scan_checkpoint.pkl',
+    'EVERY_SYMBOLS': 25,  # Write cursor + results so far every N symbols
+    'MAX_AGE_MINUTES': SCAN_INTERVAL_MINUTES,  # Same scan window: older checkpoints are discarded
+}
+
+# Scan Scheduler (OPT-IN - scan only part of the universe per cycle, closest-to-qualifying symbols first)
+# Tiers come from the previous scan: HOT = held / watchlist / setup found / near the setup gates (every cycle),
+# WARM = further away, COLD = far away. The request budget caps the API load of every cycle
+SCAN_SCHEDULER_CONFIG = {
+    'ENABLED': False,  # Set True to scan by tier instead of the whole universe every cycle
+    'REQUESTS_PER_CYCLE': 1000,  # Yahoo requests per scan - 2 per symbol (daily + 15m), so 500 stocks (full universe = 2000); 0 = no cap
+    'HOT_DISTANCE': 0.25,  # Setup distance (SetupPreFilter.distance) at or below which a symbol is HOT
+    'WARM_DISTANCE': 1.0,  # ... at or below which it is WARM (above = COLD)
+    'WARM_EVERY_CYCLES': 3,  # WARM symbols are due every N scans
+    'COLD_EVERY_CYCLES': 6,  # COLD symbols are due every N scans (never-scanned symbols are due at once)
+    'WATCHLIST': [],  # Symbols always scanned as HOT (held positions are added automatically)
+    'STATE_FILE': 'data/scan_scheduler.json',
+}
+
+# Quote Service (position monitoring: one call for all held symbols, short-lived cache)
+QUOTE_SERVICE_CONFIG = {
+    'TTL_SECONDS': 30,  # Reuse a quote for this long (exit checks run every 2 minutes)
+    'CANDLE_FALLBACK': True,  # Last 1m / daily close for symbols fast_info has no price for
+}
+
+# Columnar OHLCV Store (DataCache backend - one memory-mapped panel per interval, not one pickle per stock)
+OHLCV_STORE_CONFIG = {
+    'MAX_SEGMENTS_PER_SYMBOL': 16,  # Compact once a stock's bars are split over this many appends
+    'COMPACT_GARBAGE_RATIO': 0.5,  # Compact when more than 50% of rows on disk are dead (trimmed/rewritten) - checked on every index flush
+    'INDEX_FLUSH_SECONDS': 5,  # Write the index at most this often during a scan (always at exit)
+}
+
+# Incremental Daily History (EnhancedDataFetcher keeps 75d daily history in the OHLCV store)
+# Full history is downloaded once per trading day; later scans only fetch today's daily bar
+INCREMENTAL_DAILY_CACHE = True
+
 DATA_FOLDER = 'data'
 CACHE_FOLDER = 'data/cache'
 LOGS_FOLDER = 'logs'
@@ -580,6 +729,42 @@ BACKTEST_START_DATE = '2019-01-01'
 BACKTEST_END_DATE = '2024-12-31'
 BACKTEST_INITIAL_CAPITAL = 100000
 
+# Backtest Engine (src/backtest - replays a stored daily OHLCV panel through the live scanner + PaperTrader, no network)
+# Signals come from SequentialScanner._analyze_stock on each day's history; exits from PaperTrader.check_exits
+# on a simulated clock, fed the day's bar as Open -> Low/High -> High/Low -> Close
+BACKTEST_ENGINE_CONFIG = {
+    'STORE_DIR': 'data/backtest/columnar',  # OHLCVStore with the backtest history (live cache keeps only ~75 days)
+    'LOOKBACK_BARS': 52,  # Daily bars per analysis (= the live scanner's 75 calendar days)
+    'REGIME': 'BULL',  # Market regime passed to the analysis (the scanner's default with detection disabled)
+    'WORKERS': 0,  # Signal-generation processes (0 = one per CPU core, 1 = in-process)
+    'DAYS_PER_TASK': 5,  # Trading days analysed per worker task
+    'INCLUDE_SWING': False,  # Swing is a same-day 1% scalper - daily bars can't replay it meaningfully
+    'SCAN_TIME': '15:25',  # Simulated scan + entry time (entries fill at the day's close)
+}
+
+# Parameter Sweep (scripts/run_sweep.py - grid / random search over settings, walk-forward backtests on a process pool)
+# Parameters are settings names; 'NAME.KEY' sets one key of a dict setting (e.g. SETUP_PREFILTER_CONFIG.ENABLED).
+# Only sweep settings the analysis / PaperTrader actually read - every extra analysis value costs a full signal scan
+# Configurations that differ only in REPLAY_ONLY parameters share one signal scan (only exits / sizing change)
+PARAMETER_SWEEP_CONFIG = {
+    'GRID': {
+        'MIN_SIGNAL_SCORE': [7.3, 7.7, 8.1],
+        'ATR_MULTIPLIER_POSITIONAL': [1.5, 1.8, 2.2],
+        'POSITIONAL_TRAILING_DISTANCE': [0.005, 0.01],
+    },
+    'SEARCH': 'grid',  # 'grid' = every combination, 'random' = RANDOM_SAMPLES combinations
+    'RANDOM_SAMPLES': 50,
+    'SEED': 42,
+    'TRAIN_DAYS': 120,  # Walk-forward: rank configurations on TRAIN_DAYS ...
+    'TEST_DAYS': 40,  # ... then score them on the next TEST_DAYS (windows roll forward by TEST_DAYS)
+    'RANK_BY': 'sharpe',  # Backtest summary metric used to rank (higher = better)
+    'WORKERS': 0,  # Sweep processes (0 = one per CPU core, 1 = in-process)
+    'REPLAY_ONLY': ['POSITIONAL_TRAILING_ACTIVATION', 'POSITIONAL_TRAILING_DISTANCE', 'POSITIONAL_MIN_PROFIT_LOCK',
+                    'TRAILING_STOP_DISTANCE', 'MAX_POSITIONS'],  # Not used by the analysis (PaperTrader only)
+    'PANEL_DIR': 'data/backtest/sweep_panel',  # Shared read-only memory-mapped panel for the workers
+    'RESULTS_FILE': 'data/backtest/sweep_results.csv',
+}
+
 # Performance Metrics Targets
 TARGET_SHARPE_RATIO = 2.0
 TARGET_MAX_DRAWDOWN = 0.15  # 15%
@@ -12,6 +12,9 @@ from datetime import datetime
 import time
 from src.data.enhanced_data_fetcher import EnhancedDataFetcher
 from src.utils.trading_calendar import calculate_trading_days
+from src.paper_trading.trade_journal import replay
+from src.data.trade_store import TradeStore
+from config.settings import TRADE_STORE_CONFIG
 
 # Page config
 st.set_page_config(
@@ -61,51 +64,40 @@ def get_current_prices(symbols):
         return {}
 
 
+@st.cache_resource
+def get_trade_store_cache():
+    """SQLite trade store + per-portfolio trade lists (extended incrementally on refresh)"""
+    store = TradeStore() if TRADE_STORE_CONFIG['ENABLED'] else None
+    return {'store': store, 'trades': {}, 'last_id': {}}
+
+
+def load_portfolio(name: str):
+    """
+    Load one portfolio and its trades
+
+    Trade store: portfolio row + only the trades added since the last refresh.
+    Fallback (not in the store yet): JSON snapshot + trade journal replay.
+    """
+    cache = get_trade_store_cache()
+    store = cache['store']
+
+    data = store.load_portfolio(name) if store is not None else None
+    if data is None:
+        data, trades, _ = replay(f'data/{name}_portfolio.json', f'data/{name}_trades.json')
+        return data or {}, trades
+
+    new_trades, cache['last_id'][name] = store.get_new_trades(name, cache['last_id'].get(name, 0))
+    cache['trades'].setdefault(name, []).extend(new_trades)
+    return data, list(cache['trades'][name])
+
+
 @st.cache_data(ttl=2)  # Cache for 2 seconds - ensures fresh data while reducing file reads
 def load_portfolio_data():
-    """Load portfolio data from JSON files"""
+    """Load portfolio data (trade store queries, JSON fallback)"""
     try:
-        # Load swing portfolio
-        swing_data = {}
-        swing_file = 'data/swing_portfolio.json'
-        if os.path.exists(swing_file):
-            with open(swing_file, 'r') as f:
-                swing_data = json.load(f)
-
-        # Load positional portfolio
-        positional_data = {}
-        positional_file = 'data/positional_portfolio.json'
-        if os.path.exists(positional_file):
-            with open(positional_file, 'r') as f:
-                positional_data = json.load(f)
-
-        # Load swing trades
-        swing_trades = []
-        swing_trades_file = 'data/swing_trades.json'
-        if os.path.exists(swing_trades_file):
-            with open(swing_trades_file, 'r') as f:
-                swing_trades = json.load(f)
-
-        # Load positional trades
-        positional_trades = []
-        positional_trades_file = 'data/positional_trades.json'
-        if os.path.exists(positional_trades_file):
-            with open(positional_trades_file, 'r') as f:
-                positional_trades = json.load(f)
-
-        # Load ETF portfolio
-        etf_data = {}
-        etf_file = 'data/etf_portfolio.json'
-        if os.path.exists(etf_file):
-            with open(etf_file, 'r') as f:
-                etf_data = json.load(f)
-
-        # Load ETF trades
-        etf_trades = []
-        etf_trades_file = 'data/etf_trades.json'
-        if os.path.exists(etf_trades_file):
-            with open(etf_trades_file, 'r') as f:
-                etf_trades = json.load(f)
+        swing_data, swing_trades = load_portfolio('swing')
+        positional_data, positional_trades = load_portfolio('positional')
+        etf_data, etf_trades = load_portfolio('etf')
 
         return {
             'swing': swing_data,
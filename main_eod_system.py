@@ -17,8 +17,9 @@ import pytz
 # Local imports
 from config.settings import *
 from src.data.sequential_scanner import SequentialScanner
+from src.data.scan_scheduler import ScanScheduler
 from src.paper_trading.dual_portfolio import DualPortfolio
-from src.alerts.discord_alerts import DiscordAlerts
+from src.paper_trading.exit_monitor import ExitMonitor
 from src.utils.signal_validator import SignalValidator
 
 IST = pytz.timezone('Asia/Kolkata')
@@ -68,8 +69,8 @@ class EODIntradaySystem:
         # Dual portfolio (uses settings values: INITIAL_CAPITAL=50K, SWING_CAPITAL=25K)
         self.dual_portfolio = DualPortfolio()
 
-        # Discord alerts
-        self.discord = DiscordAlerts()
+        # Discord alerts (created on first alert - not needed to start the system)
+        self._discord = None
 
         # Signal validator
         self.signal_validator = SignalValidator()
@@ -77,20 +78,38 @@ class EODIntradaySystem:
         # Stock list (will be loaded from config)
         self.stocks = self._load_stock_list()
 
+        # Scan scheduler (opt-in) - scans part of the universe per cycle, closest-to-qualifying first
+        self.scan_scheduler = ScanScheduler() if SCAN_SCHEDULER_CONFIG['ENABLED'] else None
+
         self.is_running = False
         self.eod_done_today = False  # Track if EOD ranking done today
         self.last_swing_monitor_time = None  # Track last swing monitoring time
         self.last_positional_monitor_time = None  # Track last positional monitoring time
 
+        # Background exit monitor (continuous mode) - checks exits while the scanner runs
+        self.exit_monitor = None
+        if EXIT_MONITOR_THREAD_ENABLED:
+            self.exit_monitor = ExitMonitor(gate=is_market_hours)
+            self.exit_monitor.add_job('swing', SWING_MONITOR_INTERVAL * 60, self.monitor_swing_positions_only)
+            self.exit_monitor.add_job('positional', POSITIONAL_MONITOR_INTERVAL * 60, self.monitor_positional_positions_only)
+
         print(f"✅ System Initialized!")
         print(f"📊 Stock Universe: {len(self.stocks)} stocks")
         print(f"🐌 Sequential Scanning: ONE BY ONE (safe, no threads)")
         print(f"⏱️ API Delay: 0.1s between stocks (FAST - monitor for rate limits)")
         print(f"⏰ Scan Interval: Every {SCAN_INTERVAL_MINUTES} minutes")
         print(f"💼 Dual Portfolio: Positional (70%) + Swing (30%)")
-        print(f"📱 Discord: {'Enabled' if self.discord.enabled else 'Disabled'}")
+        print(f"📱 Discord: {'Enabled' if DISCORD_ENABLED else 'Disabled'}")
         print("=" * 70)
 
+    @property
+    def discord(self):
+        """DiscordAlerts (imported and created on first use)"""
+        if self._discord is None:
+            from src.alerts.discord_alerts import DiscordAlerts
+            self._discord = DiscordAlerts()
+        return self._discord
+
     def _load_stock_list(self) -> List[str]:
         """
         Load stock list from config
@@ -175,7 +194,16 @@ class EODIntradaySystem:
         print("=" * 70)
         print(f"⏰ Time: {self._get_ist_time()}")
         print(f"📊 Stocks: {len(self.stocks)}")
-        print(f"👁️ Position monitoring: Every 2 minutes during scan")
+
+        # Scan scheduler: this cycle's HOT symbols + due WARM/COLD ones, within the request budget
+        stocks = self.stocks
+        if self.scan_scheduler is not None:
+            stocks = self.scan_scheduler.select(self.stocks, priority=self._held_symbols())
+            self.scan_scheduler.print_selection()
+
+        exit_thread_running = self.exit_monitor is not None and self.exit_monitor.is_running
+        print(f"👁️ Position monitoring: Every 2 minutes during scan"
+              f"{' (background exit monitor)' if exit_thread_running else ''}")
         print()
 
         # Track monitoring times for during-scan monitoring
@@ -184,10 +212,10 @@ class EODIntradaySystem:
         scan_start_time = datetime.now()
         
         # Run sequential scan with periodic position monitoring
-        # Monitor positions every 2 minutes during the scan
+        # Monitor positions every 2 minutes during the scan (background exit monitor does this on its own thread)
         result = self.scanner.scan_all_stocks(
-            self.stocks,
-            monitor_callback=self._monitor_positions_during_scan,
+            stocks,
+            monitor_callback=None if exit_thread_running else self._monitor_positions_during_scan,
             monitor_callback_data={
                 'last_swing_check': last_swing_check,
                 'last_positional_check': last_positional_check,
@@ -199,8 +227,27 @@ class EODIntradaySystem:
         self.last_swing_monitor_time = datetime.now()
         self.last_positional_monitor_time = datetime.now()
 
+        if exit_thread_running:
+            self.exit_monitor.print_stats()
+
+        if self.scan_scheduler is not None:
+            self.scan_scheduler.record(result.get('symbol_status', {}))
+
+        # Keep scan + emitted signals queryable (SQLite trade store)
+        if TRADE_STORE_CONFIG['ENABLED']:
+            try:
+                from src.data.trade_store import get_trade_store
+                get_trade_store().record_scan(result, started_at=scan_start_time)
+            except Exception as e:
+                print(f"⚠️ Could not record scan in trade store: {e}")
+
         return result
     
+    def _held_symbols(self) -> List[str]:
+        """Symbols with an open swing or positional position (always scanned by the scheduler)"""
+        positions = self.dual_portfolio.get_all_open_positions()
+        return list(positions['swing']) + list(positions['positional'])
+
     def _monitor_positions_during_scan(self, callback_data: Dict):
         """
         Callback function to monitor positions during scan
@@ -240,41 +287,8 @@ class EODIntradaySystem:
             print("\n⚠️ No signals found")
             return
 
-        # Filter by minimum score (FIX: Use correct threshold for swing and mean reversion)
-        swing_signals = [s for s in swing_signals if s.get('score', 0) >= MIN_SWING_SIGNAL_SCORE]
-        # Use strategy-specific thresholds: MR needs 7.5, others need 7.7
-        from config.settings import MIN_SIGNAL_SCORE_MEAN_REVERSION
-        filtered_positional = []
-        for s in positional_signals:
-            score = s.get('score', 0)
-            signal_type = s.get('signal_type', 'MOMENTUM')
-            min_threshold = MIN_SIGNAL_SCORE_MEAN_REVERSION if signal_type == 'MEAN_REVERSION' else MIN_SIGNAL_SCORE
-            if score >= min_threshold:
-                filtered_positional.append(s)
-        positional_signals = filtered_positional
-
-        # Sort by score (primary) and quality score (secondary tiebreaker) - take top N
-        def get_sort_key(signal):
-            """Sort by signal score first, then quality score as tiebreaker"""
-            score = signal.get('score', 0)
-            signal_type = signal.get('signal_type', 'MOMENTUM')
-            
-            # Get quality score based on signal type
-            if signal_type == 'MEAN_REVERSION':
-                quality = signal.get('mean_reversion_score', 0)
-            elif signal_type == 'MOMENTUM':
-                quality = signal.get('momentum_score', 0)
-            elif signal_type == 'BREAKOUT':
-                quality = signal.get('breakout_score', 0)
-            else:
-                quality = 0
-            
-            # Return tuple: (signal_score, quality_score) for sorting
-            # This ensures signals with same score are sorted by quality
-            return (score, quality)
-        
-        swing_signals = sorted(swing_signals, key=get_sort_key, reverse=True)[:MAX_SWING_SIGNALS_PER_SCAN]
-        positional_signals = sorted(positional_signals, key=get_sort_key, reverse=True)[:MAX_POSITIONAL_SIGNALS_PER_SCAN]
+        # Minimum score per strategy, best (score, quality) first, top N per scan
+        swing_signals, positional_signals = DualPortfolio.select_signals(swing_signals, positional_signals)
 
         print(f"\n📊 Qualified Signals:")
         print(f"   🔥 Swing: {len(swing_signals)}")
@@ -450,15 +464,9 @@ class EODIntradaySystem:
 
         print(f"\n👁️ Monitoring Swing Positions ({len(swing_positions)} positions):")
 
-        # Get current prices
-        from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-        fetcher = EnhancedDataFetcher(api_delay=0.2)
-
-        current_prices = {}
-        for symbol in swing_positions.keys():
-            price = fetcher.get_current_price(symbol)
-            if price > 0:
-                current_prices[symbol] = price
+        # Get current prices (one QuoteService call for all positions)
+        from src.data.quote_service import get_quote_service
+        current_prices = get_quote_service().get_prices(list(swing_positions.keys()))
 
         # Check for exits and trailing stop activations
         exits, trailing_activations = self.dual_portfolio.monitor_swing_positions(current_prices)
@@ -495,15 +503,9 @@ class EODIntradaySystem:
 
         print(f"\n👁️ Monitoring Positional Positions ({len(positional_positions)} positions):")
 
-        # Get current prices
-        from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-        fetcher = EnhancedDataFetcher(api_delay=0.2)
-
-        current_prices = {}
-        for symbol in positional_positions.keys():
-            price = fetcher.get_current_price(symbol)
-            if price > 0:
-                current_prices[symbol] = price
+        # Get current prices (one QuoteService call for all positions)
+        from src.data.quote_service import get_quote_service
+        current_prices = get_quote_service().get_prices(list(positional_positions.keys()))
 
         # Check for exits and trailing stop activations
         exits, trailing_activations = self.dual_portfolio.monitor_positional_positions(current_prices)
@@ -553,6 +555,9 @@ class EODIntradaySystem:
         print("\nPress Ctrl+C to stop\n")
 
         self.is_running = True
+        if self.exit_monitor is not None:
+            self.exit_monitor.start()
+            print(f"👁️ Exit monitor thread started (exits checked independently of scans)")
         last_scan_time = None
         last_swing_monitor_time = None
         last_positional_monitor_time = None
@@ -602,16 +607,18 @@ class EODIntradaySystem:
                     # CRITICAL FIX: Monitor swing and positional positions separately with different intervals
                     # Swing: 2 minutes (high-frequency, small margins need quick exits)
                     # Positional: 2 minutes (faster monitoring for better exits)
+                    # (Skipped when the background exit monitor is running - it owns the cadence)
                     current_time_sec = datetime.now()
+                    exit_thread_running = self.exit_monitor is not None and self.exit_monitor.is_running
                     
                     # Monitor swing positions (every 2 minutes)
-                    if (last_swing_monitor_time is None or
+                    if not exit_thread_running and (last_swing_monitor_time is None or
                             (current_time_sec - last_swing_monitor_time).seconds >= SWING_MONITOR_INTERVAL * 60):
                         self.monitor_swing_positions_only()
                         last_swing_monitor_time = current_time_sec
                     
                     # Monitor positional positions (every 2 minutes)
-                    if (last_positional_monitor_time is None or
+                    if not exit_thread_running and (last_positional_monitor_time is None or
                             (current_time_sec - last_positional_monitor_time).seconds >= POSITIONAL_MONITOR_INTERVAL * 60):
                         self.monitor_positional_positions_only()
                         last_positional_monitor_time = current_time_sec
@@ -647,6 +654,12 @@ class EODIntradaySystem:
             print("\n\n⏹️ Stopping system...")
             self.is_running = False
 
+        finally:
+            if self.exit_monitor is not None:
+                self.exit_monitor.stop()
+            if self._discord is not None:
+                self._discord.close()
+
     def send_daily_summary(self):
         """Send end-of-day summary to Discord with position analysis"""
         print("\n📊 Generating daily summary with position analysis...")
@@ -660,21 +673,12 @@ class EODIntradaySystem:
             swing_positions = all_positions.get('swing', {})
             positional_positions = all_positions.get('positional', {})
             
-            # Fetch current prices for all positions
-            from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-            fetcher = EnhancedDataFetcher(api_delay=0.1)
+            # Fetch current prices for all positions (one QuoteService call)
+            from src.data.quote_service import get_quote_service
+            prices = get_quote_service().get_prices(list(swing_positions.keys()) + list(positional_positions.keys()))
             
-            swing_prices = {}
-            for symbol in swing_positions.keys():
-                price = fetcher.get_current_price(symbol)
-                if price > 0:
-                    swing_prices[symbol] = price
-            
-            positional_prices = {}
-            for symbol in positional_positions.keys():
-                price = fetcher.get_current_price(symbol)
-                if price > 0:
-                    positional_prices[symbol] = price
+            swing_prices = {symbol: prices[symbol] for symbol in swing_positions.keys() if symbol in prices}
+            positional_prices = {symbol: prices[symbol] for symbol in positional_positions.keys() if symbol in prices}
             
             # Prepare positions data for analysis
             positions_data = {
@@ -722,9 +726,17 @@ def main():
                         help='Show portfolio summary')
     parser.add_argument('--daily-summary', action='store_true',
                         help='Send daily summary with position analysis to Discord (can run anytime)')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Report import + initialization times of a cold start, then exit')
 
     args = parser.parse_args()
 
+    # Cold start profile (measured in a fresh interpreter - this one has already imported everything)
+    if args.profile_startup:
+        from src.utils.startup_profiler import profile_startup
+        profile_startup()
+        return
+
     # Show summary
     if args.summary:
         dual_portfolio = DualPortfolio()
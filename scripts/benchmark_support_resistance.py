@@ -0,0 +1,91 @@
+"""
+⏱️ SUPPORT/RESISTANCE MICRO-BENCHMARK
+Times MathematicalIndicators._find_support_resistance over a whole universe
+against the original per-bar pandas loop, and checks both give the same levels.
+
+Uses synthetic random-walk candles (no network):
+    python scripts/benchmark_support_resistance.py [num_stocks]
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.indicators.mathematical_indicators import MathematicalIndicators
+
+
+def loop_support_resistance(df: pd.DataFrame) -> dict:
+    """Original implementation (per-bar pandas slicing) - reference for timing/equality"""
+    recent_data = df.tail(100)
+
+    resistance_levels = []
+    support_levels = []
+
+    for i in range(5, len(recent_data) - 5):
+        if (recent_data['High'].iloc[i] >= recent_data['High'].iloc[i-5:i].max() and
+            recent_data['High'].iloc[i] >= recent_data['High'].iloc[i+1:i+6].max()):
+            resistance_levels.append(recent_data['High'].iloc[i])
+
+    for i in range(5, len(recent_data) - 5):
+        if (recent_data['Low'].iloc[i] <= recent_data['Low'].iloc[i-5:i].min() and
+            recent_data['Low'].iloc[i] <= recent_data['Low'].iloc[i+1:i+6].min()):
+            support_levels.append(recent_data['Low'].iloc[i])
+
+    return {
+        'resistance': sorted(list(set([round(r, 2) for r in resistance_levels])), reverse=True)[:5],
+        'support': sorted(list(set([round(s, 2) for s in support_levels])))[:5]
+    }
+
+
+def make_universe(num_stocks: int, bars: int = 250, seed: int = 42) -> list:
+    """Random-walk OHLCV frames"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=bars)
+    frames = []
+
+    for _ in range(num_stocks):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, bars)))
+        spread = close * rng.uniform(0.002, 0.02, bars)
+        frames.append(pd.DataFrame({
+            'Open': close + rng.normal(0, 0.3, bars),
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': rng.integers(100_000, 5_000_000, bars).astype(float)
+        }, index=index))
+
+    return frames
+
+
+def main():
+    num_stocks = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    frames = make_universe(num_stocks)
+    math_indicators = MathematicalIndicators()
+
+    start = time.perf_counter()
+    loop_results = [loop_support_resistance(df) for df in frames]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector_results = [math_indicators._find_support_resistance(df) for df in frames]
+    vector_seconds = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for old, new in zip(loop_results, vector_results)
+        if old['resistance'] != new['resistance'] or old['support'] != new['support']
+    )
+
+    print(f"\n⏱️ Support/Resistance over {num_stocks} stocks")
+    print(f"   Per-bar loop:  {loop_seconds:.3f}s ({loop_seconds / num_stocks * 1000:.2f} ms/stock)")
+    print(f"   Vectorized:    {vector_seconds:.3f}s ({vector_seconds / num_stocks * 1000:.2f} ms/stock)")
+    print(f"   Speedup:       {loop_seconds / max(vector_seconds, 1e-9):.1f}x")
+    print(f"   Mismatches:    {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+🧪 RUN BACKTEST
+Replays stored daily history through the live scanner + PaperTrader (src/backtest).
+
+History comes from the backtest OHLCV store (BACKTEST_ENGINE_CONFIG['STORE_DIR'],
+fill it once with --download) or from synthetic random-walk candles:
+
+    python scripts/run_backtest.py --download --period 2y      # one-time, needs network
+    python scripts/run_backtest.py --start 2025-01-01 --end 2025-12-31
+    python scripts/run_backtest.py --synthetic 200 --days 250   # no data needed
+"""
+
+import sys
+import os
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import BACKTEST_ENGINE_CONFIG, NIFTY_SYMBOL
+from src.backtest.backtester import Backtester, load_panel
+
+
+def synthetic_panel(num_stocks: int, num_days: int, seed: int = 7) -> dict:
+    """Random-walk daily OHLCV frames (plus lookback history before the first backtest day)"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=num_days + BACKTEST_ENGINE_CONFIG['LOOKBACK_BARS'])
+
+    panel = {}
+    for n in range(num_stocks):
+        bars = len(index)
+        close = 100 * np.exp(np.cumsum(rng.normal(rng.uniform(-0.001, 0.003), 0.018, bars)))
+        open_ = close * (1 + rng.normal(0, 0.006, bars))
+        spread = close * rng.uniform(0.003, 0.02, bars)
+        panel[f"SYN{n:04d}.NS"] = pd.DataFrame({
+            'Open': open_,
+            'High': np.maximum(open_, close) + spread,
+            'Low': np.minimum(open_, close) - spread,
+            'Close': close,
+            'Volume': rng.integers(100_000, 5_000_000, bars).astype(float)
+        }, index=index)
+    return panel
+
+
+def download(symbols: list, period: str):
+    """Fill the backtest store from Yahoo Finance (chunked batch downloads)"""
+    import yfinance as yf
+    from src.data.ohlcv_store import get_ohlcv_store
+    from src.data.rate_limiter import get_rate_limiter
+
+    store = get_ohlcv_store(BACKTEST_ENGINE_CONFIG['STORE_DIR'])
+    symbols = list(symbols) + [NIFTY_SYMBOL]
+    for i in range(0, len(symbols), 50):
+        chunk = symbols[i:i + 50]
+        get_rate_limiter().acquire(len(chunk))  # yf.download() makes one request per ticker
+        data = yf.download(chunk, period=period, interval='1d', group_by='ticker', progress=False, threads=False)
+        for symbol in chunk:
+            try:
+                df = data[symbol].dropna(how='all') if len(chunk) > 1 else data.dropna(how='all')
+                if not df.empty:
+                    store.upsert(symbol, '1d', df)
+            except KeyError:
+                pass
+        print(f"   📥 {min(i + 50, len(symbols))}/{len(symbols)} symbols")
+    store.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest the live scanner + paper trader on stored history')
+    parser.add_argument('--start', help='First trading day (YYYY-MM-DD)')
+    parser.add_argument('--end', help='Last trading day (YYYY-MM-DD)')
+    parser.add_argument('--workers', type=int, help='Signal-generation processes (default: settings)')
+    parser.add_argument('--synthetic', type=int, metavar='N', help='Use N synthetic random-walk stocks')
+    parser.add_argument('--days', type=int, default=250, help='Synthetic trading days (default: 250)')
+    parser.add_argument('--download', action='store_true', help='Fill the backtest store from Yahoo Finance first')
+    parser.add_argument('--period', default='2y', help='History to download (default: 2y)')
+    parser.add_argument('--verbose', action='store_true', help='Show PaperTrader output')
+    args = parser.parse_args()
+
+    if args.download:
+        from config.nse_top_1000_live import NSE_TOP_1000
+        download(NSE_TOP_1000, args.period)
+
+    if args.synthetic:
+        panel, benchmark = synthetic_panel(args.synthetic, args.days), None
+    else:
+        panel, benchmark = load_panel()
+        if not panel:
+            print(f"❌ No history in {BACKTEST_ENGINE_CONFIG['STORE_DIR']} - run with --download first")
+            return
+
+    config = dict(BACKTEST_ENGINE_CONFIG)
+    if args.workers:
+        config['WORKERS'] = args.workers
+
+    result = Backtester(panel, benchmark, config).run(args.start, args.end, verbose=args.verbose)
+
+    stats = result['stats']
+    print(f"\n📊 Funnel: {stats['scanned']} scanned → {stats['analyzed']} analyzed "
+          f"({stats['prefiltered_out']} pre-filtered) → {stats['setups']} setups → "
+          f"{stats['positional_signals']} positional / {stats['swing_signals']} swing signals")
+    print(f"\n{'='*70}")
+    for key, value in result['summary'].items():
+        print(f"   {key:18s} {value}")
+    print(f"   {'open_positions':18s} {len(result['open_positions'])}")
+    print(f"{'='*70}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+🔬 RUN PARAMETER SWEEP
+Grid / random search over settings thresholds with walk-forward backtests (src/backtest/sweep).
+
+The grid, search mode and walk-forward window sizes come from PARAMETER_SWEEP_CONFIG;
+history from the backtest store (fill it with scripts/run_backtest.py --download)
+or from synthetic random-walk candles:
+
+    python scripts/run_sweep.py
+    python scripts/run_sweep.py --search random --samples 200 --workers 8
+    python scripts/run_sweep.py --synthetic 50 --days 200 --train-days 60 --test-days 20
+"""
+
+import sys
+import os
+import argparse
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import BACKTEST_ENGINE_CONFIG, PARAMETER_SWEEP_CONFIG
+from src.backtest.backtester import load_panel
+from src.backtest.sweep import ParameterSweep
+from scripts.run_backtest import synthetic_panel
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Walk-forward parameter sweep over settings thresholds')
+    parser.add_argument('--start', help='First trading day (YYYY-MM-DD)')
+    parser.add_argument('--end', help='Last trading day (YYYY-MM-DD)')
+    parser.add_argument('--search', choices=['grid', 'random'], help='Search mode (default: settings)')
+    parser.add_argument('--samples', type=int, help='Random search size (default: settings)')
+    parser.add_argument('--train-days', type=int, help='Walk-forward train window (default: settings)')
+    parser.add_argument('--test-days', type=int, help='Walk-forward test window (default: settings)')
+    parser.add_argument('--workers', type=int, help='Sweep processes (default: settings)')
+    parser.add_argument('--synthetic', type=int, metavar='N', help='Use N synthetic random-walk stocks')
+    parser.add_argument('--days', type=int, default=250, help='Synthetic trading days (default: 250)')
+    parser.add_argument('--top', type=int, default=20, help='Configurations to print (default: 20)')
+    parser.add_argument('--output', default=PARAMETER_SWEEP_CONFIG['RESULTS_FILE'], help='Ranked results CSV')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        panel, benchmark = synthetic_panel(args.synthetic, args.days), None
+    else:
+        panel, benchmark = load_panel()
+        if not panel:
+            print(f"❌ No history in {BACKTEST_ENGINE_CONFIG['STORE_DIR']} - run scripts/run_backtest.py --download first")
+            return
+
+    config = dict(PARAMETER_SWEEP_CONFIG)
+    for key, value in (('SEARCH', args.search), ('RANDOM_SAMPLES', args.samples), ('TRAIN_DAYS', args.train_days),
+                       ('TEST_DAYS', args.test_days), ('WORKERS', args.workers)):
+        if value:
+            config[key] = value
+
+    result = ParameterSweep(panel, benchmark, config).run(args.start, args.end)
+    results = result['results']
+    if results.empty:
+        print("❌ No trading days in range")
+        return
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    results.to_csv(args.output)
+
+    with pd.option_context('display.max_columns', None, 'display.width', 200):
+        print(f"\n{'='*70}\n🏆 TOP {args.top} (ranked by test {config['RANK_BY']})\n{'='*70}")
+        print(results.head(args.top).to_string())
+        print(f"\n{'='*70}\n🚶 WALK-FORWARD (best on train → unseen test)\n{'='*70}")
+        print(result['walk_forward'].to_string(index=False))
+    print(f"\n💾 Results: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+⚙️ ANALYSIS POOL A/B CHECK
+Runs SequentialScanner._analyze_stock over a synthetic universe serially and
+through AnalysisPool with several worker counts, and checks every run gives
+the same signals (and console output) in the same order.
+
+Uses synthetic random-walk candles (no network):
+    python scripts/verify_analysis_pool.py [num_stocks] [worker counts...]
+"""
+
+import sys
+import os
+import io
+import json
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import ANALYSIS_POOL_CONFIG, NIFTY_SYMBOL
+from src.data.analysis_pool import AnalysisPool
+from src.data.benchmark_series import get_benchmark_series
+from src.data.sequential_scanner import SequentialScanner
+from src.indicators.panel_indicators import PanelIndicators
+
+REGIME = 'BULL'
+
+
+def random_walk(rng, index: pd.DatetimeIndex, drift: float, volatility: float) -> pd.DataFrame:
+    """OHLCV frame following a random walk"""
+    bars = len(index)
+    close = 100 * np.exp(np.cumsum(rng.normal(drift, volatility, bars)))
+    spread = close * rng.uniform(0.002, 0.02, bars)
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.3, bars),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(100_000, 5_000_000, bars)
+    }, index=index)
+
+
+def make_universe(num_stocks: int, seed: int = 7) -> dict:
+    """Daily (75 bars) + 15-minute (5 days) frames per synthetic symbol, indexed like yfinance"""
+    rng = np.random.default_rng(seed)
+    daily_index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=75, tz='Asia/Kolkata')
+    intraday_index = pd.DatetimeIndex([
+        day + pd.Timedelta(hours=9, minutes=15) + pd.Timedelta(minutes=15 * i)
+        for day in daily_index[-5:] for i in range(25)
+    ])
+
+    universe = {}
+    for n in range(num_stocks):
+        drift = rng.uniform(-0.002, 0.004)
+        universe[f"SYN{n:04d}.NS"] = {
+            'daily': random_walk(rng, daily_index, drift, 0.018),
+            'intraday': random_walk(rng, intraday_index, drift / 25, 0.004)
+        }
+
+    # Benchmark for relative strength (seeded - no download)
+    get_benchmark_series().seed(NIFTY_SYMBOL, random_walk(rng, pd.bdate_range(end=daily_index[-1], periods=250, tz='Asia/Kolkata'), 0.0005, 0.01))
+    return universe
+
+
+def canonical(signals: dict) -> str:
+    """Comparable form of _analyze_stock output ('timestamp' is wall-clock time of creation)"""
+    return json.dumps({
+        strategy: None if signal is None else {key: value for key, value in signal.items() if key != 'timestamp'}
+        for strategy, signal in signals.items()
+    }, sort_keys=True, default=str)
+
+
+def run_serial(universe: dict, indicators: dict) -> list:
+    scanner = SequentialScanner.analysis_only(REGIME)
+    results = []
+    for symbol, data in universe.items():
+        output = io.StringIO()
+        with redirect_stdout(output):
+            signals = scanner._analyze_stock(symbol, data['daily'], data['intraday'], indicators.get(symbol))
+        results.append((canonical(signals), output.getvalue()))
+    return results
+
+
+def run_pool(universe: dict, indicators: dict, workers: int) -> list:
+    pool = AnalysisPool({**ANALYSIS_POOL_CONFIG, 'WORKERS': workers})
+    pool.start(REGIME)
+    try:
+        futures = [pool.submit(symbol, data['daily'], data['intraday'], indicators.get(symbol))
+                   for symbol, data in universe.items()]
+        return [(canonical(signals), output) for signals, output in (future.result() for future in futures)]
+    finally:
+        pool.close()
+
+
+def main():
+    num_stocks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or [1, 2, 4]
+
+    universe = make_universe(num_stocks)
+    indicators = PanelIndicators().calculate_all({symbol: data['daily'] for symbol, data in universe.items()})
+
+    start = time.perf_counter()
+    serial = run_serial(universe, indicators)
+    serial_seconds = time.perf_counter() - start
+
+    found = sum(1 for signals, _ in serial for strategy in ('swing', 'positional')
+                if json.loads(signals)[strategy] is not None)
+    print(f"\n⚙️ Analysis pool A/B check over {num_stocks} stocks ({found} signals)")
+    print(f"   Serial:       {serial_seconds:.2f}s")
+
+    all_identical = True
+    for workers in worker_counts:
+        start = time.perf_counter()
+        pooled = run_pool(universe, indicators, workers)
+        pool_seconds = time.perf_counter() - start
+
+        mismatches = sum(1 for a, b in zip(serial, pooled) if a != b) + abs(len(serial) - len(pooled))
+        all_identical = all_identical and mismatches == 0
+        print(f"   {workers} workers:    {pool_seconds:.2f}s ({serial_seconds / max(pool_seconds, 1e-9):.1f}x) "
+              f"- mismatches: {mismatches}")
+
+    print(f"   {'✅ Identical to serial path' if all_identical else '❌ Pool output differs from serial path'}")
+    sys.exit(0 if all_identical else 1)
+
+
+if __name__ == "__main__":
+    main()
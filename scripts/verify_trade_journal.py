@@ -0,0 +1,121 @@
+"""
+📒 TRADE JOURNAL CRASH CHECK
+Drives TradeJournal through the crash cases its replay is meant to survive,
+in a temp directory (no network, nothing under data/ is touched):
+
+- Torn last line: a half-written record is skipped, the rest replays
+- Crash between snapshot and truncate: the old journal replays over the new
+  snapshot without duplicating trades or changing positions
+- Replay is idempotent: replaying the same files twice gives the same state
+- Restart after a torn line: the next append is not glued onto the fragment
+
+    python scripts/verify_trade_journal.py
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.paper_trading.trade_journal import TradeJournal, journal_path, replay
+
+# Never snapshot on its own during the checks - snapshots are forced explicitly
+CONFIG = {'SNAPSHOT_EVERY_RECORDS': 10_000, 'SNAPSHOT_MINUTES': 10_000}
+
+
+def portfolio_state(capital: float, positions: dict) -> dict:
+    return {
+        'capital': capital,
+        'performance': {'total_trades': 0},
+        'start_date': '2026-01-01T09:15:00',
+        'initial_capital': 100_000,
+        'positions': positions
+    }
+
+
+def trade(n: int) -> dict:
+    return {'symbol': f"SYN{n:04d}.NS", 'pnl': 100.0 * n, 'exit_date': f"2026-02-{n + 1:02d}T15:00:00"}
+
+
+def comparable(data: dict, trades: list) -> str:
+    """State replay() is expected to rebuild ('last_updated' / 'mode' are snapshot bookkeeping)"""
+    state = {key: value for key, value in (data or {}).items() if key not in ('last_updated', 'mode')}
+    return json.dumps({'state': state, 'trades': trades}, sort_keys=True)
+
+
+def check(name: str, ok: bool, results: list):
+    results.append(ok)
+    print(f"   {'✅' if ok else '❌'} {name}")
+
+
+def main():
+    directory = tempfile.mkdtemp(prefix='journal_check_')
+    portfolio_file = os.path.join(directory, 'swing_portfolio.json')
+    trades_file = os.path.join(directory, 'swing_trades.json')
+    results = []
+
+    print("\n📒 Trade journal crash check")
+    try:
+        journal = TradeJournal(portfolio_file, trades_file, CONFIG)
+
+        # First commit writes the snapshot (no portfolio file yet), the rest only append
+        trades = []
+        journal.commit(portfolio_state(100_000, {}), trades)
+        positions = {'SYN0001.NS': {'shares': 10, 'entry_price': 101.5}}
+        journal.commit(portfolio_state(98_985, positions), trades)
+        trades = [trade(1)]
+        positions = {'SYN0002.NS': {'shares': 5, 'entry_price': 250.0}}
+        journal.commit(portfolio_state(99_850, positions), trades)
+        expected = comparable(portfolio_state(99_850, positions), trades)
+
+        data, replayed_trades, records = replay(portfolio_file, trades_file)
+        check(f"Snapshot + {records} journal records replay to the last commit",
+              comparable(data, replayed_trades) == expected, results)
+
+        # Torn last line: a crash in the middle of an append
+        with open(journal_path(portfolio_file), 'a') as f:
+            f.write('{"type": "state", "capital": 1, "upsert": {"SYN9')
+        data, replayed_trades, _ = replay(portfolio_file, trades_file)
+        check("Torn last line is skipped", comparable(data, replayed_trades) == expected, results)
+
+        # Crash between snapshot and truncate: keep the journal as it was before the snapshot
+        with open(journal_path(portfolio_file)) as f:
+            old_journal = f.read()
+        journal.snapshot()
+        with open(journal_path(portfolio_file)) as f:
+            truncated = f.read() == ''
+        with open(journal_path(portfolio_file), 'w') as f:
+            f.write(old_journal)
+        data, replayed_trades, records = replay(portfolio_file, trades_file)
+        check("Snapshot truncates the journal", truncated, results)
+        check(f"Old journal ({records} records) over the new snapshot: no duplicate trades",
+              comparable(data, replayed_trades) == expected, results)
+
+        # Idempotent: same files, same state
+        again = replay(portfolio_file, trades_file)
+        check("Replaying twice gives the same state",
+              comparable(again[0], again[1]) == comparable(data, replayed_trades), results)
+
+        # A new journal (next process start) loads the same state and keeps appending from it
+        restarted = TradeJournal(portfolio_file, trades_file, CONFIG)
+        loaded, loaded_trades = restarted.load()
+        check("Restarted journal loads the same state", comparable(loaded, loaded_trades) == expected, results)
+
+        trades = loaded_trades + [trade(2)]
+        restarted.commit(portfolio_state(100_300, {}), trades)
+        data, replayed_trades, _ = replay(portfolio_file, trades_file)
+        check("Commit after restart appends only the new trade",
+              comparable(data, replayed_trades) == comparable(portfolio_state(100_300, {}), trades), results)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    passed = all(results)
+    print(f"   {'✅ All journal checks passed' if passed else '❌ Journal check failed'}")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
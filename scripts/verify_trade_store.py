@@ -0,0 +1,136 @@
+"""
+🗄️ TRADE STORE SYNC CHECK
+Syncs synthetic portfolios into a temp SQLite TradeStore (no network, the
+real data/ database is not touched) and checks the table matches the history:
+
+- Diffed sync: re-syncing the same state writes nothing, closed positions go
+- Reset: an empty / restarted trade history replaces the stored trades
+  (same process and from a fresh TradeStore on the same file)
+- Extended history: a fresh TradeStore only appends the new trades
+- migrate_json: snapshot + journal import equals replay()
+
+    python scripts/verify_trade_store.py
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.trade_store import SCHEMA_VERSION, TradeStore
+from src.paper_trading.trade_journal import TradeJournal, replay
+
+
+def portfolio_state(capital: float, positions: dict) -> dict:
+    return {
+        'capital': capital,
+        'performance': {'total_trades': 0},
+        'start_date': '2026-01-01T09:15:00',
+        'initial_capital': 100_000,
+        'positions': positions
+    }
+
+
+def trade(n: int, run: str = 'a') -> dict:
+    return {'symbol': f"SYN{n:04d}.NS", 'strategy': 'swing', 'pnl': 100.0 * n,
+            'exit_date': f"2026-02-{n + 1:02d}T15:00:00", 'run': run}
+
+
+def stored_trades(store: TradeStore, portfolio: str) -> list:
+    return store.get_trades(portfolio=portfolio)
+
+
+def stored_indexes(store: TradeStore, portfolio: str) -> list:
+    rows = store._conn.execute('SELECT trade_index FROM trades WHERE portfolio = ? ORDER BY id', (portfolio,))
+    return [row['trade_index'] for row in rows]
+
+
+def check(name: str, ok: bool, results: list):
+    results.append(ok)
+    print(f"   {'✅' if ok else '❌'} {name}")
+
+
+def main():
+    directory = tempfile.mkdtemp(prefix='trade_store_check_')
+    db_path = os.path.join(directory, 'trading.db')
+    results = []
+
+    print("\n🗄️ Trade store sync check")
+    try:
+        store = TradeStore(db_path)
+        version = store._conn.execute('PRAGMA user_version').fetchone()[0]
+        check(f"Schema at version {SCHEMA_VERSION}", version == SCHEMA_VERSION, results)
+
+        # Diffed sync
+        positions = {'SYN0001.NS': {'shares': 10, 'strategy': 'swing'},
+                     'SYN0002.NS': {'shares': 5, 'strategy': 'swing'}}
+        history = [trade(1), trade(2), trade(3)]
+        store.sync_portfolio('swing', portfolio_state(99_000, positions), history)
+        changes = store._conn.total_changes
+        store.sync_portfolio('swing', portfolio_state(99_000, positions), history)
+        # Only the portfolios row is rewritten (INSERT OR REPLACE = 1 change)
+        check("Re-syncing the same state only rewrites the portfolio row",
+              store._conn.total_changes - changes == 1, results)
+
+        del positions['SYN0001.NS']
+        store.sync_portfolio('swing', portfolio_state(99_500, positions), history)
+        loaded = store.load_portfolio('swing')
+        check("Closed position removed, capital updated",
+              set(loaded['positions']) == {'SYN0002.NS'} and loaded['capital'] == 99_500, results)
+
+        # Reset in the same process: empty history, then a new run
+        store.sync_portfolio('swing', portfolio_state(100_000, {}), [])
+        check("Reset to an empty history clears the trades", stored_trades(store, 'swing') == [], results)
+
+        history = [trade(1, 'b'), trade(2, 'b')]
+        store.sync_portfolio('swing', portfolio_state(100_200, {}), history)
+        check("New run after the reset is stored from index 0",
+              stored_trades(store, 'swing') == history and stored_indexes(store, 'swing') == [0, 1], results)
+        store.close()
+
+        # Fresh instance, history restarted with the same length but different trades
+        store = TradeStore(db_path)
+        history = [trade(5, 'c'), trade(6, 'c')]
+        store.sync_portfolio('swing', portfolio_state(100_600, {}), history)
+        check("Fresh store replaces a restarted history of the same length",
+              stored_trades(store, 'swing') == history, results)
+        store.close()
+
+        # Fresh instance, history extended: only the new trade is inserted
+        store = TradeStore(db_path)
+        ids_before = [row['id'] for row in store._conn.execute('SELECT id FROM trades ORDER BY id')]
+        history = history + [trade(7, 'c')]
+        store.sync_portfolio('swing', portfolio_state(101_300, {}), history)
+        ids_after = [row['id'] for row in store._conn.execute('SELECT id FROM trades ORDER BY id')]
+        check("Fresh store appends an extended history (existing rows kept)",
+              stored_trades(store, 'swing') == history and ids_after[:len(ids_before)] == ids_before
+              and len(ids_after) == len(ids_before) + 1, results)
+
+        # migrate_json from snapshot + journal
+        portfolio_file = os.path.join(directory, 'positional_portfolio.json')
+        trades_file = os.path.join(directory, 'positional_trades.json')
+        journal = TradeJournal(portfolio_file, trades_file,
+                               {'SNAPSHOT_EVERY_RECORDS': 10_000, 'SNAPSHOT_MINUTES': 10_000})
+        journal.commit(portfolio_state(100_000, {}), [])
+        journal.commit(portfolio_state(98_000, {'SYN0009.NS': {'shares': 4, 'strategy': 'positional'}}),
+                       [trade(8)])
+        data, trades, records = replay(portfolio_file, trades_file)
+
+        store.migrate_json(portfolio_file, trades_file)
+        loaded = store.load_portfolio('positional')
+        check(f"migrate_json (snapshot + {records} journal records) matches replay()",
+              loaded['capital'] == data['capital'] and loaded['positions'] == data['positions']
+              and stored_trades(store, 'positional') == trades, results)
+        store.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    passed = all(results)
+    print(f"   {'✅ All trade store checks passed' if passed else '❌ Trade store check failed'}")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,9 @@ import json
 from datetime import datetime
 from typing import Dict, List
 import pytz
-import yfinance as yf
 
 from config.settings import *
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
 
 IST = pytz.timezone('Asia/Kolkata')
 
@@ -30,11 +30,53 @@ class DiscordAlerts:
         self.webhook_url = webhook_url
         self.enabled = bool(webhook_url)
 
+        # Background sender (queue + pooled session) - send_* never wait on the network
+        self.dispatcher = None
+        if self.enabled and DISCORD_DISPATCH_CONFIG['ASYNC']:
+            from src.alerts.discord_dispatcher import DiscordDispatcher
+            self.dispatcher = DiscordDispatcher(webhook_url)
+
         if not self.enabled:
             print("⚠️ Discord webhook not configured - alerts disabled")
         else:
             print("✅ Discord alerts enabled")
 
+    def _send(self, data: Dict, label: str):
+        """
+        Deliver a webhook message: queued for the background sender, or posted inline if ASYNC is off
+
+        Args:
+            data: Webhook JSON ({'content': ..., 'embeds': [...]})
+            label: What is being sent (for the log)
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.enqueue(data, label)
+            print(f"📨 Discord {label} queued")
+            return
+
+        response = self._post_now(data)
+        if response.status_code == 204:
+            print(f"✅ Discord {label} sent")
+        else:
+            print(f"⚠️ Discord {label} failed: Status {response.status_code}")
+            print(f"Response: {response.text[:200]}")
+
+    def _post_now(self, data: Dict) -> requests.Response:
+        """Blocking post (pooled session when the dispatcher is running)"""
+        if self.dispatcher is not None:
+            return self.dispatcher.send_now(data)
+        return requests.post(
+            self.webhook_url,
+            data=json.dumps(data),
+            headers={"Content-Type": "application/json"},
+            timeout=10
+        )
+
+    def close(self):
+        """Deliver queued alerts (bounded by SHUTDOWN_FLUSH_SECONDS) and stop the sender"""
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+
     def send_buy_signal(self, signal: Dict, paper_trade: bool = False):
         """
         Send BUY signal alert
@@ -357,17 +399,7 @@ class DiscordAlerts:
                 "embeds": [embed]
             }
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-
-            if response.status_code == 204:
-                print(f"✅ Discord BUY alert sent: {symbol}")
-            else:
-                print(f"⚠️ Discord alert failed: {response.status_code}")
+            self._send(data, f"BUY alert: {symbol}")
 
         except Exception as e:
             import traceback
@@ -555,17 +587,7 @@ class DiscordAlerts:
                 "embeds": [embed]
             }
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-
-            if response.status_code == 204:
-                print(f"✅ Discord EXIT alert sent: {symbol}")
-            else:
-                print(f"⚠️ Discord alert failed: {response.status_code}")
+            self._send(data, f"EXIT alert: {symbol}")
 
         except Exception as e:
             print(f"❌ Discord EXIT alert error: {e}")
@@ -659,17 +681,7 @@ class DiscordAlerts:
                 "embeds": [embed]
             }
             
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-            
-            if response.status_code == 204:
-                print(f"✅ Discord trailing stop alert sent: {symbol}")
-            else:
-                print(f"⚠️ Discord trailing stop alert failed: {response.status_code}")
+            self._send(data, f"trailing stop alert: {symbol}")
         
         except Exception as e:
             print(f"❌ Discord trailing stop alert error: {e}")
@@ -723,17 +735,7 @@ class DiscordAlerts:
                 "embeds": [embed]
             }
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-
-            if response.status_code == 204:
-                print("✅ Daily summary sent to Discord")
-            else:
-                print(f"⚠️ Discord summary failed: {response.status_code}")
+            self._send(data, "daily summary")
 
         except Exception as e:
             print(f"❌ Discord summary error: {e}")
@@ -766,12 +768,8 @@ class DiscordAlerts:
                 "embeds": [embed]
             }
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+            # Inline, not queued: the point is to see whether the webhook works
+            response = self._post_now(data)
 
             if response.status_code == 204:
                 print("✅ Test alert sent successfully!")
@@ -812,6 +810,94 @@ class DiscordAlerts:
         signal['trade_type'] = signal.get('trade_type', '📈 POSITIONAL TRADE')
         self.send_buy_signal(signal, paper_trade=True)
 
+    def _position_indicators(self, symbol: str) -> Dict:
+        """
+        Daily indicators for the position outlook
+
+        Reads the scan's result for the latest daily bar (AnalysisResultCache); only on a
+        miss fetches 75-90 days of history (RETRIES with delays) and computes them here.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            TechnicalIndicators.calculate_all dict (50+ trading days of history)
+        """
+        import yfinance as yf
+
+        import time
+
+        from src.data.analysis_results import get_analysis_result_cache
+        from src.utils.trading_calendar import latest_session
+
+        results = get_analysis_result_cache() if ANALYSIS_RESULT_CACHE_CONFIG['ENABLED'] else None
+        if results is not None:
+            cached = results.get(symbol, latest_session(), min_bars=50)
+            if cached is not None:
+                return cached
+
+        from src.data.enhanced_data_fetcher import EnhancedDataFetcher
+        from src.indicators.technical_indicators import TechnicalIndicators
+
+        # Get daily data using SAME method as system (EnhancedDataFetcher - 75d period)
+        max_retries = 3
+        retry_delay = 2  # 2 seconds between retries
+        daily_data = None
+        
+        # Use EnhancedDataFetcher (same as system) - fetches 75d (~52 trading days)
+        fetcher = EnhancedDataFetcher(api_delay=0.2)
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    time.sleep(retry_delay)  # Wait before retry
+                
+                daily_data = fetcher._fetch_daily_data(symbol, max_retries=2, verbose=False)
+                
+                if daily_data is not None and not daily_data.empty and len(daily_data) >= 50:
+                    break  # Success - got enough trading days
+                elif daily_data is not None and len(daily_data) < 50:
+                    # 75d might not be enough, try longer period
+                    ticker = yf.Ticker(symbol)
+                    get_rate_limiter().acquire()
+                    daily_data = ticker.history(period='90d', interval='1d')  # 90d = ~63 trading days
+                    if daily_data is not None and not daily_data.empty and len(daily_data) >= 50:
+                        break
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    get_rate_limiter().report_rate_limit()
+                if attempt == max_retries - 1:
+                    raise ValueError(f"Unable to fetch data for {symbol} after {max_retries} attempts: {str(e)}")
+                time.sleep(retry_delay)
+        
+        # MUST have at least 50 trading days
+        if daily_data is None or daily_data.empty or len(daily_data) < 50:
+            raise ValueError(f"Insufficient trading days for {symbol}: got {len(daily_data) if daily_data is not None else 0} trading days, need 50+")
+        
+        # Calculate technical indicators with RETRIES
+        calc_result = None
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    time.sleep(retry_delay)  # Wait before retry
+                
+                indicators = TechnicalIndicators()
+                calc_result = indicators.calculate_all(daily_data)
+                
+                if calc_result and len(calc_result) > 0:
+                    break  # Success
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    raise ValueError(f"Failed to calculate indicators for {symbol} after {max_retries} attempts: {str(e)}")
+                time.sleep(retry_delay)
+        
+        # MUST have indicators - no fallbacks
+        if not calc_result or len(calc_result) == 0:
+            raise ValueError(f"Indicator calculation returned empty for {symbol}")
+
+        if results is not None:
+            results.put(symbol, daily_data, calc_result)
+        return calc_result
+
     def _analyze_position_outlook(self, symbol: str, position: Dict, current_price: float) -> Dict:
         """
         Analyze position and predict outlook using FULL technical analysis
@@ -827,13 +913,7 @@ class DiscordAlerts:
         Returns:
             Dict with outlook prediction and reasoning
         """
-        import time
-        
         try:
-            from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-            from src.strategies.multitimeframe_analyzer import MultiTimeframeAnalyzer
-            from src.indicators.technical_indicators import TechnicalIndicators
-            
             entry_price = position.get('entry_price', 0)
             # Safety check: ensure entry_price and current_price are valid
             if entry_price <= 0:
@@ -843,57 +923,8 @@ class DiscordAlerts:
             
             profit_pct = ((current_price - entry_price) / entry_price * 100)
             
-            # Get daily data using SAME method as system (EnhancedDataFetcher - 75d period)
-            max_retries = 3
-            retry_delay = 2  # 2 seconds between retries
-            daily_data = None
-            
-            # Use EnhancedDataFetcher (same as system) - fetches 75d (~52 trading days)
-            fetcher = EnhancedDataFetcher(api_delay=0.2)
-            for attempt in range(max_retries):
-                try:
-                    if attempt > 0:
-                        time.sleep(retry_delay)  # Wait before retry
-                    
-                    daily_data = fetcher._fetch_daily_data(symbol, max_retries=2, verbose=False)
-                    
-                    if daily_data is not None and not daily_data.empty and len(daily_data) >= 50:
-                        break  # Success - got enough trading days
-                    elif daily_data is not None and len(daily_data) < 50:
-                        # 75d might not be enough, try longer period
-                        ticker = yf.Ticker(symbol)
-                        daily_data = ticker.history(period='90d', interval='1d')  # 90d = ~63 trading days
-                        if daily_data is not None and not daily_data.empty and len(daily_data) >= 50:
-                            break
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise ValueError(f"Unable to fetch data for {symbol} after {max_retries} attempts: {str(e)}")
-                    time.sleep(retry_delay)
-            
-            # MUST have at least 50 trading days
-            if daily_data is None or daily_data.empty or len(daily_data) < 50:
-                raise ValueError(f"Insufficient trading days for {symbol}: got {len(daily_data) if daily_data is not None else 0} trading days, need 50+")
-            
-            # Calculate technical indicators with RETRIES
-            calc_result = None
-            for attempt in range(max_retries):
-                try:
-                    if attempt > 0:
-                        time.sleep(retry_delay)  # Wait before retry
-                    
-                    indicators = TechnicalIndicators()
-                    calc_result = indicators.calculate_all(daily_data)
-                    
-                    if calc_result and len(calc_result) > 0:
-                        break  # Success
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise ValueError(f"Failed to calculate indicators for {symbol} after {max_retries} attempts: {str(e)}")
-                    time.sleep(retry_delay)
-            
-            # MUST have indicators - no fallbacks
-            if not calc_result or len(calc_result) == 0:
-                raise ValueError(f"Indicator calculation returned empty for {symbol}")
+            # Daily indicators: the scan's result for the latest bar, else fetch + compute
+            calc_result = self._position_indicators(symbol)
             
             # Extract key indicators
             rsi = calc_result.get('rsi', 50)
@@ -1518,18 +1549,7 @@ class DiscordAlerts:
                 "embeds": [embed]
             }
 
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(data),
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
-            
-            if response.status_code == 204:
-                print("✅ Daily summary with position analysis sent to Discord")
-            else:
-                print(f"⚠️ Discord summary failed: Status {response.status_code}")
-                print(f"Response: {response.text[:200]}")
+            self._send(data, "daily summary with position analysis")
 
         except Exception as e:
             print(f"❌ Error sending dual portfolio summary: {e}")
@@ -0,0 +1,427 @@
+"""
+📨 DISCORD DISPATCHER - Queued, batched webhook delivery on a background thread
+
+Before: every DiscordAlerts.send_* did a blocking requests.post inline, so a
+slow webhook stalled signal processing and the position monitor. Now alerts
+are queued and a sender thread delivers them:
+
+- enqueue() only appends to the queue (and its file) - never touches the network
+- One pooled requests.Session for every webhook call
+- Alerts queued close together are coalesced: up to 10 embeds per message
+- Discord's rate-limit headers are honoured (X-RateLimit-Remaining /
+  Reset-After, 429 retry_after); failures retry with exponential backoff
+- The queue is persisted and picked up again by the next run, so alerts not
+  yet delivered survive a restart
+
+Several processes can dispatch at once (the continuous loop plus a
+--daily-summary run): each one writes its own queue file
+(discord_queue.<pid>.json next to QUEUE_FILE) and, under an exclusive lock,
+adopts the files of processes that are no longer running - at start and
+whenever its own queue is idle.
+"""
+
+import atexit
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows - no advisory locks (one dispatching process at a time)
+    fcntl = None
+
+import requests
+
+from config.settings import DISCORD_DISPATCH_CONFIG
+
+# Discord message limits
+MAX_CONTENT_CHARS = 2000
+
+# How often an idle sender looks for queue files left by finished processes
+ORPHAN_SCAN_SECONDS = 60
+
+
+def _pid_alive(pid: int) -> bool:
+    """True if a process with this PID is running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class DiscordDispatcher:
+    """
+    Background sender for Discord webhook messages
+    """
+
+    def __init__(self, webhook_url: str, config: Dict = None):
+        """
+        Initialize dispatcher (loads the persisted queue and starts the sender thread)
+
+        Args:
+            webhook_url: Discord webhook URL
+            config: Dict shaped like DISCORD_DISPATCH_CONFIG (default: settings)
+        """
+        config = config or DISCORD_DISPATCH_CONFIG
+        self.webhook_url = webhook_url
+        self.queue_file = config['QUEUE_FILE']
+        base, ext = os.path.splitext(self.queue_file)
+        self.owner_file = f"{base}.{os.getpid()}{ext}"  # This process's queue
+        self._owner_pattern = f"{base}.*{ext}"
+        self.lock_file = f"{self.queue_file}.lock"
+        self.max_embeds = int(config['MAX_EMBEDS_PER_MESSAGE'])
+        self.max_embed_chars = int(config['MAX_EMBED_CHARS'])
+        self.coalesce_seconds = float(config['COALESCE_WAIT_SECONDS'])
+        self.max_retries = int(config['MAX_RETRIES'])
+        self.backoff_seconds = float(config['BACKOFF_SECONDS'])
+        self.max_backoff_seconds = float(config['MAX_BACKOFF_SECONDS'])
+        self.timeout = float(config['TIMEOUT_SECONDS'])
+        self.shutdown_flush_seconds = float(config['SHUTDOWN_FLUSH_SECONDS'])
+
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+
+        self._pending: List[Dict] = []
+        self._condition = threading.Condition()
+        self._closing = False
+        self._blocked_until = 0.0  # Monotonic time before which Discord asked us not to post
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            'queued': 0,
+            'messages': 0,
+            'alerts_sent': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'dropped': 0
+        }
+
+        self._load()
+        self.start()
+        atexit.register(self.close)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pending(self) -> int:
+        """Alerts not yet delivered"""
+        with self._condition:
+            return len(self._pending)
+
+    def start(self):
+        """Start the sender thread (no-op if already running)"""
+        if self.is_running:
+            return
+
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name='DiscordDispatcher', daemon=True)
+        self._thread.start()
+
+    def enqueue(self, payload: Dict, label: str = '') -> None:
+        """
+        Queue a webhook message (returns immediately)
+
+        Args:
+            payload: Webhook JSON ({'content': ..., 'embeds': [...]})
+            label: Short description for the delivery log (e.g. 'BUY RELIANCE.NS')
+        """
+        entry = {
+            'id': uuid.uuid4().hex,
+            'payload': payload,
+            'label': label,
+            'attempts': 0,
+            'single': False,  # True = never coalesce (Discord rejected it as part of a batch)
+            'queued_at': time.time()
+        }
+        with self._condition:
+            self._pending.append(entry)
+            self.stats['queued'] += 1
+            self._persist()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until the queue is empty
+
+        Args:
+            timeout: Seconds to wait at most (None = no limit)
+
+        Returns:
+            True if everything was delivered (or dropped after max retries)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending and self.is_running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining if remaining is not None else 1.0)
+            return not self._pending
+
+    def close(self):
+        """Deliver what can be delivered within SHUTDOWN_FLUSH_SECONDS, then stop (rest stays on disk)"""
+        if not self.is_running:
+            return
+
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join(self.shutdown_flush_seconds)
+        if not self._thread.is_alive():
+            self._thread = None
+
+        if self.pending:
+            print(f"📨 Discord: {self.pending} alert(s) kept in {self.owner_file} for the next run")
+
+    def send_now(self, payload: Dict) -> Optional[requests.Response]:
+        """Blocking post through the pooled session, bypassing the queue (connection tests)"""
+        return self.session.post(self.webhook_url, data=json.dumps(payload), timeout=self.timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closing:
+                    # Idle: pick up alerts a finished process (e.g. --daily-summary) could not deliver
+                    if not self._condition.wait(ORPHAN_SCAN_SECONDS):
+                        self._adopt_orphans()
+                if not self._pending:
+                    return
+                closing = self._closing
+                age = time.time() - self._pending[0]['queued_at']
+
+            # Give alerts fired together (a scan's signals, a monitor cycle's exits) the chance to share a message
+            if not closing and age < self.coalesce_seconds:
+                time.sleep(self.coalesce_seconds - age)
+
+            wait = self._blocked_until - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            with self._condition:
+                batch = self._next_batch()
+            self._deliver(batch)
+
+    def _next_batch(self) -> List[Dict]:
+        """Oldest alert plus following ones that fit into the same message (caller holds the lock)"""
+        batch = [self._pending[0]]
+        if batch[0]['single']:
+            return batch
+
+        embeds = len(batch[0]['payload'].get('embeds', []))
+        chars = self._embed_chars(batch[0])
+        for entry in self._pending[1:]:
+            entry_embeds = len(entry['payload'].get('embeds', []))
+            entry_chars = self._embed_chars(entry)
+            if entry['single'] or embeds + entry_embeds > self.max_embeds or chars + entry_chars > self.max_embed_chars:
+                break
+            batch.append(entry)
+            embeds += entry_embeds
+            chars += entry_chars
+        return batch
+
+    @staticmethod
+    def _embed_chars(entry: Dict) -> int:
+        """Size of an alert's embeds (serialized - an upper bound for Discord's 6000-character count)"""
+        return len(json.dumps(entry['payload'].get('embeds', []), ensure_ascii=False))
+
+    @staticmethod
+    def _merge(batch: List[Dict]) -> Dict:
+        """One webhook message from several alerts: contents joined, embeds concatenated"""
+        if len(batch) == 1:
+            return batch[0]['payload']
+
+        contents = [entry['payload'].get('content') for entry in batch if entry['payload'].get('content')]
+        return {
+            'content': '\n'.join(contents)[:MAX_CONTENT_CHARS],
+            'embeds': [embed for entry in batch for embed in entry['payload'].get('embeds', [])]
+        }
+
+    def _deliver(self, batch: List[Dict]):
+        """Post one (coalesced) message and settle its alerts: done, retry later, split or drop"""
+        labels = ', '.join(entry['label'] for entry in batch if entry['label'])
+
+        try:
+            response = self.session.post(self.webhook_url, data=json.dumps(self._merge(batch)), timeout=self.timeout)
+        except requests.RequestException as e:
+            self._retry(batch, type(e).__name__)
+            return
+
+        self._track_rate_limit(response)
+
+        if response.status_code in (200, 204):
+            self.stats['messages'] += 1
+            self.stats['alerts_sent'] += len(batch)
+            self._remove(batch)
+            print(f"✅ Discord: sent {len(batch)} alert(s){f' ({labels})' if labels else ''}")
+
+        elif response.status_code == 429:
+            # Not a failure of the alert - wait as told and send the same batch again
+            self.stats['rate_limited'] += 1
+            retry_after = self._retry_after(response)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            print(f"⏳ Discord rate limit - retrying in {retry_after:.1f}s")
+
+        elif 400 <= response.status_code < 500:
+            if len(batch) > 1:
+                # One of the alerts broke the combined message - send them one by one
+                with self._condition:
+                    for entry in batch:
+                        entry['single'] = True
+                    self._persist()
+            else:
+                self.stats['dropped'] += 1
+                self._remove(batch)
+                print(f"⚠️ Discord rejected alert{f' ({labels})' if labels else ''}: "
+                      f"{response.status_code} {response.text[:200]}")
+
+        else:
+            self._retry(batch, f"status {response.status_code}")
+
+    def _retry(self, batch: List[Dict], reason: str):
+        """Count a failed attempt: back off exponentially, drop after MAX_RETRIES"""
+        attempts = max(entry['attempts'] for entry in batch) + 1
+        with self._condition:
+            for entry in batch:
+                entry['attempts'] = attempts
+            self._persist()
+
+        if attempts > self.max_retries:
+            self.stats['dropped'] += len(batch)
+            self._remove(batch)
+            print(f"❌ Discord: giving up on {len(batch)} alert(s) after {self.max_retries} retries ({reason})")
+            return
+
+        self.stats['retries'] += 1
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempts - 1))
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        print(f"⚠️ Discord send failed ({reason}) - retry {attempts}/{self.max_retries} in {delay:.1f}s")
+
+    def _track_rate_limit(self, response: requests.Response):
+        """Pause before the next post when the bucket is empty (X-RateLimit-Remaining: 0)"""
+        try:
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                reset_after = float(response.headers.get('X-RateLimit-Reset-After', 1))
+                self._blocked_until = max(self._blocked_until, time.monotonic() + reset_after)
+        except (TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """Seconds to wait after a 429 (JSON retry_after, else the Retry-After header)"""
+        try:
+            return float(response.json().get('retry_after'))
+        except (ValueError, TypeError, AttributeError):
+            pass
+        try:
+            return float(response.headers.get('Retry-After', 1))
+        except (TypeError, ValueError):
+            return 1.0
+
+    def _remove(self, batch: List[Dict]):
+        ids = {entry['id'] for entry in batch}
+        with self._condition:
+            self._pending = [entry for entry in self._pending if entry['id'] not in ids]
+            self._persist()
+            self._condition.notify_all()
+
+    def _persist(self):
+        """Write this process's queue atomically (caller holds the lock) - no file when empty"""
+        try:
+            if not self._pending:
+                if os.path.exists(self.owner_file):
+                    os.remove(self.owner_file)
+                return
+
+            directory = os.path.dirname(self.owner_file) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(prefix='.discord_queue.', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self._pending, f, ensure_ascii=False)
+                os.replace(tmp_file, self.owner_file)
+            except BaseException:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+                raise
+        except OSError as e:
+            print(f"⚠️ Could not persist Discord queue: {e}")
+
+    @contextmanager
+    def _queue_lock(self):
+        """Exclusive lock shared by every dispatching process (adopting queue files)"""
+        directory = os.path.dirname(self.lock_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.lock_file, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _orphan_files(self) -> List[str]:
+        """Queue files no running process owns: QUEUE_FILE itself (older versions) + files of dead PIDs"""
+        files = [self.queue_file] if os.path.exists(self.queue_file) else []
+        base, ext = os.path.splitext(self.queue_file)
+        for path in glob.glob(self._owner_pattern):
+            pid = path[len(base) + 1:len(path) - len(ext)]
+            if pid.isdigit() and int(pid) != os.getpid() and not _pid_alive(int(pid)):
+                files.append(path)
+        return files
+
+    def _adopt_orphans(self) -> int:
+        """
+        Move undelivered alerts of finished processes into this queue (caller holds self._condition)
+
+        Returns:
+            Number of alerts adopted
+        """
+        try:
+            with self._queue_lock():
+                known = {entry['id'] for entry in self._pending}
+                adopted = 0
+                for path in self._orphan_files():
+                    try:
+                        with open(path) as f:
+                            entries = json.load(f)
+                    except (OSError, ValueError) as e:
+                        print(f"⚠️ Could not read Discord queue {path}: {e}")
+                        continue
+                    new = [entry for entry in (entries if isinstance(entries, list) else [])
+                           if isinstance(entry, dict) and entry.get('id') not in known]
+                    if new:
+                        # Persist before deleting the source, so a crash in between can't lose alerts
+                        known.update(entry.get('id') for entry in new)
+                        self._pending.extend(new)
+                        self._persist()
+                        adopted += len(new)
+                    os.remove(path)
+        except OSError as e:
+            print(f"⚠️ Could not adopt queued Discord alerts: {e}")
+            return 0
+
+        if adopted:
+            self._pending.sort(key=lambda entry: entry.get('queued_at', 0))
+            self._persist()
+            self._condition.notify_all()
+        return adopted
+
+    def _load(self):
+        """Re-queue alerts left undelivered by earlier runs"""
+        with self._condition:
+            adopted = self._adopt_orphans()
+        if adopted:
+            print(f"📨 Discord: {adopted} undelivered alert(s) from earlier runs re-queued")
@@ -0,0 +1,368 @@
+"""
+🧪 BACKTESTER - Replays a stored OHLCV panel through the LIVE trading code
+
+Unlike the old hand-written backtests (useless/backtesting), nothing here
+re-implements trading logic:
+
+- Signals: SequentialScanner._analyze_stock (MultiTimeframeAnalyzer.analyze_stock
+  + _create_signal) on each day's last LOOKBACK_BARS daily bars, then the scan
+  loop's quality gate (_qualified_signals) and ranking (_rank_signals)
+- Entries: DualPortfolio.select_signals + execute_*_signal(s) -> PaperTrader.execute_signal
+- Exits: PaperTrader.check_exits, on a simulated clock, fed each day's bar as
+  Open -> Low/High -> High/Low -> Close
+
+Two phases:
+1. Signal generation - every (day, symbol) analysis depends only on the
+   history up to that day, so days are analysed on worker processes
+   (PanelIndicators + SetupPreFilter per day, like a batched live scan)
+2. Replay - one pass over the days with in-memory PaperTraders (sequential:
+   the portfolio state depends on every earlier day)
+
+No network: prices come from the panel, the Nifty history (relative strength)
+from the panel's benchmark series. Not replayed: intraday (15m) bars, the MQS
+second pass and signal freshness checks (entries fill at the scan instant).
+"""
+
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import (BACKTEST_ENGINE_CONFIG, INITIAL_CAPITAL, SWING_CAPITAL, SWING_ENABLED,
+                             PANEL_INDICATORS_ENABLED, SETUP_PREFILTER_CONFIG, NIFTY_SYMBOL)
+from src.backtest.simulation import SimulatedClock, SimulatedPriceSource, normalize_frame
+from src.data.analysis_pool import pack_frame, unpack_frame
+from src.data.benchmark_series import get_benchmark_series
+from src.data.ohlcv_store import get_ohlcv_store
+from src.data.sequential_scanner import SequentialScanner
+from src.indicators.panel_indicators import PanelIndicators
+from src.paper_trading.dual_portfolio import DualPortfolio
+from src.paper_trading.paper_trader import PaperTrader
+from src.strategies.setup_prefilter import SetupPreFilter
+
+# Exit checks per day: (IST time, step of the day's bar - see SimulatedPriceSource.set_step)
+EXIT_CHECKS = [('09:15', 0), ('11:00', 1), ('13:00', 2), ('15:15', 3)]
+
+
+def load_panel(store_dir: str = None, symbols: List[str] = None) -> Tuple[Dict[str, pd.DataFrame], Optional[pd.DataFrame]]:
+    """
+    Load the backtest history from an OHLCV store
+
+    Args:
+        store_dir: OHLCVStore directory (default: BACKTEST_ENGINE_CONFIG['STORE_DIR'])
+        symbols: Symbols to load (default: everything stored)
+
+    Returns:
+        (symbol -> daily frame, Nifty frame or None) - the benchmark is not part of the panel
+    """
+    store = get_ohlcv_store(store_dir or BACKTEST_ENGINE_CONFIG['STORE_DIR'])
+    frames = store.load_all('1d', symbols)
+    benchmark = frames.pop(NIFTY_SYMBOL, None)
+    if benchmark is None and store.has(NIFTY_SYMBOL, '1d'):
+        benchmark = store.get_frame(NIFTY_SYMBOL, '1d')
+    return frames, benchmark
+
+
+# Per-process signal generator state (set by _init_worker)
+_worker = None
+
+
+def _setup_worker(panel: Dict[str, pd.DataFrame], benchmark: Optional[pd.DataFrame], regime: str, lookback_bars: int):
+    """Signal generator state for this process: seed the benchmark cache, build the analyzer"""
+    global _worker
+
+    # Empty benchmark = neutral RS, never a download
+    get_benchmark_series().seed(NIFTY_SYMBOL, benchmark if benchmark is not None else pd.DataFrame())
+
+    with redirect_stdout(io.StringIO()):
+        scanner = SequentialScanner.analysis_only(regime)
+    scanner.prefilter = SetupPreFilter() if SETUP_PREFILTER_CONFIG['ENABLED'] else None
+
+    _worker = {
+        'panel': panel,
+        'scanner': scanner,
+        'panel_indicators': PanelIndicators() if PANEL_INDICATORS_ENABLED else None,
+        'lookback_bars': lookback_bars
+    }
+
+
+def _init_worker(panel: Dict[str, Dict], benchmark: Optional[Dict], regime: str, lookback_bars: int):
+    """Worker start-up: unpack the panel (pack_frame arrays) and set up the analyzer"""
+    _setup_worker({symbol: unpack_frame(packed) for symbol, packed in panel.items()}, unpack_frame(benchmark),
+                  regime, lookback_bars)
+
+
+def _scan_days(days: List[pd.Timestamp]) -> List[Tuple[pd.Timestamp, Dict]]:
+    """
+    Worker: the scan of each day - qualified signals + funnel counts
+
+    Returns:
+        [(day, {'swing_signals', 'positional_signals', 'stats'})]
+    """
+    scanner = _worker['scanner']
+    lookback_bars = _worker['lookback_bars']
+    results = []
+
+    for day in days:
+        # Each symbol's history up to (and including) today's bar - symbols without a bar today aren't scanned
+        windows = {}
+        for symbol, df in _worker['panel'].items():
+            row = df.index.searchsorted(day)
+            if row < len(df) and df.index[row] == day:
+                windows[symbol] = df.iloc[max(0, row + 1 - lookback_bars):row + 1]
+
+        stats = {'scanned': len(windows), 'prefiltered_out': 0, 'analyzed': 0, 'setups': 0}
+        swing_signals, positional_signals = [], []
+
+        with redirect_stdout(io.StringIO()):
+            # Daily indicators for the whole universe in one vectorized pass, then the pre-filter gates
+            indicators = {}
+            if _worker['panel_indicators'] is not None:
+                try:
+                    indicators = _worker['panel_indicators'].calculate_all(windows)
+                except Exception:
+                    indicators = {}  # Per-stock indicators (same fallback as the live batch)
+            computed = {symbol: result for symbol, result in indicators.items() if result is not None}
+            passed = scanner.prefilter.evaluate(computed) if scanner.prefilter is not None and computed else {}
+
+            for symbol, daily in windows.items():
+                if not passed.get(symbol, True):
+                    stats['prefiltered_out'] += 1
+                    continue
+
+                signals = scanner._analyze_stock(symbol, daily, None, indicators.get(symbol))
+                stats['analyzed'] += 1
+                if signals['swing'] is not None or signals['positional'] is not None:
+                    stats['setups'] += 1
+
+                swing, positional = SequentialScanner._qualified_signals(signals)
+                if swing:
+                    swing_signals.append(swing)
+                if positional:
+                    positional_signals.append(positional)
+
+        results.append((day, {'swing_signals': swing_signals, 'positional_signals': positional_signals, 'stats': stats}))
+
+    return results
+
+
+class Backtester:
+    """
+    Event-driven backtest over a stored daily OHLCV panel
+    """
+
+    def __init__(self, panel: Dict[str, pd.DataFrame], benchmark: Optional[pd.DataFrame] = None, config: Dict = None):
+        """
+        Initialize backtester
+
+        Args:
+            panel: symbol -> daily OHLCV frame (any column case, tz-aware or naive dates)
+            benchmark: Nifty 50 daily frame for relative strength (None = neutral RS)
+            config: Dict shaped like BACKTEST_ENGINE_CONFIG (default: settings)
+        """
+        config = config or BACKTEST_ENGINE_CONFIG
+        self.lookback_bars = int(config['LOOKBACK_BARS'])
+        self.regime = config['REGIME']
+        self.workers = int(config['WORKERS']) or os.cpu_count() or 1
+        self.days_per_task = max(1, int(config['DAYS_PER_TASK']))
+        self.include_swing = bool(config['INCLUDE_SWING']) and SWING_ENABLED
+        self.scan_time = config['SCAN_TIME']
+
+        self.panel = {symbol: normalize_frame(df) for symbol, df in panel.items() if df is not None and not df.empty}
+        self.benchmark = normalize_frame(benchmark) if benchmark is not None and not benchmark.empty else None
+
+        self.stats = {
+            'days': 0,
+            'scanned': 0,
+            'prefiltered_out': 0,
+            'analyzed': 0,
+            'setups': 0,
+            'swing_signals': 0,
+            'positional_signals': 0,
+            'signal_seconds': 0.0,
+            'replay_seconds': 0.0
+        }
+
+    def trading_days(self, start=None, end=None) -> List[pd.Timestamp]:
+        """Dates with at least one bar in the panel, within [start, end]"""
+        if not self.panel:
+            return []
+
+        dates = pd.DatetimeIndex(np.unique(np.concatenate([df.index.values for df in self.panel.values()])))
+        if start is not None:
+            dates = dates[dates >= pd.Timestamp(start)]
+        if end is not None:
+            dates = dates[dates <= pd.Timestamp(end)]
+        return list(dates)
+
+    def generate_signals(self, days: List[pd.Timestamp]) -> Dict[pd.Timestamp, Dict]:
+        """
+        Phase 1: the scan of every day (worker processes, results in day order)
+
+        Returns:
+            day -> {'swing_signals', 'positional_signals', 'stats'}
+        """
+        tasks = [days[i:i + self.days_per_task] for i in range(0, len(days), self.days_per_task)]
+
+        if self.workers == 1 or len(tasks) <= 1:
+            _setup_worker(self.panel, self.benchmark, self.regime, self.lookback_bars)
+            return {day: result for chunk in map(_scan_days, tasks) for day, result in chunk}
+
+        initargs = (
+            {symbol: pack_frame(df) for symbol, df in self.panel.items()},
+            pack_frame(self.benchmark),
+            self.regime,
+            self.lookback_bars
+        )
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(),
+                                 initializer=_init_worker, initargs=initargs) as executor:
+            return {day: result for chunk in executor.map(_scan_days, tasks) for day, result in chunk}
+
+    def run(self, start=None, end=None, verbose: bool = False) -> Dict:
+        """
+        Run the backtest
+
+        Args:
+            start: First trading day (default: first date in the panel)
+            end: Last trading day (default: last date in the panel)
+            verbose: Show the PaperTrader / allocation output of every day
+
+        Returns:
+            Dict with 'summary', 'equity_curve' (DataFrame), 'trades', 'open_positions' and 'stats'
+        """
+        days = self.trading_days(start, end)
+        self.stats['days'] = len(days)
+        if not days:
+            return {'summary': {}, 'equity_curve': pd.DataFrame(), 'trades': [], 'open_positions': {}, 'stats': self.stats}
+
+        print(f"🧪 Backtest: {len(self.panel)} symbols x {len(days)} days "
+              f"({days[0].date()} → {days[-1].date()}, {self.workers} workers)")
+
+        signal_start = time.time()
+        day_scans = self.generate_signals(days)
+        self.stats['signal_seconds'] = time.time() - signal_start
+        print(f"   📡 Signals generated in {self.stats['signal_seconds']:.1f}s")
+
+        replay_start = time.time()
+        result = self.replay(days, day_scans, verbose)
+        self.stats['replay_seconds'] = time.time() - replay_start
+        print(f"   💼 Replay done in {self.stats['replay_seconds']:.1f}s")
+
+        result['stats'] = self.stats
+        return result
+
+    def replay(self, days: List[pd.Timestamp], day_scans: Dict[pd.Timestamp, Dict], verbose: bool = False) -> Dict:
+        """
+        Phase 2: exits and entries day by day on fresh in-memory portfolios
+
+        Args:
+            days: Trading days to replay
+            day_scans: generate_signals() result covering these days
+
+        Returns:
+            Dict with 'summary', 'equity_curve', 'trades' and 'open_positions'
+        """
+        clock = SimulatedClock()
+        prices = SimulatedPriceSource(self.panel, self.lookback_bars)
+        clock.set(days[0], EXIT_CHECKS[0][0])
+
+        with redirect_stdout(io.StringIO()):
+            # Same capital as the live DualPortfolio
+            dual = DualPortfolio.from_portfolios(
+                PaperTrader(capital=SWING_CAPITAL, persist=False, clock=clock, data_fetcher=prices),
+                PaperTrader(capital=INITIAL_CAPITAL, persist=False, clock=clock, data_fetcher=prices)
+            )
+        # Portfolios that can trade (an idle swing portfolio would only dilute the returns)
+        portfolios = [dual.positional_portfolio] + ([dual.swing_portfolio] if self.include_swing else [])
+        initial_value = sum(p.initial_capital for p in portfolios)
+
+        equity = []
+        for day in days:
+            prices.set_day(day)
+            with redirect_stdout(io.StringIO()) if not verbose else nullcontext():
+                # Exit checks through the day (monitor jobs of the live system)
+                for hhmm, step in EXIT_CHECKS:
+                    clock.set(day, hhmm)
+                    prices.set_step(step)
+                    dual.monitor_swing_positions(prices.get_prices(list(dual.swing_portfolio.positions)))
+                    dual.monitor_positional_positions(prices.get_prices(list(dual.positional_portfolio.positions)))
+
+                # Scan + entries at the close
+                clock.set(day, self.scan_time)
+                self._execute(dual, day_scans.get(day), clock)
+
+            closes = prices.get_prices([symbol for p in portfolios for symbol in p.positions])
+            equity.append({
+                'date': day,
+                'value': sum(p.get_portfolio_value(closes) for p in portfolios),
+                'cash': sum(p.capital for p in portfolios),
+                'positions': sum(len(p.positions) for p in portfolios)
+            })
+
+        equity_curve = pd.DataFrame(equity).set_index('date')
+        trades = sorted(dual.swing_portfolio.trade_history + dual.positional_portfolio.trade_history,
+                        key=lambda t: t.get('exit_date', ''))
+
+        return {
+            'summary': self._summarize(equity_curve, trades, initial_value),
+            'equity_curve': equity_curve,
+            'trades': trades,
+            'open_positions': {**dual.swing_portfolio.positions, **dual.positional_portfolio.positions}
+        }
+
+    def _execute(self, dual: DualPortfolio, scan: Optional[Dict], clock: SimulatedClock):
+        """The day's scan result through the live selection + execution path (main_eod_system.process_signals)"""
+        if scan is None:
+            return
+
+        for key in ('scanned', 'prefiltered_out', 'analyzed', 'setups'):
+            self.stats[key] += scan['stats'][key]
+
+        ranked = SequentialScanner._rank_signals(scan['swing_signals'], scan['positional_signals'])
+        swing_signals, positional_signals = DualPortfolio.select_signals(ranked['swing_signals'], ranked['positional_signals'])
+        self.stats['swing_signals'] += len(swing_signals)
+        self.stats['positional_signals'] += len(positional_signals)
+
+        # Signals were created by the workers - stamp them with the scan time
+        for signal in swing_signals + positional_signals:
+            signal['timestamp'] = clock.now().isoformat()
+
+        if self.include_swing:
+            for signal in swing_signals:
+                # Swing: Accept score >= 25 (optimized for 1-2% quick moves)
+                if signal.get('momentum_score', 0) >= 25:
+                    dual.execute_swing_signal(signal)
+
+        if positional_signals:
+            dual.execute_positional_signals_smart(positional_signals)
+
+    @staticmethod
+    def _summarize(equity_curve: pd.DataFrame, trades: List[Dict], initial_value: float) -> Dict:
+        """Return, drawdown and trade statistics"""
+        values = equity_curve['value']
+        drawdown = (values / values.cummax() - 1).min() if len(values) else 0.0
+        daily_returns = values.pct_change().dropna()
+        sharpe = (daily_returns.mean() / daily_returns.std() * np.sqrt(252)) if daily_returns.std() > 0 else 0.0
+
+        pnls = [t.get('pnl', 0) for t in trades]
+        wins = [p for p in pnls if p > 0]
+        losses = [p for p in pnls if p <= 0]
+
+        return {
+            'initial_value': round(initial_value, 2),
+            'final_value': round(float(values.iloc[-1]), 2),
+            'total_return_pct': round((float(values.iloc[-1]) / initial_value - 1) * 100, 2),
+            'max_drawdown_pct': round(float(drawdown) * 100, 2),
+            'sharpe': round(float(sharpe), 2),
+            'trades': len(trades),
+            'win_rate_pct': round(len(wins) / len(trades) * 100, 1) if trades else 0.0,
+            'profit_factor': round(sum(wins) / abs(sum(losses)), 2) if losses and sum(losses) != 0 else None,
+            'total_pnl': round(sum(pnls), 2)
+        }
+
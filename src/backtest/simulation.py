@@ -0,0 +1,157 @@
+"""
+⏱️ BACKTEST SIMULATION - Simulated clock + price source for PaperTrader
+
+PaperTrader asks for the time (entry window, holding period, 3:15 PM scalp
+close) and for live prices / history (execution price, ATR sizing, smart
+replacement). In a backtest both come from here instead of the wall clock
+and Yahoo Finance:
+
+- SimulatedClock: the backtest sets the current bar time, now() returns it
+- SimulatedPriceSource: EnhancedDataFetcher stand-in serving the stored panel
+  up to the current bar (no look-ahead, no network)
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pytz
+
+IST = pytz.timezone('Asia/Kolkata')
+
+OHLCV_FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Daily OHLCV frame in the scanner's layout: Capitalized columns, tz-naive dates, sorted
+
+    Args:
+        df: Daily OHLCV frame (any column case, tz-aware or naive index)
+
+    Returns:
+        Normalized frame (OHLCV columns only) - the frame itself when it already is one
+        (e.g. a view of the sweep's memory-mapped panel), so nothing is copied
+    """
+    if _is_normalized(df):
+        return df
+
+    df = df.rename(columns={c: str(c).capitalize() for c in df.columns})[OHLCV_FIELDS]
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    df = df.set_axis(index.normalize(), axis=0)
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    return df.astype(np.float64)
+
+
+def _is_normalized(df: pd.DataFrame) -> bool:
+    """Already in normalize_frame() layout: OHLCV float64 columns, tz-naive unique sorted midnight dates"""
+    index = df.index
+    return (list(df.columns) == OHLCV_FIELDS and all(dtype == np.float64 for dtype in df.dtypes) and
+            isinstance(index, pd.DatetimeIndex) and index.tz is None and index.is_unique and
+            index.is_monotonic_increasing and (index == index.normalize()).all())
+
+
+class SimulatedClock:
+    """
+    Clock whose now() is set by the backtest (IST wall time, like the live system)
+    """
+
+    def __init__(self):
+        self.current: Optional[datetime] = None
+
+    def set(self, day: pd.Timestamp, hhmm: str):
+        """
+        Move the clock to a time of a trading day
+
+        Args:
+            day: Trading day (tz-naive date)
+            hhmm: IST time of day ('09:15')
+        """
+        hour, minute = (int(part) for part in hhmm.split(':'))
+        self.current = IST.localize(datetime(day.year, day.month, day.day, hour, minute))
+
+    def now(self, tz=None) -> datetime:
+        """Simulated time (naive IST for tz=None, like datetime.now() on an IST machine)"""
+        if tz is None:
+            return self.current.replace(tzinfo=None)
+        return self.current.astimezone(tz)
+
+
+class SimulatedPriceSource:
+    """
+    EnhancedDataFetcher stand-in over a stored daily panel
+
+    get_current_price() returns the current step of the day's bar (see
+    set_step); get_stock_data_dual() returns the history up to today.
+    """
+
+    def __init__(self, panel: Dict[str, pd.DataFrame], lookback_bars: int = 52):
+        """
+        Initialize price source
+
+        Args:
+            panel: symbol -> normalized daily OHLCV frame (normalize_frame)
+            lookback_bars: Daily bars returned by get_stock_data_dual (like the live 75-day fetch)
+        """
+        self.panel = panel
+        self.lookback_bars = lookback_bars
+        self.day: Optional[pd.Timestamp] = None
+        self.step = 3
+
+        # Row of each symbol's bar per day: searchsorted once per day instead of per request
+        self._rows: Dict[str, int] = {}
+
+    def set_day(self, day: pd.Timestamp):
+        """Make `day` the current bar (symbols without a bar that day have no price)"""
+        self.day = day
+        self._rows = {}
+        for symbol, df in self.panel.items():
+            row = df.index.searchsorted(day)
+            if row < len(df) and df.index[row] == day:
+                self._rows[symbol] = row
+
+    def set_step(self, step: int):
+        """
+        Intraday step of the current bar: 0 = Open, 1/2 = first/second extreme, 3 = Close
+
+        The extremes follow the usual OHLC path assumption: an up bar (Close >= Open)
+        visits the Low first, a down bar the High first.
+        """
+        self.step = step
+
+    def path(self, symbol: str) -> Optional[List[float]]:
+        """Open -> extreme -> extreme -> Close prices of the symbol's current bar"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return None
+
+        open_, high, low, close = self.panel[symbol].iloc[row, :4]
+        if close >= open_:
+            return [open_, low, high, close]
+        return [open_, high, low, close]
+
+    def get_current_price(self, symbol: str) -> float:
+        """Price at the current step (0 if the symbol has no bar today - same as a failed live fetch)"""
+        path = self.path(symbol)
+        return float(path[self.step]) if path else 0
+
+    def get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Current prices for many symbols (symbols without a bar today are left out)"""
+        prices = {}
+        for symbol in symbols:
+            price = self.get_current_price(symbol)
+            if price > 0:
+                prices[symbol] = price
+        return prices
+
+    def get_stock_data_dual(self, symbol: str, verbose: bool = True) -> Dict:
+        """Daily history up to today (no intraday bars in the backtest store)"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return {'symbol': symbol, 'daily': None, 'intraday': None, 'success': False}
+
+        daily = self.panel[symbol].iloc[max(0, row + 1 - self.lookback_bars):row + 1]
+        return {'symbol': symbol, 'daily': daily, 'intraday': None, 'success': True}
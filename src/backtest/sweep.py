@@ -0,0 +1,357 @@
+"""
+🔬 PARAMETER SWEEP - Grid / random search over settings with walk-forward backtests
+
+Each configuration is a set of settings overrides ('MIN_SIGNAL_SCORE': 7.7,
+'POSITIONAL_TRAILING_DISTANCE': 0.01, ...) backtested on rolling train / test
+windows (walk-forward: rank on train, judge on the following test window).
+
+Built to push hundreds of configurations per hour through one box:
+- The panel is written once as a read-only memory-mapped array
+  (PANEL_DIR/panel.npy, every symbol's bars as one contiguous row range);
+  workers map it and build their frames as views - no per-worker copy
+- Signals are generated once per analysis group: configurations that differ
+  only in REPLAY_ONLY parameters (trailing stops, position limits - read by
+  PaperTrader, not by the analysis) share one scan and only replay separately
+- Scans and replays run as tasks on one process pool; each replay task
+  covers every walk-forward window of one configuration
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import config.settings as settings
+from config.settings import BACKTEST_ENGINE_CONFIG, PARAMETER_SWEEP_CONFIG
+from src.backtest.backtester import Backtester
+from src.backtest.simulation import OHLCV_FIELDS, normalize_frame
+
+PANEL_FILE = 'panel.npy'
+DATES_FILE = 'dates.npy'
+META_FILE = 'meta.json'
+BENCHMARK_KEY = '__benchmark__'
+
+
+@contextmanager
+def settings_overrides(overrides: Dict):
+    """
+    Temporarily override settings everywhere they were imported
+
+    Modules bind settings at import time (from config.settings import ...), so a
+    plain 'NAME' override is also set on every loaded module holding the original
+    object under that name. 'NAME.KEY' changes one key of a dict setting in place
+    (dicts are shared, so every importer sees it).
+
+    Args:
+        overrides: {'NAME': value, 'NAME.KEY': value}
+
+    Raises:
+        KeyError: Unknown setting or dict key (checked before anything is changed)
+    """
+    missing = object()
+    for name in overrides:
+        setting, _, key = name.partition('.')
+        target = getattr(settings, setting, missing) if setting.isupper() else missing
+        if target is missing or (key and not (isinstance(target, dict) and key in target)):
+            raise KeyError(f"Unknown setting: {name}")
+
+    originals, dict_originals = {}, []
+
+    try:
+        for name, value in overrides.items():
+            if '.' in name:
+                setting, key = name.split('.', 1)
+                target = getattr(settings, setting)
+                dict_originals.append((target, key, target[key]))
+                target[key] = value
+            else:
+                originals[name] = getattr(settings, name)
+                _rebind(name, originals[name], value)
+        yield
+    finally:
+        for name, original in originals.items():
+            _rebind(name, getattr(settings, name), original)
+        for target, key, original in reversed(dict_originals):
+            target[key] = original
+
+
+def _rebind(name: str, current, value):
+    """Point every project module's `name` that is `current` to `value`"""
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name.startswith('src.') or module_name.startswith('config.')
+                                  or module_name in ('config', 'main_eod_system')):
+            continue
+        if getattr(module, name, None) is current:
+            setattr(module, name, value)
+
+
+def configurations(grid: Dict[str, List], search: str = 'grid', samples: int = 50, seed: int = 42) -> List[Dict]:
+    """
+    Parameter combinations to test
+
+    Args:
+        grid: parameter -> candidate values
+        search: 'grid' (every combination) or 'random' (`samples` distinct combinations)
+        samples: Random search size
+        seed: Random search seed
+
+    Returns:
+        List of {parameter: value} overrides
+    """
+    names = list(grid)
+    combinations = list(itertools.product(*(grid[name] for name in names)))
+    if search == 'random' and samples < len(combinations):
+        combinations = random.Random(seed).sample(combinations, samples)
+    elif search not in ('grid', 'random'):
+        raise ValueError(f"Unknown search: {search}")
+    return [dict(zip(names, values)) for values in combinations]
+
+
+def walk_forward_splits(days: List[pd.Timestamp], train_days: int, test_days: int) -> List[Tuple[List, List]]:
+    """
+    Rolling (train, test) windows: train on `train_days`, test on the next `test_days`, step by `test_days`
+
+    Returns:
+        [(train days, test days)] - a single (all days, []) split if the range is too short
+    """
+    splits = []
+    start = 0
+    while start + train_days + test_days <= len(days):
+        splits.append((days[start:start + train_days], days[start + train_days:start + train_days + test_days]))
+        start += test_days
+    return splits or [(list(days), [])]
+
+
+def write_panel(panel: Dict[str, pd.DataFrame], benchmark: Optional[pd.DataFrame], panel_dir: str) -> str:
+    """
+    Write the panel for memory mapping: every symbol's bars stacked into one float64 [row, OHLCV] array
+
+    meta.json holds each symbol's [start, stop) row range, dates.npy the date of every row.
+
+    Args:
+        panel: symbol -> daily OHLCV frame
+        benchmark: Nifty 50 daily frame (stored as one more symbol) or None
+        panel_dir: Output directory
+
+    Returns:
+        panel_dir
+    """
+    frames = {symbol: normalize_frame(df) for symbol, df in panel.items() if df is not None and not df.empty}
+    if benchmark is not None and not benchmark.empty:
+        frames[BENCHMARK_KEY] = normalize_frame(benchmark)
+
+    symbols = list(frames)
+    stops = np.cumsum([len(frames[symbol]) for symbol in symbols]).tolist()
+    rows = [[start, stop] for start, stop in zip([0] + stops[:-1], stops)]
+
+    os.makedirs(panel_dir, exist_ok=True)
+    if symbols:
+        values = np.concatenate([frames[symbol].to_numpy(dtype=np.float64) for symbol in symbols])
+        dates = np.concatenate([frames[symbol].index.values.astype('datetime64[ns]') for symbol in symbols])
+    else:
+        values = np.empty((0, len(OHLCV_FIELDS)), dtype=np.float64)
+        dates = np.empty(0, dtype='datetime64[ns]')
+    np.save(os.path.join(panel_dir, PANEL_FILE), values)
+    np.save(os.path.join(panel_dir, DATES_FILE), dates)
+    with open(os.path.join(panel_dir, META_FILE), 'w') as f:
+        json.dump({'symbols': symbols, 'rows': rows}, f)
+    return panel_dir
+
+
+def read_panel(panel_dir: str) -> Tuple[Dict[str, pd.DataFrame], Optional[pd.DataFrame]]:
+    """
+    Map a write_panel() directory read-only and rebuild the frames
+
+    Each frame's values are a view of its row range in the mapped array (already
+    normalized float64, so Backtester's normalize_frame keeps it as is).
+
+    Returns:
+        (symbol -> daily frame, benchmark frame or None)
+    """
+    values = np.load(os.path.join(panel_dir, PANEL_FILE), mmap_mode='r')
+    dates = np.load(os.path.join(panel_dir, DATES_FILE), mmap_mode='r')
+    with open(os.path.join(panel_dir, META_FILE)) as f:
+        meta = json.load(f)
+
+    frames = {}
+    for symbol, (start, stop) in zip(meta['symbols'], meta['rows']):
+        frames[symbol] = pd.DataFrame(values[start:stop], index=pd.DatetimeIndex(dates[start:stop]),
+                                      columns=OHLCV_FIELDS, copy=False)
+    return frames, frames.pop(BENCHMARK_KEY, None)
+
+
+# Per-process backtester over the mapped panel (set by _init_sweep_worker)
+_sweep_backtester = None
+
+
+def _init_sweep_worker(panel_dir: str, engine_config: Dict):
+    """Worker start-up: map the shared panel, one in-process Backtester for every task"""
+    global _sweep_backtester
+    panel, benchmark = read_panel(panel_dir)
+    _sweep_backtester = Backtester(panel, benchmark, {**engine_config, 'WORKERS': 1})
+
+
+def _scan_task(overrides: Dict, days: List[pd.Timestamp]) -> Dict[pd.Timestamp, Dict]:
+    """Worker: the scans of `days` with the analysis overrides applied"""
+    with settings_overrides(overrides):
+        return _sweep_backtester.generate_signals(days)
+
+
+def _replay_task(overrides: Dict, day_scans: Dict[pd.Timestamp, Dict],
+                 splits: List[Tuple[List, List]]) -> List[Tuple[Dict, Optional[Dict]]]:
+    """Worker: one configuration on every walk-forward split -> [(train summary, test summary or None)]"""
+    results = []
+    with settings_overrides(overrides):
+        for train, test in splits:
+            train_summary = _sweep_backtester.replay(train, day_scans)['summary']
+            test_summary = _sweep_backtester.replay(test, day_scans)['summary'] if test else None
+            results.append((train_summary, test_summary))
+    return results
+
+
+class ParameterSweep:
+    """
+    Walk-forward parameter sweep on a process pool over a memory-mapped panel
+    """
+
+    def __init__(self, panel: Dict[str, pd.DataFrame], benchmark: Optional[pd.DataFrame] = None,
+                 config: Dict = None, engine_config: Dict = None):
+        """
+        Initialize sweep
+
+        Args:
+            panel: symbol -> daily OHLCV frame
+            benchmark: Nifty 50 daily frame for relative strength (None = neutral RS)
+            config: Dict shaped like PARAMETER_SWEEP_CONFIG (default: settings)
+            engine_config: Dict shaped like BACKTEST_ENGINE_CONFIG (default: settings)
+        """
+        self.config = config or PARAMETER_SWEEP_CONFIG
+        self.engine_config = engine_config or BACKTEST_ENGINE_CONFIG
+        self.workers = int(self.config['WORKERS']) or os.cpu_count() or 1
+        self.replay_only = set(self.config['REPLAY_ONLY'])
+        self.rank_by = self.config['RANK_BY']
+
+        self.panel_dir = write_panel(panel, benchmark, self.config['PANEL_DIR'])
+
+    def configurations(self) -> List[Dict]:
+        """Configurations from the sweep config's GRID / SEARCH"""
+        return configurations(self.config['GRID'], self.config['SEARCH'],
+                              int(self.config['RANDOM_SAMPLES']), int(self.config['SEED']))
+
+    def run(self, start=None, end=None, configs: List[Dict] = None) -> Dict:
+        """
+        Backtest every configuration on every walk-forward split
+
+        Args:
+            start: First trading day (default: after the first LOOKBACK_BARS days of the panel)
+            end: Last trading day (default: last date in the panel)
+            configs: Configurations to test (default: self.configurations())
+
+        Returns:
+            Dict with 'results' (one row per configuration, ranked by the mean test RANK_BY),
+            'walk_forward' (per split: the best configuration on train and its test result)
+            and 'seconds'
+        """
+        started = time.time()
+        configs = configs or self.configurations()
+
+        if self.workers == 1:
+            _init_sweep_worker(self.panel_dir, self.engine_config)
+            return self._run(_sweep_backtester, start, end, configs, map, started)
+
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(),
+                                 initializer=_init_sweep_worker, initargs=(self.panel_dir, self.engine_config)) as executor:
+            backtester = Backtester(*read_panel(self.panel_dir), {**self.engine_config, 'WORKERS': 1})
+            return self._run(backtester, start, end, configs, executor.map, started)
+
+    def _run(self, backtester: Backtester, start, end, configs: List[Dict], map_fn, started: float) -> Dict:
+        """Scan per analysis group, replay per configuration (map_fn = map or executor.map)"""
+        days = backtester.trading_days(start, end)
+        if start is None:
+            days = days[backtester.lookback_bars:]  # The first days have too little history to analyse
+        splits = walk_forward_splits(days, int(self.config['TRAIN_DAYS']), int(self.config['TEST_DAYS']))
+        if not days:
+            return {'results': pd.DataFrame(), 'walk_forward': pd.DataFrame(), 'seconds': 0.0}
+
+        # Configurations sharing their analysis parameters share one scan
+        group_keys = [self._analysis_key(config) for config in configs]
+        groups = {key: json.loads(key) for key in group_keys}
+
+        print(f"🔬 Sweep: {len(configs)} configurations ({len(groups)} signal scans) x {len(splits)} walk-forward splits, "
+              f"{len(backtester.panel)} symbols x {len(days)} days, {self.workers} workers")
+
+        chunk = max(1, int(self.engine_config['DAYS_PER_TASK']))
+        scan_tasks = [(key, days[i:i + chunk]) for key in groups for i in range(0, len(days), chunk)]
+        scans: Dict[str, Dict] = {key: {} for key in groups}
+        for (key, _), result in zip(scan_tasks, map_fn(_scan_task, [groups[key] for key, _ in scan_tasks],
+                                                       [task_days for _, task_days in scan_tasks])):
+            scans[key].update(result)
+        print(f"   📡 Signals generated in {time.time() - started:.1f}s")
+
+        replays = list(map_fn(_replay_task, configs, [scans[key] for key in group_keys], [splits] * len(configs)))
+
+        seconds = time.time() - started
+        print(f"   💼 {len(configs)} configurations replayed in {seconds:.1f}s "
+              f"({len(configs) / seconds * 3600:.0f} configurations/hour)")
+
+        return {
+            'results': self._results_table(configs, replays),
+            'walk_forward': self._walk_forward_table(configs, replays, splits),
+            'seconds': seconds
+        }
+
+    def _analysis_key(self, config: Dict) -> str:
+        """The configuration's analysis-affecting overrides (everything but REPLAY_ONLY) as a hashable key"""
+        return json.dumps({name: value for name, value in config.items()
+                           if name.split('.')[0] not in self.replay_only}, sort_keys=True)
+
+    def _results_table(self, configs: List[Dict], replays: List[List[Tuple]]) -> pd.DataFrame:
+        """One row per configuration: parameters + mean train_/test_ metrics, best first"""
+        rows = []
+        for config, splits in zip(configs, replays):
+            row = dict(config)
+            for prefix, position in (('train', 0), ('test', 1)):
+                summaries = [split[position] for split in splits if split[position]]
+                for metric in ('total_return_pct', 'max_drawdown_pct', 'sharpe', 'trades', 'win_rate_pct', 'profit_factor'):
+                    values = [s[metric] for s in summaries if s.get(metric) is not None]
+                    row[f"{prefix}_{metric}"] = round(float(np.mean(values)), 2) if values else None
+            rows.append(row)
+
+        results = pd.DataFrame(rows)
+        rank_column = f"test_{self.rank_by}" if results[f"test_{self.rank_by}"].notna().any() else f"train_{self.rank_by}"
+        results = results.sort_values(rank_column, ascending=False, na_position='last').reset_index(drop=True)
+        results.index += 1
+        results.index.name = 'rank'
+        return results
+
+    def _rank_value(self, summary: Dict) -> float:
+        """RANK_BY of a summary (-inf when missing - a 0.0 metric still ranks as 0.0)"""
+        value = summary.get(self.rank_by)
+        return float('-inf') if value is None else value
+
+    def _walk_forward_table(self, configs: List[Dict], replays: List[List[Tuple]],
+                            splits: List[Tuple[List, List]]) -> pd.DataFrame:
+        """Per split: the configuration with the best train RANK_BY and how it did on the unseen test window"""
+        rows = []
+        for n, (train, test) in enumerate(splits):
+            best = max(range(len(configs)), key=lambda i: self._rank_value(replays[i][n][0]))
+            train_summary, test_summary = replays[best][n]
+            rows.append({
+                'split': n + 1,
+                'train': f"{train[0].date()} → {train[-1].date()}",
+                'test': f"{test[0].date()} → {test[-1].date()}" if test else '',
+                **configs[best],
+                f"train_{self.rank_by}": train_summary.get(self.rank_by),
+                f"test_{self.rank_by}": test_summary.get(self.rank_by) if test_summary else None,
+                'test_return_pct': test_summary.get('total_return_pct') if test_summary else None
+            })
+        return pd.DataFrame(rows)
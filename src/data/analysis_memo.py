@@ -0,0 +1,196 @@
+"""
+♻️ ANALYSIS MEMO - Don't re-analyze symbols whose bars haven't changed
+
+After market close (and on weekends) every rescan downloads the same daily
+bar and the same 15m candles, and intraday most symbols' data is unchanged
+between two scans. Each symbol's _analyze_stock() output is memoized against
+a content fingerprint:
+
+- Last ANALYSIS_MEMO_CONFIG['FINGERPRINT_BARS'] daily + 15m bars (and bar counts)
+- Scan context: market regime + Nifty history (relative strength)
+- Version: every setting in config/settings.py + the analysis source files
+
+Same fingerprint -> the previous {'swing', 'positional'} result is reused.
+The memo is persisted next to the data cache, so post-close / weekend runs
+(separate processes) are near-instant too.
+"""
+
+import copy
+import hashlib
+import pickle
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.settings import ANALYSIS_MEMO_CONFIG, CACHE_FOLDER, NIFTY_SYMBOL
+from src.data.benchmark_series import get_benchmark_series
+
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Code that decides a symbol's signals (relative to the repository root)
+ANALYSIS_SOURCES = ('src/data/sequential_scanner.py', 'src/strategies', 'src/indicators')
+
+
+def analysis_version() -> str:
+    """Digest of all settings + analysis source code (any change invalidates the memo)"""
+    import config.settings as settings
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(vars(settings)):
+        if name.isupper():
+            digest.update(f"{name}={getattr(settings, name)!r};".encode())
+
+    root = Path(__file__).resolve().parents[2]
+    for source in ANALYSIS_SOURCES:
+        path = root / source
+        for file in sorted(path.rglob('*.py')) if path.is_dir() else [path]:
+            if file.exists():
+                digest.update(file.read_bytes())
+
+    return digest.hexdigest()
+
+
+class AnalysisMemo:
+    """
+    Fingerprint -> analysis result cache (one entry per symbol)
+    """
+
+    def __init__(self, cache_dir: str = CACHE_FOLDER, config: Dict = None):
+        """
+        Initialize memo (loads the persisted entries)
+
+        Args:
+            cache_dir: Data cache folder (memo is stored in <cache_dir>/analysis_memo.pkl)
+            config: Dict shaped like ANALYSIS_MEMO_CONFIG (default: settings)
+        """
+        config = config or ANALYSIS_MEMO_CONFIG
+        self.fingerprint_bars = int(config['FINGERPRINT_BARS'])
+        self.max_age_seconds = float(config['MAX_AGE_DAYS']) * 86400
+
+        self.path = Path(cache_dir) / 'analysis_memo.pkl'
+        self.version = analysis_version()
+
+        self._entries: Dict[str, Dict] = self._load()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0
+        }
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading analysis memo: {e}")
+            return {}
+
+    def _hash_frame(self, digest, df: Optional[pd.DataFrame]):
+        if df is None or len(df) == 0:
+            digest.update(b'none;')
+            return
+
+        tail = df.iloc[-self.fingerprint_bars:]
+        columns = [column for column in OHLCV_COLUMNS if column in tail.columns]
+        digest.update(f"{len(df)}:{','.join(columns)};".encode())
+        digest.update(pd.DatetimeIndex(tail.index).asi8.tobytes())
+        digest.update(np.ascontiguousarray(tail[columns].to_numpy(dtype=np.float64)).tobytes())
+
+    def context(self, market_regime: Optional[str]) -> str:
+        """
+        Scan-wide part of every fingerprint (call once per scan)
+
+        Args:
+            market_regime: Current market regime passed to the analyzer
+
+        Returns:
+            Digest of version + regime + Nifty history
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.version};{market_regime};".encode())
+        self._hash_frame(digest, get_benchmark_series().get_history(NIFTY_SYMBOL))
+        return digest.hexdigest()
+
+    def fingerprint(self, daily_df: pd.DataFrame, intraday_df: Optional[pd.DataFrame], context: str) -> str:
+        """
+        Content fingerprint of one symbol's analysis inputs
+
+        Args:
+            daily_df: Daily OHLCV data
+            intraday_df: 15-min OHLCV data (optional)
+            context: Result of context() for this scan
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(context.encode())
+        self._hash_frame(digest, daily_df)
+        self._hash_frame(digest, intraday_df)
+        return digest.hexdigest()
+
+    def get(self, symbol: str, fingerprint: str) -> Optional[Dict]:
+        """
+        Previous analysis result if the fingerprint matches
+
+        Returns:
+            Copy of the {'swing', 'positional'} result (signal timestamps refreshed), or None
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None or entry['fingerprint'] != fingerprint:
+                self.stats['misses'] += 1
+                return None
+
+            self.stats['hits'] += 1
+            entry['used_at'] = time.time()
+            self._dirty = True
+            result = copy.deepcopy(entry['result'])
+
+        now = datetime.now().isoformat()
+        for signal in result.values():
+            if signal is not None:
+                signal['timestamp'] = now
+        return result
+
+    def put(self, symbol: str, fingerprint: str, result: Dict):
+        """Remember a symbol's analysis result"""
+        with self._lock:
+            self._entries[symbol] = {
+                'fingerprint': fingerprint,
+                'result': copy.deepcopy(result),
+                'used_at': time.time()
+            }
+            self._dirty = True
+
+    def save(self):
+        """Persist entries (call at the end of a scan) - symbols unused for MAX_AGE_DAYS are dropped"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            cutoff = time.time() - self.max_age_seconds
+            self._entries = {symbol: entry for symbol, entry in self._entries.items() if entry['used_at'] >= cutoff}
+
+            tmp_path = self.path.with_suffix('.pkl.tmp')
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(self._entries, f)
+                tmp_path.replace(self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"⚠️ Error saving analysis memo: {e}")
+
+    def get_stats(self) -> Dict:
+        """Get memo statistics"""
+        return {**self.stats, 'symbols_cached': len(self._entries)}
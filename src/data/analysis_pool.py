@@ -0,0 +1,180 @@
+"""
+⚙️ ANALYSIS POOL - Per-stock analysis on worker processes (OPT-IN)
+
+The scan loop analyses one stock at a time on one CPU core. With
+ANALYSIS_POOL_CONFIG['ENABLED'] the CPU-bound part (_analyze_stock:
+multi-timeframe analysis, quality checks, signal creation) runs on a
+ProcessPoolExecutor while the main process keeps fetching:
+
+- Tasks carry compact NumPy arrays (int64 index + one array per column),
+  not DataFrames - frames are rebuilt in the worker
+- Workers get the scan's market regime and Nifty history at start-up
+  (no downloads from worker processes)
+- Each task depends only on its own inputs and results are consumed in
+  submission order, so signals are the same for any number of workers
+- A task's console output is captured and printed when its result is consumed
+
+Stateful work stays in the main process: fetching, streaming indicators,
+quality filtering, MQS. One pool per scan (regime / benchmark can change).
+"""
+
+import io
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from config.settings import ANALYSIS_POOL_CONFIG, NIFTY_SYMBOL
+from src.data.benchmark_series import get_benchmark_series
+
+
+def pack_frame(df: Optional[pd.DataFrame]) -> Optional[Dict]:
+    """
+    DataFrame -> dict of NumPy arrays (cheap to pickle, dtypes preserved)
+
+    Args:
+        df: Frame with a DatetimeIndex (or None)
+
+    Returns:
+        Dict with index (int64), unit, tz, name and columns {name: array}, or None
+    """
+    if df is None:
+        return None
+
+    index = pd.DatetimeIndex(df.index)
+    return {
+        'index': index.asi8,
+        'unit': index.unit,
+        'tz': index.tz,
+        'name': index.name,
+        'columns': {column: df[column].to_numpy() for column in df.columns}
+    }
+
+
+def unpack_frame(packed: Optional[Dict]) -> Optional[pd.DataFrame]:
+    """Rebuild a DataFrame packed by pack_frame()"""
+    if packed is None:
+        return None
+
+    index = pd.DatetimeIndex(packed['index'].view(f"datetime64[{packed['unit']}]"), name=packed['name'])
+    if packed['tz'] is not None:
+        index = index.tz_localize('UTC').tz_convert(packed['tz'])
+
+    return pd.DataFrame(packed['columns'], index=index)
+
+
+def pack_indicators(indicators: Optional[Dict]) -> Optional[Dict]:
+    """Pre-computed indicators with their 'df' (if any) packed"""
+    if indicators is None or not isinstance(indicators.get('df'), pd.DataFrame):
+        return indicators
+    return {**indicators, 'df': pack_frame(indicators['df'])}
+
+
+def unpack_indicators(indicators: Optional[Dict]) -> Optional[Dict]:
+    """Inverse of pack_indicators()"""
+    if indicators is None or not isinstance(indicators.get('df'), dict):
+        return indicators
+    return {**indicators, 'df': unpack_frame(indicators['df'])}
+
+
+# Per-process analysis-only scanner (set by _init_worker)
+_worker_scanner = None
+
+
+def _init_worker(current_regime: str, benchmark: Optional[Dict]):
+    """Worker start-up: seed the benchmark cache, build the analyzer"""
+    global _worker_scanner
+
+    # Imported here - sequential_scanner imports this module
+    from src.data.sequential_scanner import SequentialScanner
+
+    if benchmark is not None:
+        get_benchmark_series().seed(NIFTY_SYMBOL, unpack_frame(benchmark))
+
+    with redirect_stdout(io.StringIO()):  # Start-up banners would interleave with the scan log
+        _worker_scanner = SequentialScanner.analysis_only(current_regime)
+
+
+def _analyze_task(symbol: str, daily: Dict, intraday: Optional[Dict], daily_indicators: Optional[Dict]) -> Tuple[Dict, str]:
+    """Worker: analyze one stock, return (signals, captured console output)"""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        signals = _worker_scanner._analyze_stock(
+            symbol,
+            unpack_frame(daily),
+            unpack_frame(intraday),
+            unpack_indicators(daily_indicators)
+        )
+    return signals, output.getvalue()
+
+
+class AnalysisPool:
+    """
+    Process pool running SequentialScanner._analyze_stock
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize analysis pool (workers start in start())
+
+        Args:
+            config: Dict shaped like ANALYSIS_POOL_CONFIG (default: settings)
+        """
+        config = config or ANALYSIS_POOL_CONFIG
+        self.workers = int(config['WORKERS']) or os.cpu_count() or 1
+        self.max_in_flight = max(1, int(config['MAX_IN_FLIGHT']))
+        self.start_method = config.get('START_METHOD')
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.stats = {
+            'tasks': 0,
+            'fallbacks': 0  # Tasks re-run in the main process after a worker failure
+        }
+
+    def start(self, current_regime: str):
+        """
+        Start worker processes for one scan
+
+        Args:
+            current_regime: Market regime passed to every analysis ('BULL', 'SIDEWAYS', 'BEAR')
+        """
+        self.close()
+
+        benchmark = get_benchmark_series().get_history(NIFTY_SYMBOL)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=(current_regime, pack_frame(benchmark))
+        )
+
+    def submit(self, symbol: str, daily_df: pd.DataFrame, intraday_df: Optional[pd.DataFrame],
+               daily_indicators: Optional[Dict] = None) -> Future:
+        """
+        Queue one stock for analysis
+
+        Returns:
+            Future resolving to (signals dict like _analyze_stock, console output)
+        """
+        self.stats['tasks'] += 1
+        return self._executor.submit(
+            _analyze_task,
+            symbol,
+            pack_frame(daily_df),
+            pack_frame(intraday_df),
+            pack_indicators(daily_indicators)
+        )
+
+    def close(self):
+        """Stop worker processes (pending tasks are cancelled)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict:
+        """Get pool statistics"""
+        return {**self.stats, 'workers': self.workers}
@@ -0,0 +1,172 @@
+"""
+📋 ANALYSIS RESULTS - Latest daily indicators per symbol, shared with later consumers
+
+The scanner computes every symbol's daily indicators (panel / streaming, the
+same values as TechnicalIndicators.calculate_all). They are kept here keyed
+by (symbol, last daily bar), so later consumers - the Discord daily summary's
+position outlook - read them instead of re-downloading history and
+recomputing.
+
+Entries are saved to <CACHE_FOLDER>/analysis_results.pkl at the end of each
+scan and loaded on start, so a separate process (RUN.sh daily-summary) reuses
+the continuous loop's results too.
+
+A result is valid for the bar it was computed on. While that bar is still
+forming (stored before MARKET_CLOSE_TIME), it expires after MAX_AGE_MINUTES.
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from config.settings import ANALYSIS_RESULT_CACHE_CONFIG, CACHE_FOLDER, MARKET_CLOSE_TIME
+
+
+def bar_date(value) -> pd.Timestamp:
+    """Calendar day of a daily bar timestamp (tz dropped, midnight)"""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tz is not None:
+        timestamp = timestamp.tz_localize(None)
+    return timestamp.normalize()
+
+
+class AnalysisResultCache:
+    """
+    (symbol, last bar) -> daily indicators
+    """
+
+    def __init__(self, cache_dir: str = CACHE_FOLDER, config: Dict = None):
+        """
+        Initialize cache (loads the persisted entries)
+
+        Args:
+            cache_dir: Data cache folder (results are stored in <cache_dir>/analysis_results.pkl)
+            config: Dict shaped like ANALYSIS_RESULT_CACHE_CONFIG (default: settings)
+        """
+        config = config or ANALYSIS_RESULT_CACHE_CONFIG
+        self.max_age = timedelta(minutes=float(config['MAX_AGE_MINUTES']))
+
+        close_hour, close_minute = (int(part) for part in MARKET_CLOSE_TIME.split(':'))
+        self._close = timedelta(hours=close_hour, minutes=close_minute)
+
+        self.path = Path(cache_dir) / 'analysis_results.pkl'
+        self._entries: Dict[str, Dict] = self._load()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'stored': 0,
+            'hits': 0,
+            'misses': 0
+        }
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading analysis results: {e}")
+            return {}
+
+    def put(self, symbol: str, daily_df: pd.DataFrame, indicators: Dict):
+        """
+        Remember a symbol's indicators for its last daily bar (replaces older bars)
+
+        Args:
+            symbol: Stock symbol
+            daily_df: Daily OHLCV data the indicators were computed on
+            indicators: Daily indicators dict (TechnicalIndicators.calculate_all layout)
+        """
+        if daily_df is None or daily_df.empty or not indicators:
+            return
+
+        with self._lock:
+            self._entries[symbol] = {
+                'bar_date': bar_date(daily_df.index[-1]),
+                'bars': len(daily_df),
+                'indicators': dict(indicators),
+                'stored_at': datetime.now()
+            }
+            self._dirty = True
+            self.stats['stored'] += 1
+
+    def get(self, symbol: str, expected_bar, min_bars: int = 0) -> Optional[Dict]:
+        """
+        Indicators computed on the expected last bar
+
+        Args:
+            symbol: Stock symbol
+            expected_bar: Date of the latest daily bar (e.g. trading_calendar.latest_session())
+            min_bars: History the indicators must have been computed on
+
+        Returns:
+            Copy of the indicators dict, or None (not scanned, older bar, expired or too little history)
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None or entry['bar_date'] != bar_date(expected_bar) or entry['bars'] < min_bars or self._expired(entry):
+                self.stats['misses'] += 1
+                return None
+
+            self.stats['hits'] += 1
+            return dict(entry['indicators'])
+
+    def _expired(self, entry: Dict) -> bool:
+        """Stored while its bar was still forming, and longer ago than MAX_AGE_MINUTES"""
+        final = entry['stored_at'] >= entry['bar_date'].to_pydatetime() + self._close
+        return not final and datetime.now() - entry['stored_at'] > self.max_age
+
+    def save(self):
+        """Persist entries (call at the end of a scan) - merged with the file, the newer entry per symbol wins"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            for symbol, entry in self._load().items():
+                current = self._entries.get(symbol)
+                if current is None or (entry['bar_date'], entry['stored_at']) > (current['bar_date'], current['stored_at']):
+                    self._entries[symbol] = entry
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix='.analysis_results.', suffix='.tmp', dir=self.path.parent)
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        pickle.dump(self._entries, f)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+                self._dirty = False
+            except Exception as e:
+                print(f"⚠️ Error saving analysis results: {e}")
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        return {**self.stats, 'symbols_cached': len(self._entries)}
+
+
+# Singleton instance
+_analysis_results = None
+_analysis_results_lock = threading.Lock()
+
+
+def get_analysis_result_cache() -> AnalysisResultCache:
+    """Get process-wide analysis result cache"""
+    global _analysis_results
+
+    if _analysis_results is None:
+        with _analysis_results_lock:
+            if _analysis_results is None:
+                _analysis_results = AnalysisResultCache()
+
+    return _analysis_results
@@ -0,0 +1,235 @@
+"""
+📈 BENCHMARK SERIES - One cached download per index, shared by every caller
+
+Relative strength (every stock in a scan), market regime detection, sector
+rotation, Nifty returns for MQS... all need the same Nifty 50 history.
+Instead of each downloading it, they ask this service:
+
+- Each symbol is downloaded ONCE per refresh window (or once per scan via refresh())
+- Callers get a slice of the cached history (pandas copy-on-write - the cache can't be modified)
+- Close prices aligned to a stock's date index are memoized as read-only arrays
+
+Thread-safe (one download per symbol even with the pipelined scanner).
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.settings import BENCHMARK_SERIES_CONFIG, NIFTY_SYMBOL
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
+
+
+def _period_offset(period: str) -> Optional[pd.DateOffset]:
+    """'60d' / '3mo' / '1y' -> DateOffset (None for unknown formats)"""
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period or '')
+    if not match:
+        return None
+
+    count, unit = int(match.group(1)), match.group(2)
+    return {
+        'd': pd.DateOffset(days=count),
+        'wk': pd.DateOffset(weeks=count),
+        'mo': pd.DateOffset(months=count),
+        'y': pd.DateOffset(years=count)
+    }[unit]
+
+
+class BenchmarkSeries:
+    """
+    Cached daily history for indices / reference symbols
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize benchmark cache
+
+        Args:
+            config: Dict shaped like BENCHMARK_SERIES_CONFIG (default: settings)
+        """
+        config = config or BENCHMARK_SERIES_CONFIG
+        self.history_period = config['HISTORY_PERIOD']
+        self.refresh_seconds = float(config['REFRESH_MINUTES']) * 60
+
+        self._series: Dict[str, pd.DataFrame] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._aligned: Dict[tuple, np.ndarray] = {}
+
+        self._lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+
+        self.stats = {
+            'downloads': 0,
+            'hits': 0,
+            'failures': 0
+        }
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            if symbol not in self._symbol_locks:
+                self._symbol_locks[symbol] = threading.Lock()
+            return self._symbol_locks[symbol]
+
+    def _is_fresh(self, symbol: str) -> bool:
+        fetched_at = self._fetched_at.get(symbol)
+        return fetched_at is not None and time.monotonic() - fetched_at < self.refresh_seconds
+
+    def _download(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Fetch full HISTORY_PERIOD of daily candles"""
+        import yfinance as yf
+
+        try:
+            ticker = yf.Ticker(symbol)
+            get_rate_limiter().acquire()
+            df = ticker.history(period=self.history_period, interval='1d')
+
+            if df is None or df.empty:
+                return None
+
+            return df
+
+        except Exception as e:
+            if is_rate_limit_error(e):
+                get_rate_limiter().report_rate_limit()
+            return None
+
+    def get_history(self, symbol: str = NIFTY_SYMBOL, period: str = None, days: int = None) -> Optional[pd.DataFrame]:
+        """
+        Get cached daily OHLCV history (downloads at most once per refresh window)
+
+        Args:
+            symbol: Index / reference symbol (default: Nifty 50)
+            period: Limit to a yfinance-style period ('60d', '3mo', '1y')
+            days: Limit to the last N calendar days
+
+        Returns:
+            DataFrame with daily OHLCV data, or None if unavailable
+        """
+        with self._symbol_lock(symbol):
+            if self._is_fresh(symbol):
+                self.stats['hits'] += 1
+            else:
+                df = self._download(symbol)
+                self.stats['downloads'] += 1
+
+                if df is not None:
+                    with self._lock:
+                        self._series[symbol] = df
+                        self._fetched_at[symbol] = time.monotonic()
+                        self._aligned = {key: value for key, value in self._aligned.items() if key[0] != symbol}
+                else:
+                    # Keep serving the previous copy (if any) - retry in a minute, don't hammer a failing symbol
+                    self.stats['failures'] += 1
+                    self._fetched_at[symbol] = time.monotonic() - self.refresh_seconds + min(60.0, self.refresh_seconds)
+
+            df = self._series.get(symbol)
+
+        if df is None or df.empty:
+            return None
+
+        offset = _period_offset(period) if period else None
+        if days is not None:
+            offset = pd.DateOffset(days=days)
+        if offset is not None:
+            df = df[df.index >= df.index[-1] - offset]
+
+        return df
+
+    def get_close_aligned(self, index: pd.Index, symbol: str = NIFTY_SYMBOL) -> Optional[np.ndarray]:
+        """
+        Benchmark Close prices aligned to another series' dates (forward-filled)
+
+        Stocks in a scan share the same trading dates, so the alignment is
+        computed once and the SAME read-only array is handed to every caller.
+
+        Args:
+            index: DatetimeIndex of the stock data
+            symbol: Benchmark symbol (default: Nifty 50)
+
+        Returns:
+            Read-only float array (len(index)), NaN before the benchmark starts
+        """
+        df = self.get_history(symbol)
+        if df is None:
+            return None
+
+        index = pd.DatetimeIndex(index)
+        key = (symbol, str(index.tz), index.asi8.tobytes())
+
+        aligned = self._aligned.get(key)
+        if aligned is None:
+            close = df['Close']
+            if index.tz is not None and close.index.tz is not None:
+                close = close.tz_convert(index.tz)
+            aligned = close.reindex(index, method='ffill').to_numpy(dtype=np.float64, copy=True)
+            aligned.flags.writeable = False
+            with self._lock:
+                self._aligned[key] = aligned
+
+        return aligned
+
+    def get_return(self, symbol: str = NIFTY_SYMBOL, days: int = 20) -> Optional[float]:
+        """
+        Return (%) over the last N trading days
+
+        Args:
+            symbol: Benchmark symbol
+            days: Number of trading days
+
+        Returns:
+            Return percentage or None
+        """
+        df = self.get_history(symbol)
+        if df is None or len(df) < days:
+            return None
+
+        start_price = df['Close'].iloc[-days]
+        end_price = df['Close'].iloc[-1]
+
+        return ((end_price - start_price) / start_price) * 100
+
+    def seed(self, symbol: str, df: pd.DataFrame):
+        """
+        Install a history without downloading (e.g. analysis worker processes get the scan's copy)
+
+        Seeded series never go stale on their own - refresh() drops them.
+        """
+        with self._lock:
+            self._series[symbol] = df
+            self._fetched_at[symbol] = float('inf')
+            self._aligned = {key: value for key, value in self._aligned.items() if key[0] != symbol}
+
+    def refresh(self, symbol: str = None):
+        """Mark cached series stale (next request downloads again) - call once per scan"""
+        with self._lock:
+            for cached_symbol in ([symbol] if symbol else list(self._fetched_at.keys())):
+                self._fetched_at.pop(cached_symbol, None)
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        return {
+            **self.stats,
+            'symbols_cached': len(self._series),
+            'aligned_cached': len(self._aligned)
+        }
+
+
+# Singleton instance
+_benchmark_series = None
+_benchmark_series_lock = threading.Lock()
+
+
+def get_benchmark_series() -> BenchmarkSeries:
+    """Get process-wide benchmark series cache"""
+    global _benchmark_series
+
+    if _benchmark_series is None:
+        with _benchmark_series_lock:
+            if _benchmark_series is None:
+                _benchmark_series = BenchmarkSeries()
+
+    return _benchmark_series
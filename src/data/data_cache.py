@@ -5,25 +5,31 @@ Instead of downloading 60 days of data every 5 minutes,
 we cache historical data and only fetch NEW candles.
 
 Performance improvement: 5 minutes → 30-60 seconds per scan
+
+Storage: columnar OHLCVStore (one memory-mapped panel per interval).
+Old per-symbol pickles are migrated the first time a symbol is read.
 """
 
 import os
 import pickle
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
-import yfinance as yf
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
+from src.data.ohlcv_store import get_ohlcv_store
+
 
 class DataCache:
     """
     Cache historical stock data to disk
 
     Features:
-    - Store daily and 15-min data separately
-    - Only fetch new candles on updates
+    - Store daily and 15-min data separately (one columnar panel per interval)
+    - Only fetch new candles on updates (appended, not re-written)
     - Auto-cleanup old data
+    - Bulk-load the whole universe at scan start
     - Thread-safe (for multi-stock scanning)
     """
 
@@ -37,15 +43,15 @@ class DataCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Separate folders for daily and intraday data
+        # Legacy per-symbol pickle folders (only read for migration)
         self.daily_cache_dir = self.cache_dir / 'daily'
         self.intraday_cache_dir = self.cache_dir / 'intraday'
 
-        self.daily_cache_dir.mkdir(exist_ok=True)
-        self.intraday_cache_dir.mkdir(exist_ok=True)
+        # Columnar store (shared by every DataCache on the same folder)
+        self.store = get_ohlcv_store(str(self.cache_dir / 'columnar'))
 
     def _get_cache_path(self, symbol: str, interval: str) -> Path:
-        """Get cache file path for a symbol"""
+        """Get legacy pickle path for a symbol"""
         clean_symbol = symbol.replace('.', '_')
 
         if interval == '1d':
@@ -61,18 +67,16 @@ class DataCache:
             Dict with 'data' (DataFrame) and 'last_update' (datetime)
             None if not cached
         """
-        cache_path = self._get_cache_path(symbol, interval)
-
-        if not cache_path.exists():
-            return None
+        if not self.store.has(symbol, interval):
+            self._migrate_pickle(symbol, interval)
+            if not self.store.has(symbol, interval):
+                return None
 
         try:
-            with open(cache_path, 'rb') as f:
-                cached = pickle.load(f)
-
-            # Validate cache
-            if 'data' not in cached or 'last_update' not in cached:
-                return None
+            cached = {
+                'data': self.store.get_frame(symbol, interval),
+                'last_update': datetime.fromtimestamp(self.store.last_update(symbol, interval))
+            }
 
             # Check if cache is too old (> 1 day for daily, > 4 hours for intraday)
             # REDUCED from 7 days to 1 day to ensure fresh data
@@ -108,23 +112,46 @@ class DataCache:
             print(f"⚠️ Error loading cache for {symbol}: {e}")
             return None
 
-    def _save_to_cache(self, symbol: str, interval: str, data: pd.DataFrame):
-        """Save data to cache"""
+    def _save_to_cache(self, symbol: str, interval: str, data: pd.DataFrame, keep_after=None) -> Optional[pd.DataFrame]:
+        """
+        Save data to cache
+
+        Args:
+            keep_after: Merge with stored bars and drop anything older than this.
+                        Default: data replaces the stored series.
+
+        Returns:
+            Stored series (merged), or None on error
+        """
+        try:
+            if keep_after is None:
+                keep_after = data.index[0]
+            return self.store.upsert(symbol, interval, data, keep_after=keep_after)
+
+        except Exception as e:
+            print(f"⚠️ Error saving cache for {symbol}: {e}")
+            return None
+
+    def _migrate_pickle(self, symbol: str, interval: str):
+        """Move a legacy per-symbol pickle into the columnar store"""
         cache_path = self._get_cache_path(symbol, interval)
 
+        if not cache_path.exists():
+            return
+
         try:
-            cached = {
-                'data': data,
-                'last_update': datetime.now(),
-                'symbol': symbol,
-                'interval': interval
-            }
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+
+            data = cached.get('data')
+            last_update = cached.get('last_update')
+            if data is not None and len(data) > 0 and last_update is not None:
+                self.store.upsert(symbol, interval, data, last_update=last_update.timestamp())
 
-            with open(cache_path, 'wb') as f:
-                pickle.dump(cached, f)
+            cache_path.unlink()
 
         except Exception as e:
-            print(f"⚠️ Error saving cache for {symbol}: {e}")
+            print(f"⚠️ Error migrating cache for {symbol}: {e}")
 
     def get_data(self, symbol: str, period: str = '60d', interval: str = '1d', force_fresh: bool = False) -> Optional[pd.DataFrame]:
         """
@@ -171,44 +198,20 @@ class DataCache:
                 new_data = self._fetch_new_data(symbol, '2d', interval)
 
             if new_data is not None and len(new_data) > 0:
-                # Merge cached + new data
-                combined = pd.concat([cached_data, new_data])
-
-                # Remove duplicates (keep latest - this ensures fresh data overwrites old)
-                combined = combined[~combined.index.duplicated(keep='last')]
-
-                # Sort by date
-                combined = combined.sort_index()
-
-                # Trim to keep only recent data (60 days for daily, 7 days for intraday)
-                # FIX TIMEZONE BUG: Make cutoff timezone-aware if DataFrame index is timezone-aware
+                # Merge cached + new data in the store:
+                # - Known candles are updated in place (fresh data overwrites old)
+                # - Newer candles are appended
+                # - Trim to keep only recent data (60 days for daily, 7 days for intraday)
                 if interval == '1d':
                     cutoff_days = 60
                 else:
                     cutoff_days = 7
-                
+
                 cutoff = datetime.now() - timedelta(days=cutoff_days)
-                
-                # Check if DataFrame index is timezone-aware
-                if len(combined) > 0 and hasattr(combined.index[0], 'tz') and combined.index[0].tz is not None:
-                    # Make cutoff timezone-aware (use same timezone as DataFrame)
-                    import pytz
-                    tz = combined.index[0].tz
-                    cutoff = pytz.UTC.localize(cutoff) if tz is None else cutoff.replace(tzinfo=tz)
-                
-                # Filter data >= cutoff
-                try:
-                    combined = combined[combined.index >= cutoff]
-                except TypeError:
-                    # If timezone comparison fails, convert DataFrame index to timezone-naive
-                    combined.index = combined.index.tz_localize(None) if hasattr(combined.index[0], 'tz') and combined.index[0].tz is not None else combined.index
-                    cutoff_naive = cutoff.replace(tzinfo=None) if hasattr(cutoff, 'tzinfo') and cutoff.tzinfo is not None else cutoff
-                    combined = combined[combined.index >= cutoff_naive]
-
-                # Update cache with fresh data
-                self._save_to_cache(symbol, interval, combined)
-
-                return combined
+
+                combined = self._save_to_cache(symbol, interval, new_data, keep_after=cutoff)
+
+                return combined if combined is not None else cached_data
             else:
                 # Couldn't fetch new data - check if cached data is recent enough
                 # If cache is > 1 day old, try full fetch
@@ -236,10 +239,13 @@ class DataCache:
 
     def _fetch_new_data(self, symbol: str, period: str, interval: str) -> Optional[pd.DataFrame]:
         """Fetch data from Yahoo Finance with retry logic"""
+        import yfinance as yf
+
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 ticker = yf.Ticker(symbol)
+                get_rate_limiter().acquire()
                 df = ticker.history(period=period, interval=interval)
 
                 if df is None or len(df) == 0:
@@ -259,6 +265,8 @@ class DataCache:
                 return df
 
             except Exception as e:
+                if is_rate_limit_error(e):
+                    get_rate_limiter().report_rate_limit()
                 if attempt < max_retries - 1:
                     import time
                     time.sleep(0.2 * (attempt + 1))  # Exponential backoff
@@ -268,6 +276,22 @@ class DataCache:
         
         return None
 
+    def load_universe(self, symbols: Optional[List[str]] = None, interval: str = '1d') -> Dict[str, pd.DataFrame]:
+        """
+        Bulk-load cached data for many symbols at once (scan start)
+
+        One index read + one memory map for the whole universe - no
+        per-symbol file I/O, no freshness fetch.
+
+        Args:
+            symbols: Symbols to load (default: everything cached)
+            interval: Candle interval
+
+        Returns:
+            Dict of symbol -> DataFrame (only symbols that are cached)
+        """
+        return self.store.load_all(interval, symbols)
+
     def clear_cache(self, symbol: Optional[str] = None):
         """
         Clear cache
@@ -281,28 +305,31 @@ class DataCache:
                 cache_path = self._get_cache_path(symbol, interval)
                 if cache_path.exists():
                     cache_path.unlink()
+                if self.store.has(symbol, interval):
+                    self.store.remove(symbol, interval)
                     print(f"🗑️ Cleared cache for {symbol} ({interval})")
         else:
             # Clear all cache
             import shutil
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self.daily_cache_dir.mkdir(exist_ok=True)
-            self.intraday_cache_dir.mkdir(exist_ok=True)
+            self.store.clear()
             print("🗑️ Cleared all cache")
 
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
-        daily_files = list(self.daily_cache_dir.glob('*.pkl'))
-        intraday_files = list(self.intraday_cache_dir.glob('*.pkl'))
+        store_stats = self.store.get_stats()
+        daily = store_stats.get('1d', {})
+        intraday = [stats for interval, stats in store_stats.items() if interval != '1d']
 
-        total_size = sum(f.stat().st_size for f in daily_files + intraday_files)
+        daily_cached = daily.get('symbols', 0)
+        intraday_cached = sum(stats['symbols'] for stats in intraday)
 
         return {
-            'daily_cached': len(daily_files),
-            'intraday_cached': len(intraday_files),
-            'total_files': len(daily_files) + len(intraday_files),
-            'total_size_mb': total_size / (1024 * 1024)
+            'daily_cached': daily_cached,
+            'intraday_cached': intraday_cached,
+            'total_files': 3 * len(store_stats),  # timestamps + ohlcv + index per interval
+            'total_size_mb': sum(stats['size_mb'] for stats in store_stats.values())
         }
 
 
@@ -5,7 +5,6 @@ Efficient data retrieval with INCREMENTAL caching to reduce API calls
 Performance: Scans 800 stocks in 30-60 seconds instead of 5 minutes!
 """
 
-import yfinance as yf
 import pandas as pd
 import os
 import json
@@ -24,6 +23,7 @@ logging.getLogger('yfinance').setLevel(logging.CRITICAL)
 
 from config.settings import *
 from src.data.data_cache import DataCache
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
 
 
 class DataFetcher:
@@ -109,17 +109,23 @@ class DataFetcher:
         Returns:
             Current price or 0 if failed
         """
+        import yfinance as yf
+
         try:
             ticker = yf.Ticker(symbol)
+            get_rate_limiter().acquire()
             data = ticker.history(period='1d')
 
             if not data.empty:
                 return float(data['Close'].iloc[-1])
             else:
                 # Try fast_info as backup
+                get_rate_limiter().acquire()
                 return float(ticker.fast_info.get('lastPrice', 0))
 
         except Exception as e:
+            if is_rate_limit_error(e):
+                get_rate_limiter().report_rate_limit()
             print(f"❌ Error getting price for {symbol}: {e}")
             return 0
 
@@ -149,9 +155,6 @@ class DataFetcher:
             else:
                 print("❌")
 
-            # Small delay to avoid rate limiting
-            time.sleep(0.1)
-
         print(f"✅ Successfully fetched {len(results)}/{len(symbols)} stocks")
 
         return results
@@ -166,14 +169,13 @@ class DataFetcher:
         - Multiple retry attempts
         - Silent handling of delisted stocks
         """
+        import yfinance as yf
+
         for attempt in range(max_retries):
             try:
-                # Small delay to prevent Yahoo Finance rate limiting
-                # Only delay after first attempt (not on initial try)
-                if attempt > 0:
-                    time.sleep(0.1)  # 100ms delay between requests
-
+                # Pacing is done by the shared rate limiter (no fixed delay)
                 ticker = yf.Ticker(symbol)
+                get_rate_limiter().acquire()
                 df = ticker.history(period=period, interval=interval)
 
                 if not df.empty:
@@ -190,6 +192,8 @@ class DataFetcher:
                     return None
 
                 # Retry on network/rate limit errors
+                if is_rate_limit_error(e):
+                    get_rate_limiter().report_rate_limit()
                 if attempt < max_retries - 1:
                     if "too many requests" in error_msg or "rate limit" in error_msg:
                         wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
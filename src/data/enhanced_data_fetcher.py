@@ -7,16 +7,23 @@ This is THE KEY to making the system work properly!
 Data Strategy:
 - Daily: 75 days (~52 trading days) - Optimal for 50-day MA + positional trading
 - Intraday: 1 day (15-min candles) - Most reliable with yfinance
+
+Incremental daily cache (INCREMENTAL_DAILY_CACHE):
+- First fetch of the trading day downloads the full 75 days and stores it
+- Later scans the same day download only today's daily bar and merge it in
 """
 
-import yfinance as yf
 import pandas as pd
 import time
-from typing import Optional, Dict, Tuple
-from datetime import datetime
+from typing import Optional, Dict, Tuple, List
+from datetime import datetime, timedelta
 import warnings
 import logging
 
+from config.settings import CACHE_FOLDER, INCREMENTAL_DAILY_CACHE
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
+from src.data.data_cache import DataCache
+
 # Suppress warnings
 warnings.filterwarnings('ignore')
 logging.getLogger('yfinance').setLevel(logging.CRITICAL)
@@ -39,11 +46,15 @@ class EnhancedDataFetcher:
         Initialize enhanced data fetcher
 
         Args:
-            api_delay: Delay in seconds between API calls (0.08s = very fast, monitor rate limits)
+            api_delay: Legacy per-stock delay (kept for display - pacing is done by the shared rate limiter)
         """
         self.api_delay = api_delay
-        self.daily_period = '75d'  # 75 days daily data (~52 trading days, enough for 50-MA)
+        self.rate_limiter = get_rate_limiter()  # Process-wide token bucket (replaces fixed sleeps)
+        self.daily_days = 75
+        self.daily_period = f'{self.daily_days}d'  # 75 days daily data (~52 trading days, enough for 50-MA)
+        self.daily_update_period = '1d'  # Warm cache: only today's daily bar
         self.intraday_period = '1d'  # 1 day 15-min data (most reliable)
+        self.cache = DataCache(cache_dir=CACHE_FOLDER) if INCREMENTAL_DAILY_CACHE else None
         self.stats = {
             'total_attempts': 0,
             'successful': 0,
@@ -51,7 +62,11 @@ class EnhancedDataFetcher:
             'daily_fetched': 0,
             'intraday_fetched': 0,
             'rate_limits': 0,  # Track rate limit hits
-            'retries': 0  # Track retry attempts
+            'retries': 0,  # Track retry attempts
+            'batch_requests': 0,  # Chunk downloads (one paced request per symbol each)
+            'batch_fallbacks': 0,  # Chunks that fell back to per-symbol fetching
+            'daily_full': 0,  # Full daily history downloads
+            'daily_incremental': 0  # Today's bar merged into cached history
         }
 
     def get_stock_data_dual(self, symbol: str, verbose: bool = True) -> Dict:
@@ -87,29 +102,8 @@ class EnhancedDataFetcher:
                 daily_df = self._normalize_columns(daily_df)
                 
                 # ✅ DATA FRESHNESS CHECK: Verify data is recent
-                latest_date = daily_df.index[-1]
-                if hasattr(latest_date, 'date'):
-                    latest_date_only = latest_date.date()
-                else:
-                    latest_date_only = latest_date
-                
-                # Check data freshness (warn if > 2 days old)
-                import pytz
-                IST = pytz.timezone('Asia/Kolkata')
-                today = datetime.now(IST).date()
-                
-                if isinstance(latest_date_only, datetime):
-                    latest_date_only = latest_date_only.date()
-                
-                days_old = (today - latest_date_only).days
-                
-                # Warn if data is > 2 days old (might be stale)
-                if days_old > 2:
-                    if verbose:
-                        print(f"   ⚠️ {symbol}: Data is {days_old} days old (latest: {latest_date_only}) - might be stale!")
-                elif verbose and days_old == 0:
-                    print(f"   ✅ {symbol}: Using TODAY's data (fresh!)")
-                
+                self._check_freshness(symbol, daily_df, verbose=verbose)
+
                 result['daily'] = daily_df
                 self.stats['daily_fetched'] += 1
             else:
@@ -119,9 +113,6 @@ class EnhancedDataFetcher:
                     print(f"   ⚠️ {symbol}: Failed to fetch daily data")
                 return result
 
-            # Small delay before intraday request (reduced - same stock, faster)
-            time.sleep(self.api_delay * 0.5)  # 50% of delay (same stock = less risk)
-
             # STEP 2: Fetch today's 15-MINUTE data (for intraday signals)
             intraday_df = self._fetch_intraday_data(symbol, verbose=verbose)
 
@@ -148,10 +139,226 @@ class EnhancedDataFetcher:
 
         return result
 
+    def get_stock_data_batch(self, symbols: List[str], chunk_size: int = 50, verbose: bool = False) -> Dict[str, Dict]:
+        """
+        Fetch daily AND 15-minute data for many stocks, a chunk at a time
+
+        Yahoo has no multi-symbol history endpoint (yf.download() makes one
+        chart request per ticker), so a chunk still costs one daily and one
+        15-min request per stock - each paced by the shared rate limiter. What
+        the chunk saves is the per-symbol retry / sleep overhead, and a warm
+        daily cache turns the daily request into a 1-day update. Chunks whose
+        daily download fails completely fall back to get_stock_data_dual().
+
+        Args:
+            symbols: List of stock symbols
+            chunk_size: Number of symbols per chunk
+            verbose: Show fetch failures (default: False)
+
+        Returns:
+            Dict of symbol -> same result dict as get_stock_data_dual()
+        """
+        results = {}
+        chunk_size = max(1, chunk_size)
+
+        for start in range(0, len(symbols), chunk_size):
+            chunk = symbols[start:start + chunk_size]
+            chunk_results = self._fetch_chunk(chunk, verbose=verbose)
+
+            if chunk_results is None:
+                # Whole chunk failed - use the safe per-symbol path
+                self.stats['batch_fallbacks'] += 1
+                if verbose:
+                    print(f"   🔄 Batch of {len(chunk)} failed - falling back to per-symbol fetch")
+                for symbol in chunk:
+                    results[symbol] = self.get_stock_data_dual(symbol, verbose=verbose)
+            else:
+                results.update(chunk_results)
+
+        return results
+
+    def _fetch_chunk(self, symbols: List[str], verbose: bool = False) -> Optional[Dict[str, Dict]]:
+        """
+        Download one chunk of symbols (daily + 15-min) and split per symbol
+
+        Returns:
+            Dict of symbol -> result dict, or None if the daily download failed
+        """
+        # Warm symbols (history already synced today) only need today's bar
+        warm = [symbol for symbol in symbols if self._is_daily_cache_warm(symbol)]
+        warm_set = set(warm)
+        cold = [symbol for symbol in symbols if symbol not in warm_set]
+
+        daily_cold = None
+        if cold:
+            daily_cold = self._download_batch(cold, period=self.daily_period, interval='1d')
+            if daily_cold is None:
+                return None
+
+        # Cached history from today is still usable if the update request fails
+        daily_warm = self._download_batch(warm, period=self.daily_update_period, interval='1d') if warm else None
+
+        # Intraday is optional (market closed / no data) - don't fail the chunk
+        intraday_all = self._download_batch(symbols, period=self.intraday_period, interval='15m')
+
+        results = {}
+        for symbol in symbols:
+            self.stats['total_attempts'] += 1
+            result = {
+                'symbol': symbol,
+                'daily': None,
+                'intraday': None,
+                'success': False
+            }
+
+            if symbol not in warm_set:
+                daily_df = self._split_batch(daily_cold, symbol)
+                if daily_df is not None and len(daily_df) >= 30:
+                    daily_df = self._store_daily(symbol, daily_df, full=True)
+            else:
+                daily_df = self._store_daily(symbol, self._split_batch(daily_warm, symbol), full=False)
+
+            if daily_df is None or len(daily_df) < 30:
+                self.stats['failed'] += 1
+                if verbose:
+                    print(f"   ⚠️ {symbol}: Failed to fetch daily data")
+                results[symbol] = result
+                continue
+
+            daily_df = self._normalize_columns(daily_df)
+            self._check_freshness(symbol, daily_df, verbose=verbose)
+            result['daily'] = daily_df
+            self.stats['daily_fetched'] += 1
+
+            intraday_df = self._split_batch(intraday_all, symbol)
+            if intraday_df is not None:
+                result['intraday'] = self._normalize_columns(intraday_df)
+                self.stats['intraday_fetched'] += 1
+            elif verbose:
+                print(f"   ⚠️ {symbol}: Intraday data unavailable (market closed or no data)")
+
+            result['success'] = True
+            self.stats['successful'] += 1
+            results[symbol] = result
+
+        return results
+
+    def _download_batch(self, symbols: List[str], period: str, interval: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Candles for a list of symbols - one Ticker.history() request per symbol
+
+        Same requests as yf.download(), but every symbol takes its own rate
+        limiter token and a 429 on any of them is reported (yf.download()
+        swallows per-ticker errors into its log).
+
+        Returns:
+            Dict of symbol -> OHLCV frame (symbols without data left out), or None if nothing came back
+        """
+        import yfinance as yf
+
+        self.stats['batch_requests'] += 1
+        frames = {}
+        for symbol in symbols:
+            try:
+                self.rate_limiter.acquire()
+                df = yf.Ticker(symbol).history(period=period, interval=interval, auto_adjust=True)
+                if df is not None and not df.empty:
+                    frames[symbol] = df
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()  # Slows the remaining symbols of the chunk too
+
+        return frames or None
+
+    def _split_batch(self, batch: Optional[Dict[str, pd.DataFrame]], symbol: str) -> Optional[pd.DataFrame]:
+        """Extract one symbol's OHLCV frame from a chunk download"""
+        if batch is None:
+            return None
+
+        df = batch.get(symbol)
+        if df is None:
+            return None
+
+        df = df.dropna(how='all')
+        if 'Close' in df.columns:
+            df = df[df['Close'].notna()]
+
+        return df if not df.empty else None
+
+    def _check_freshness(self, symbol: str, daily_df: pd.DataFrame, verbose: bool = True):
+        """Warn if the latest daily candle is more than 2 days old"""
+        latest_date = daily_df.index[-1]
+        if hasattr(latest_date, 'date'):
+            latest_date_only = latest_date.date()
+        else:
+            latest_date_only = latest_date
+
+        # Check data freshness (warn if > 2 days old)
+        import pytz
+        IST = pytz.timezone('Asia/Kolkata')
+        today = datetime.now(IST).date()
+
+        if isinstance(latest_date_only, datetime):
+            latest_date_only = latest_date_only.date()
+
+        days_old = (today - latest_date_only).days
+
+        # Warn if data is > 2 days old (might be stale)
+        if days_old > 2:
+            if verbose:
+                print(f"   ⚠️ {symbol}: Data is {days_old} days old (latest: {latest_date_only}) - might be stale!")
+        elif verbose and days_old == 0:
+            print(f"   ✅ {symbol}: Using TODAY's data (fresh!)")
+
+    def _is_daily_cache_warm(self, symbol: str) -> bool:
+        """True if the cached daily history was synced today (IST) and is long enough"""
+        if self.cache is None:
+            return False
+
+        last_update = self.cache.store.last_update(symbol, '1d')
+        if last_update is None:
+            return False
+
+        import pytz
+        IST = pytz.timezone('Asia/Kolkata')
+        if datetime.fromtimestamp(last_update, IST).date() != datetime.now(IST).date():
+            return False  # New trading day - refetch full history once (splits/dividend adjustments)
+
+        timestamps, _ = self.cache.store.get_arrays(symbol, '1d')
+        return len(timestamps) >= 30
+
+    def _store_daily(self, symbol: str, df: Optional[pd.DataFrame], full: bool) -> Optional[pd.DataFrame]:
+        """
+        Merge fetched daily bars into the incremental cache
+
+        Args:
+            df: Full history (full=True) or today's bar(s) (full=False, may be None)
+
+        Returns:
+            Complete daily history (cached + new), or df if caching is off
+        """
+        if self.cache is None:
+            return df
+
+        if df is not None and not df.empty:
+            keep_after = df.index[0] if full else datetime.now() - timedelta(days=self.daily_days)
+            merged = self.cache._save_to_cache(symbol, '1d', self._normalize_columns(df), keep_after=keep_after)
+            if merged is not None:
+                self.stats['daily_full' if full else 'daily_incremental'] += 1
+                return merged
+            return df if full else None
+
+        # Update failed - history from earlier today is still good
+        return None if full else self.cache.store.get_frame(symbol, '1d')
+
     def _fetch_daily_data(self, symbol: str, max_retries: int = 2, verbose: bool = True) -> Optional[pd.DataFrame]:
         """
         Fetch 60-90 days of DAILY data (configurable)
 
+        With a warm incremental cache only today's bar is downloaded and
+        merged into the cached history.
+
         Args:
             symbol: Stock symbol
             max_retries: Number of retry attempts
@@ -160,6 +367,10 @@ class EnhancedDataFetcher:
         Returns:
             DataFrame with daily OHLCV data
         """
+        import yfinance as yf
+
+        warm = self._is_daily_cache_warm(symbol)
+
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
@@ -169,23 +380,30 @@ class EnhancedDataFetcher:
 
                 # Let yfinance handle its own session (newer versions require curl_cffi)
                 ticker = yf.Ticker(symbol)
+                self.rate_limiter.acquire()
 
-                # Fetch daily data (3mo = ~90 days, reliable with yfinance)
-                df = ticker.history(period=self.daily_period, interval='1d')
+                # Fetch daily data (full history, or just today's bar when the cache is warm)
+                df = ticker.history(period=self.daily_update_period if warm else self.daily_period, interval='1d')
+
+                if warm and not df.empty:
+                    return self._store_daily(symbol, df, full=False)
 
                 if not df.empty and len(df) >= 30:  # Need at least 30 days
-                    return df
+                    return self._store_daily(symbol, df, full=True)
 
             except Exception as e:
-                error_msg = str(e).lower()
-                if 'rate limit' in error_msg or 'too many requests' in error_msg or '429' in error_msg or 'forbidden' in error_msg:
+                if is_rate_limit_error(e):
                     self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()
                     if verbose and attempt == max_retries - 1:  # Only show on final failure
                         print(f"   🚨 {symbol}: RATE LIMIT on daily fetch - Too fast! (Total rate limits: {self.stats['rate_limits']})")
                 if attempt > 0:
                     self.stats['retries'] += 1
                 continue
 
+        if warm:
+            return self._store_daily(symbol, None, full=False)
+
         return None
 
     def _fetch_intraday_data(self, symbol: str, max_retries: int = 2, verbose: bool = True) -> Optional[pd.DataFrame]:
@@ -200,6 +418,8 @@ class EnhancedDataFetcher:
         Returns:
             DataFrame with 15-min OHLCV data
         """
+        import yfinance as yf
+
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
@@ -209,6 +429,7 @@ class EnhancedDataFetcher:
 
                 # Let yfinance handle its own session (newer versions require curl_cffi)
                 ticker = yf.Ticker(symbol)
+                self.rate_limiter.acquire()
 
                 # Fetch 1 day of 15-min data (most reliable with yfinance)
                 df = ticker.history(period=self.intraday_period, interval='15m')
@@ -219,9 +440,9 @@ class EnhancedDataFetcher:
                     return df
 
             except Exception as e:
-                error_msg = str(e).lower()
-                if 'rate limit' in error_msg or 'too many requests' in error_msg or '429' in error_msg or 'forbidden' in error_msg:
+                if is_rate_limit_error(e):
                     self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()
                     if verbose and attempt == max_retries - 1:  # Only show on final failure
                         print(f"   🚨 {symbol}: RATE LIMIT on intraday fetch - Too fast! (Total rate limits: {self.stats['rate_limits']})")
                 if attempt > 0:
@@ -287,12 +508,15 @@ class EnhancedDataFetcher:
         Returns:
             Current price or 0 if failed
         """
+        import yfinance as yf
+
         try:
             # Let yfinance handle its own session (newer versions require curl_cffi)
             ticker = yf.Ticker(symbol)
 
             # Method 1: Try fast_info.lastPrice (REAL-TIME - most accurate during market hours)
             try:
+                self.rate_limiter.acquire()
                 fast_info = ticker.fast_info
                 # Try lastPrice first (most current)
                 if hasattr(fast_info, 'lastPrice') and fast_info.lastPrice and fast_info.lastPrice > 0:
@@ -300,39 +524,50 @@ class EnhancedDataFetcher:
                 # Try regularMarketPrice as alternative
                 if hasattr(fast_info, 'regularMarketPrice') and fast_info.regularMarketPrice and fast_info.regularMarketPrice > 0:
                     return float(fast_info.regularMarketPrice)
-            except:
-                pass
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()
             
             # Method 2: Try intraday data (1-minute - MOST RECENT candle)
             try:
                 # 1-minute data is most current (updates every minute)
+                self.rate_limiter.acquire()
                 intraday_data = ticker.history(period='1d', interval='1m')
                 if not intraday_data.empty and len(intraday_data) > 0:
                     latest_price = float(intraday_data['Close'].iloc[-1])
                     if latest_price > 0:
                         return latest_price
-            except:
-                pass
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()
             
             # Method 3: Fallback to 5-minute data
             try:
+                self.rate_limiter.acquire()
                 intraday_data = ticker.history(period='1d', interval='5m')
                 if not intraday_data.empty and len(intraday_data) > 0:
                     latest_price = float(intraday_data['Close'].iloc[-1])
                     if latest_price > 0:
                         return latest_price
-            except:
-                pass
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()
             
             # Method 4: Fallback to daily data (last close - when market closed)
             try:
+                self.rate_limiter.acquire()
                 daily_data = ticker.history(period='1d', interval='1d')
                 if not daily_data.empty and len(daily_data) > 0:
                     latest_price = float(daily_data['Close'].iloc[-1])
                     if latest_price > 0:
                         return latest_price
-            except:
-                pass
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    self.stats['rate_limits'] += 1
+                    self.rate_limiter.report_rate_limit()
 
             return 0
 
@@ -350,7 +585,9 @@ class EnhancedDataFetcher:
             'failed': self.stats['failed'],
             'success_rate': success_rate,
             'daily_fetched': self.stats['daily_fetched'],
-            'intraday_fetched': self.stats['intraday_fetched']
+            'intraday_fetched': self.stats['intraday_fetched'],
+            'daily_full': self.stats['daily_full'],
+            'daily_incremental': self.stats['daily_incremental']
         }
 
     def print_stats(self):
@@ -363,6 +600,8 @@ class EnhancedDataFetcher:
         print(f"   📈 Success Rate: {stats['success_rate']:.1f}%")
         print(f"   📅 Daily Data: {stats['daily_fetched']} stocks")
         print(f"   ⏱️ Intraday Data: {stats['intraday_fetched']} stocks")
+        if self.cache is not None:
+            print(f"   💾 Daily History: {stats['daily_full']} full | {stats['daily_incremental']} incremental (today's bar only)")
 
 
 def test_enhanced_fetcher():
@@ -2,14 +2,15 @@
 Nifty 50 Data Fetcher
 
 For relative strength calculations (stock vs market)
+Backed by the shared benchmark series cache (no separate Nifty download)
 """
 
 import pandas as pd
-import yfinance as yf
-from datetime import datetime, timedelta
 import logging
 from typing import Optional
 
+from src.data.benchmark_series import get_benchmark_series
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,8 +21,6 @@ class NiftyDataFetcher:
 
     def __init__(self):
         self.nifty_symbol = "^NSEI"  # Nifty 50 index
-        self.cache = {}
-        self.cache_timestamp = None
 
     def get_nifty_data(self, days: int = 60) -> Optional[pd.DataFrame]:
         """
@@ -34,27 +33,13 @@ class NiftyDataFetcher:
             DataFrame with Nifty OHLCV data
         """
         try:
-            # Check cache (refresh every hour)
-            if (self.cache_timestamp and
-                (datetime.now() - self.cache_timestamp).seconds < 3600 and
-                'data' in self.cache):
-                return self.cache['data']
-
-            # Fetch from yfinance
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days + 10)  # Extra buffer
+            # Shared benchmark cache (refreshed by the scanner / every few minutes)
+            df = get_benchmark_series().get_history(self.nifty_symbol, days=days + 10)  # Extra buffer
 
-            nifty = yf.Ticker(self.nifty_symbol)
-            df = nifty.history(start=start_date, end=end_date)
-
-            if df.empty:
+            if df is None or df.empty:
                 logger.warning("No Nifty data fetched")
                 return None
 
-            # Cache it
-            self.cache['data'] = df
-            self.cache_timestamp = datetime.now()
-
             return df
 
         except Exception as e:
@@ -0,0 +1,594 @@
+"""
+🗄️ COLUMNAR OHLCV STORE - One memory-mapped panel per interval
+
+Replaces the one-pickle-per-symbol layout of DataCache. For each interval
+(1d, 15m, ...) the store keeps:
+
+    <root>/<interval>/timestamps.<gen>.bin  int64 (ns, UTC for tz-aware data)
+    <root>/<interval>/ohlcv.<gen>.bin       float64 rows x 5 (open, high, low, close, volume)
+    <root>/<interval>/index.json            symbol -> segments [(row, length)], tz, last_update
+
+- New candles are APPENDED (bars already on disk are updated in place)
+- Reads are numpy views over the memory map (zero-copy for the last N bars)
+- The whole universe loads from ONE index + ONE map (well under a second for 1000 symbols)
+- Dead rows / fragmented symbols are compacted into a new generation of files
+  (checked whenever a dirty index is flushed: during a scan and at exit)
+
+Thread-safe within a process. Across processes (continuous loop + a
+--daily-summary run) ONE process writes: the first one that needs to write
+takes <root>/writer.lock (flock) for its lifetime. Any other process opens
+the store read-only - it re-reads an index that changed on disk, and its
+upserts are merged in memory only. Index writes / compaction (writer,
+exclusive) and index reloads (readers, shared) lock <interval>/index.lock,
+so a reader never maps a generation compaction just deleted.
+"""
+
+import atexit
+import json
+from contextlib import contextmanager
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import OHLCV_STORE_CONFIG
+
+try:
+    import fcntl
+except ImportError:  # Windows - no advisory locks (one process per cache directory)
+    fcntl = None
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+@contextmanager
+def _file_lock(path: Path, exclusive: bool):
+    """flock on a lock file (no-op without fcntl)"""
+    if fcntl is None:
+        yield
+        return
+    with open(path, 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class _IntervalPanel:
+    """Files + index for a single interval"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = directory / 'index.json'
+        self.lock_path = directory / 'index.lock'
+
+        self.generation = 0
+        self.symbols: Dict[str, Dict] = {}
+        self._ts_map = None
+        self._val_map = None
+        self.dirty = False
+        self.index_mtime = None
+
+        self.reload()
+
+    def reload(self):
+        """Re-read the index and map its generation (shared lock - compaction can't delete the files meanwhile)"""
+        with _file_lock(self.lock_path, exclusive=False):
+            self.index_mtime = self._index_mtime()
+            self._load_index()
+            self.invalidate_maps()
+            self.maps()
+
+    def _index_mtime(self) -> Optional[int]:
+        try:
+            return self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def stale(self) -> bool:
+        """index.json was rewritten by another process since it was loaded"""
+        return self._index_mtime() != self.index_mtime
+
+    # ---------- files ----------
+
+    def _ts_path(self, generation: int = None) -> Path:
+        return self.directory / f"timestamps.{self.generation if generation is None else generation}.bin"
+
+    def _val_path(self, generation: int = None) -> Path:
+        return self.directory / f"ohlcv.{self.generation if generation is None else generation}.bin"
+
+    def _load_index(self):
+        self.generation = 0
+        self.symbols = {}
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            self.generation = index.get('generation', 0)
+            self.symbols = index.get('symbols', {})
+        except Exception as e:
+            print(f"⚠️ Error loading OHLCV index {self.index_path}: {e}")
+            self.generation = 0
+            self.symbols = {}
+
+    def write_index(self):
+        """Atomically replace index.json (caller holds the exclusive index lock)"""
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'generation': self.generation, 'symbols': self.symbols}, f)
+        os.replace(tmp_path, self.index_path)
+        self.index_mtime = self._index_mtime()
+        self.dirty = False
+
+    def rows_on_disk(self) -> int:
+        # Complete rows in both files (a reader can look while the writer is appending)
+        paths = (self._ts_path(), self._val_path())
+        if not all(path.exists() for path in paths):
+            return 0
+        return min(paths[0].stat().st_size // 8, paths[1].stat().st_size // (8 * len(OHLCV_COLUMNS)))
+
+    def maps(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Read-only memory maps of the current generation (re-opened after writes)"""
+        if self._ts_map is None:
+            rows = self.rows_on_disk()
+            if rows == 0:
+                self._ts_map = np.empty(0, dtype=np.int64)
+                self._val_map = np.empty((0, len(OHLCV_COLUMNS)), dtype=np.float64)
+            else:
+                self._ts_map = np.memmap(self._ts_path(), dtype=np.int64, mode='r', shape=(rows,))
+                self._val_map = np.memmap(self._val_path(), dtype=np.float64, mode='r',
+                                          shape=(rows, len(OHLCV_COLUMNS)))
+        return self._ts_map, self._val_map
+
+    def invalidate_maps(self):
+        self._ts_map = None
+        self._val_map = None
+
+    def append_rows(self, ts: np.ndarray, values: np.ndarray) -> int:
+        """Append rows to the end of the files, return the first row number"""
+        start = self.rows_on_disk()
+        with open(self._ts_path(), 'ab') as f:
+            f.write(np.ascontiguousarray(ts, dtype=np.int64).tobytes())
+        with open(self._val_path(), 'ab') as f:
+            f.write(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+        self.invalidate_maps()
+        return start
+
+    def overwrite_rows(self, rows: np.ndarray, values: np.ndarray):
+        """Update OHLCV values of existing rows in place (same timestamps)"""
+        val_map = np.memmap(self._val_path(), dtype=np.float64, mode='r+',
+                            shape=(self.rows_on_disk(), len(OHLCV_COLUMNS)))
+        val_map[rows] = values
+        val_map.flush()
+        del val_map
+        self.invalidate_maps()
+
+    # ---------- symbols ----------
+
+    def row_numbers(self, symbol: str) -> np.ndarray:
+        entry = self.symbols.get(symbol)
+        if not entry or not entry['segments']:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(start, start + length, dtype=np.int64)
+                               for start, length in entry['segments']])
+
+    def read(self, symbol: str, last_n: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, values) for a symbol - views when the bars are contiguous"""
+        entry = self.symbols.get(symbol)
+        ts_map, val_map = self.maps()
+
+        if not entry or not entry['segments']:
+            return ts_map[:0], val_map[:0]
+
+        segments = entry['segments']
+        tail_start, tail_length = segments[-1]
+        if len(segments) == 1 or (last_n is not None and last_n <= tail_length):
+            take = tail_length if last_n is None else min(last_n, tail_length)
+            end = tail_start + tail_length
+            return ts_map[end - take:end], val_map[end - take:end]
+
+        rows = self.row_numbers(symbol)
+        if last_n is not None:
+            rows = rows[-last_n:]
+        return ts_map[rows], val_map[rows]
+
+    def live_rows(self) -> int:
+        return sum(length for entry in self.symbols.values() for _, length in entry['segments'])
+
+
+class OHLCVStore:
+    """
+    Columnar, append-only OHLCV storage shared by all symbols
+    """
+
+    def __init__(self, root: str = 'data/cache/columnar', config: Dict = None):
+        """
+        Initialize store
+
+        Args:
+            root: Directory for the panels (one sub-folder per interval)
+            config: Dict shaped like OHLCV_STORE_CONFIG (default: settings)
+        """
+        config = config or OHLCV_STORE_CONFIG
+        self.max_segments = int(config['MAX_SEGMENTS_PER_SYMBOL'])
+        self.compact_garbage_ratio = float(config['COMPACT_GARBAGE_RATIO'])
+        self.index_flush_seconds = float(config['INDEX_FLUSH_SECONDS'])
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        self._panels: Dict[str, _IntervalPanel] = {}
+        self._lock = threading.RLock()
+        self._last_flush = time.monotonic()
+
+        self._writer_lock = None  # Open <root>/writer.lock while this process is the writer
+        self.read_only = fcntl is not None  # Until the first write makes this process the writer
+
+        atexit.register(self.flush)
+
+    def _panel(self, interval: str) -> _IntervalPanel:
+        panel = self._panels.get(interval)
+        if panel is None:
+            panel = _IntervalPanel(self.root / interval)
+            self._panels[interval] = panel
+        elif self.read_only and panel.stale():
+            panel.reload()  # The writer process changed it
+        return panel
+
+    def _become_writer(self) -> bool:
+        """Take the cross-process writer lock (held until exit) - False if another process writes"""
+        if not self.read_only:
+            return True
+
+        lock = open(self.root / 'writer.lock', 'a')
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return False
+
+        self._writer_lock = lock
+        self.read_only = False
+        for panel in self._panels.values():
+            panel.reload()  # Start from what the previous writer left
+        return True
+
+    # ---------- conversion ----------
+
+    @staticmethod
+    def _to_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, Optional[str]]:
+        """DataFrame -> (int64 ns timestamps, float64 OHLCV, tz name)"""
+        lower = {str(c).lower(): c for c in df.columns}
+        missing = [c for c in OHLCV_COLUMNS if c not in lower]
+        if missing:
+            raise ValueError(f"missing columns {missing}")
+
+        index = pd.DatetimeIndex(df.index)
+        tz = str(index.tz) if index.tz is not None else None
+        if tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+
+        ts = index.as_unit('ns').asi8.astype(np.int64, copy=True)
+        values = df[[lower[c] for c in OHLCV_COLUMNS]].to_numpy(dtype=np.float64, copy=True)
+
+        order = np.argsort(ts, kind='stable')
+        ts, values = ts[order], values[order]
+
+        # Keep the LAST row for duplicate timestamps
+        keep = np.append(ts[1:] != ts[:-1], True) if len(ts) else np.empty(0, dtype=bool)
+        return ts[keep], values[keep], tz
+
+    @staticmethod
+    def _to_frame(ts: np.ndarray, values: np.ndarray, tz: Optional[str]) -> pd.DataFrame:
+        index = pd.DatetimeIndex(np.asarray(ts).view('datetime64[ns]'))
+        if tz is not None:
+            index = index.tz_localize('UTC').tz_convert(tz)
+        return pd.DataFrame(np.array(values), index=index, columns=OHLCV_COLUMNS)
+
+    # ---------- reads ----------
+
+    def has(self, symbol: str, interval: str) -> bool:
+        with self._lock:
+            return symbol in self._panel(interval).symbols
+
+    def last_update(self, symbol: str, interval: str) -> Optional[float]:
+        """Epoch seconds of the last write for a symbol (None if not stored)"""
+        with self._lock:
+            entry = self._panel(interval).symbols.get(symbol)
+            return entry['last_update'] if entry else None
+
+    def get_arrays(self, symbol: str, interval: str, last_n: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Raw (timestamps, OHLCV) arrays for a symbol
+
+        Zero-copy read-only views into the memory map when the requested
+        bars are contiguous on disk (always true after compaction).
+        """
+        with self._lock:
+            return self._panel(interval).read(symbol, last_n)
+
+    def get_frame(self, symbol: str, interval: str, last_n: int = None) -> Optional[pd.DataFrame]:
+        """DataFrame (lowercase OHLCV columns) for a symbol, None if not stored"""
+        with self._lock:
+            panel = self._panel(interval)
+            entry = panel.symbols.get(symbol)
+            if entry is None:
+                return None
+            ts, values = panel.read(symbol, last_n)
+            return self._to_frame(ts, values, entry.get('tz'))
+
+    def load_all(self, interval: str, symbols: List[str] = None, last_n: int = None) -> Dict[str, pd.DataFrame]:
+        """
+        Bulk-load the universe in one pass (one index, one memory map)
+
+        Args:
+            interval: Candle interval
+            symbols: Restrict to these symbols (default: everything stored)
+            last_n: Only the last N bars per symbol
+        """
+        with self._lock:
+            panel = self._panel(interval)
+            wanted = panel.symbols.keys() if symbols is None else [s for s in symbols if s in panel.symbols]
+            frames = {}
+            for symbol in wanted:
+                ts, values = panel.read(symbol, last_n)
+                frames[symbol] = self._to_frame(ts, values, panel.symbols[symbol].get('tz'))
+            return frames
+
+    def symbols(self, interval: str) -> List[str]:
+        with self._lock:
+            return list(self._panel(interval).symbols.keys())
+
+    # ---------- writes ----------
+
+    def upsert(self, symbol: str, interval: str, df: pd.DataFrame, keep_after: pd.Timestamp = None,
+               last_update: float = None) -> Optional[pd.DataFrame]:
+        """
+        Merge new candles into the stored series
+
+        Bars with a known timestamp are updated in place, newer bars are
+        appended. Anything else (gap fills, a different timezone) rewrites the
+        symbol as a fresh segment.
+
+        Args:
+            symbol: Stock symbol
+            interval: Candle interval
+            df: New candles (OHLCV columns, any case)
+            keep_after: Drop stored bars older than this
+            last_update: Epoch seconds to record (default: now)
+
+        Returns:
+            The merged series as a DataFrame
+        """
+        ts_new, values_new, tz = self._to_arrays(df)
+
+        with self._lock:
+            if not self._become_writer():
+                return self._merge_in_memory(symbol, interval, ts_new, values_new, tz, keep_after)
+
+            panel = self._panel(interval)
+            entry = panel.symbols.get(symbol)
+
+            if entry is not None and entry.get('tz') != tz:
+                entry = None  # Timezone changed - rewrite
+
+            rows = panel.row_numbers(symbol) if entry is not None else np.empty(0, dtype=np.int64)
+            ts_map, _ = panel.maps()
+            ts_old = ts_map[rows] if len(rows) else np.empty(0, dtype=np.int64)
+
+            # Trim old bars from the head (only shortens the first segments - no rewrite)
+            segments = [list(s) for s in entry['segments']] if entry is not None else []
+            if keep_after is not None:
+                cutoff = self._cutoff_ns(keep_after, tz)
+                drop = int(np.searchsorted(ts_old, cutoff, side='left'))
+                segments = self._drop_head(segments, drop)
+                rows, ts_old = rows[drop:], ts_old[drop:]
+                keep_new = ts_new >= cutoff
+                ts_new, values_new = ts_new[keep_new], values_new[keep_new]
+
+            position = np.searchsorted(ts_old, ts_new, side='left')
+            known = position < len(ts_old)
+            known[known] = ts_old[position[known]] == ts_new[known]
+            newer = ts_new > (ts_old[-1] if len(ts_old) else np.iinfo(np.int64).min)
+
+            if np.all(known | newer):
+                if known.any():
+                    panel.overwrite_rows(rows[position[known]], values_new[known])
+                if newer.any():
+                    start = panel.append_rows(ts_new[newer], values_new[newer])
+                    segments.append([start, int(newer.sum())])
+            else:
+                # Out-of-order bars - write the merged series as one new segment
+                merged = pd.concat([self._to_frame(ts_old, panel.maps()[1][rows], tz),
+                                    self._to_frame(ts_new, values_new, tz)])
+                merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+                ts_all, values_all, _ = self._to_arrays(merged)
+                start = panel.append_rows(ts_all, values_all)
+                segments = [[start, len(ts_all)]]
+
+            panel.symbols[symbol] = {
+                'segments': segments,
+                'tz': tz,
+                'last_update': time.time() if last_update is None else last_update
+            }
+            panel.dirty = True
+
+            if len(segments) > self.max_segments:
+                self._compact(panel)
+            else:
+                self._maybe_flush()
+
+            return self.get_frame(symbol, interval)
+
+    def _merge_in_memory(self, symbol: str, interval: str, ts_new: np.ndarray, values_new: np.ndarray,
+                         tz: Optional[str], keep_after) -> pd.DataFrame:
+        """upsert() result for a read-only process - the stored series with the new candles, nothing written"""
+        panel = self._panel(interval)
+        entry = panel.symbols.get(symbol)
+        if entry is not None and entry.get('tz') == tz:
+            ts_old, values_old = panel.read(symbol)
+            merged = pd.concat([self._to_frame(ts_old, values_old, tz), self._to_frame(ts_new, values_new, tz)])
+        else:
+            merged = self._to_frame(ts_new, values_new, tz)
+        merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+
+        if keep_after is not None:
+            ts_all, values_all, _ = self._to_arrays(merged)
+            keep = ts_all >= self._cutoff_ns(keep_after, tz)
+            merged = self._to_frame(ts_all[keep], values_all[keep], tz)
+        return merged
+
+    @staticmethod
+    def _cutoff_ns(keep_after, tz: Optional[str]) -> int:
+        cutoff = pd.Timestamp(keep_after)
+        if tz is not None:
+            cutoff = cutoff.tz_localize(tz) if cutoff.tz is None else cutoff
+            cutoff = cutoff.tz_convert('UTC').tz_localize(None)
+        elif cutoff.tz is not None:
+            cutoff = cutoff.tz_localize(None)
+        return int(cutoff.as_unit('ns').value)
+
+    @staticmethod
+    def _drop_head(segments: List[List[int]], drop: int) -> List[List[int]]:
+        while drop > 0 and segments:
+            start, length = segments[0]
+            if length <= drop:
+                segments.pop(0)
+                drop -= length
+            else:
+                segments[0] = [start + drop, length - drop]
+                drop = 0
+        return segments
+
+    def remove(self, symbol: str, interval: str = None):
+        """Forget a symbol (rows become garbage until the next compaction)"""
+        with self._lock:
+            if not self._become_writer():
+                print(f"⚠️ OHLCV store {self.root} is written by another process - {symbol} not removed")
+                return
+            intervals = [interval] if interval else self.intervals()
+            for name in intervals:
+                panel = self._panel(name)
+                if panel.symbols.pop(symbol, None) is not None:
+                    panel.dirty = True
+            self.flush()
+
+    def clear(self):
+        """Delete every panel"""
+        import shutil
+        with self._lock:
+            if not self._become_writer():
+                print(f"⚠️ OHLCV store {self.root} is written by another process - not cleared")
+                return
+            self._panels.clear()
+            shutil.rmtree(self.root, ignore_errors=True)
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def intervals(self) -> List[str]:
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    # ---------- maintenance ----------
+
+    def _compact(self, panel: _IntervalPanel):
+        """Rewrite a panel so every symbol is one contiguous segment"""
+        old_generation = panel.generation
+        new_generation = old_generation + 1
+        ts_map, val_map = panel.maps()
+
+        new_symbols = {}
+        offset = 0
+        with open(panel._ts_path(new_generation), 'wb') as ts_file, \
+                open(panel._val_path(new_generation), 'wb') as val_file:
+            for symbol, entry in panel.symbols.items():
+                rows = panel.row_numbers(symbol)
+                ts_file.write(np.ascontiguousarray(ts_map[rows]).tobytes())
+                val_file.write(np.ascontiguousarray(val_map[rows]).tobytes())
+                new_symbols[symbol] = {**entry, 'segments': [[offset, len(rows)]] if len(rows) else []}
+                offset += len(rows)
+
+        # Switch generations under the exclusive lock - readers reload index + maps under the shared one
+        with _file_lock(panel.lock_path, exclusive=True):
+            panel.generation = new_generation
+            panel.symbols = new_symbols
+            panel.invalidate_maps()
+            panel.write_index()
+
+            for path in (panel._ts_path(old_generation), panel._val_path(old_generation)):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _garbage_ratio(panel: _IntervalPanel) -> float:
+        """Share of the rows on disk no symbol points to (trimmed / rewritten / removed)"""
+        on_disk = panel.rows_on_disk()
+        return 1.0 - panel.live_rows() / on_disk if on_disk else 0.0
+
+    def compact(self, interval: str = None, force: bool = False):
+        """Compact panels with too much dead space (or all of them if force=True)"""
+        with self._lock:
+            if not self._become_writer():
+                return
+            for name in ([interval] if interval else self.intervals()):
+                panel = self._panel(name)
+                if panel.rows_on_disk() == 0:
+                    continue
+                if force or self._garbage_ratio(panel) > self.compact_garbage_ratio:
+                    self._compact(panel)
+
+    def _maybe_flush(self):
+        if time.monotonic() - self._last_flush >= self.index_flush_seconds:
+            self.flush()
+
+    def flush(self):
+        """Persist dirty indexes (also runs at exit) - panels over COMPACT_GARBAGE_RATIO are compacted instead"""
+        with self._lock:
+            for panel in self._panels.values():
+                if panel.dirty and not self.read_only:
+                    try:
+                        if self._garbage_ratio(panel) > self.compact_garbage_ratio:
+                            self._compact(panel)  # Writes the index too
+                        else:
+                            with _file_lock(panel.lock_path, exclusive=True):
+                                panel.write_index()
+                    except Exception as e:
+                        print(f"⚠️ Error writing OHLCV index {panel.index_path}: {e}")
+            self._last_flush = time.monotonic()
+
+    def get_stats(self) -> Dict:
+        """Per-interval symbol / row counts and size on disk"""
+        with self._lock:
+            stats = {}
+            for name in self.intervals():
+                panel = self._panel(name)
+                size = sum(f.stat().st_size for f in panel.directory.iterdir() if f.is_file())
+                stats[name] = {
+                    'symbols': len(panel.symbols),
+                    'live_rows': panel.live_rows(),
+                    'rows_on_disk': panel.rows_on_disk(),
+                    'size_mb': size / (1024 * 1024)
+                }
+            return stats
+
+
+# One store per directory in a process (two instances on the same files would overwrite each other's index)
+_stores: Dict[str, OHLCVStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ohlcv_store(root: str = 'data/cache/columnar') -> OHLCVStore:
+    """Get the shared OHLCV store for a directory"""
+    key = str(Path(root).resolve())
+
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = OHLCVStore(root)
+        return _stores[key]
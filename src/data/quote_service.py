@@ -0,0 +1,210 @@
+"""
+💹 QUOTE SERVICE - Live prices for ALL held symbols in one call
+
+Position monitoring (every 2 minutes) and the daily summary need the
+latest price of every open position. Instead of every caller walking the
+fallback chain itself (fast_info -> 1m -> 5m -> daily), get_prices() does:
+
+1. Cache: quotes younger than QUOTE_SERVICE_CONFIG['TTL_SECONDS'] are reused
+2. 'fast_info': real-time price per missing symbol (same first choice as before)
+3. '1m': last 1-minute close for symbols fast_info missed
+4. '1d': last daily close for anything still missing
+
+Yahoo has no multi-symbol quote / history endpoint, so every tier is one
+request per symbol; each takes its own rate limiter token and reports 429s.
+Each quote records the tier it came from (see get_quote() / get_stats()).
+Thread-safe (the scanner and the exit monitor can ask at the same time).
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from config.settings import QUOTE_SERVICE_CONFIG
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
+
+
+class QuoteService:
+    """
+    TTL-cached live quotes for many symbols
+    """
+
+    TIERS = ('fast_info', '1m', '1d')
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize quote service
+
+        Args:
+            config: Dict shaped like QUOTE_SERVICE_CONFIG (default: settings)
+        """
+        config = config or QUOTE_SERVICE_CONFIG
+        self.ttl_seconds = float(config['TTL_SECONDS'])
+        self.candle_fallback = bool(config['CANDLE_FALLBACK'])
+
+        self.rate_limiter = get_rate_limiter()
+        self._quotes: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()  # One fetch per service - concurrent callers reuse its quotes
+
+        self.stats = {
+            'requests': 0,  # get_prices() calls
+            'cache_hits': 0,
+            'yahoo_requests': 0,  # One per symbol per tier tried
+            'rate_limits': 0,
+            'misses': 0,
+            'tiers': {tier: 0 for tier in self.TIERS}
+        }
+
+    def _request(self, fetch, *args):
+        """One paced Yahoo request (429s slow the shared limiter down) - None on failure"""
+        try:
+            self.stats['yahoo_requests'] += 1
+            self.rate_limiter.acquire()
+            return fetch(*args)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.stats['rate_limits'] += 1
+                self.rate_limiter.report_rate_limit()
+            return None
+
+    @staticmethod
+    def _fast_info_price(symbol: str) -> float:
+        """Real-time price"""
+        import yfinance as yf
+
+        fast_info = yf.Ticker(symbol).fast_info
+        for attr in ('lastPrice', 'regularMarketPrice'):
+            price = getattr(fast_info, attr, None)
+            if price and price > 0:
+                return float(price)
+        return 0
+
+    @staticmethod
+    def _last_close(symbol: str, period: str, interval: str) -> float:
+        """Latest candle close"""
+        import yfinance as yf
+
+        close = yf.Ticker(symbol).history(period=period, interval=interval)['Close'].dropna()
+        return float(close.iloc[-1]) if not close.empty else 0
+
+    def _fetch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Walk the fallback tiers for symbols without a fresh quote"""
+        quotes = {}
+
+        for symbol in symbols:
+            tiers = [('fast_info', self._fast_info_price, (symbol,))]
+            if self.candle_fallback:
+                tiers += [('1m', self._last_close, (symbol, '1d', '1m')),
+                          ('1d', self._last_close, (symbol, '5d', '1d'))]
+
+            for tier, fetch, args in tiers:
+                price = self._request(fetch, *args)
+                if price and price > 0:
+                    quotes[symbol] = {'price': float(price), 'tier': tier}
+                    break
+
+        return quotes
+
+    def get_prices(self, symbols: List[str], max_age: float = None) -> Dict[str, float]:
+        """
+        Latest prices for many symbols (Yahoo is only asked for what isn't cached)
+
+        Args:
+            symbols: Stock symbols
+            max_age: Override TTL (seconds) for this call - 0 forces a refresh
+
+        Returns:
+            Dict {symbol: price}; symbols with no price are left out
+        """
+        symbols = list(dict.fromkeys(symbols))  # De-duplicate, keep order
+        if not symbols:
+            return {}
+
+        ttl = self.ttl_seconds if max_age is None else max_age
+        self.stats['requests'] += 1
+
+        with self._fetch_lock:
+            now = time.monotonic()
+            with self._lock:
+                cached = {
+                    symbol: quote for symbol in symbols
+                    if (quote := self._quotes.get(symbol)) is not None and now - quote['fetched_at'] < ttl
+                }
+            self.stats['cache_hits'] += len(cached)
+
+            missing = [symbol for symbol in symbols if symbol not in cached]
+            fetched = self._fetch(missing) if missing else {}
+
+            fetched_at = time.monotonic()
+            with self._lock:
+                for symbol, quote in fetched.items():
+                    quote['fetched_at'] = fetched_at
+                    self._quotes[symbol] = quote
+                    self.stats['tiers'][quote['tier']] += 1
+
+        self.stats['misses'] += len(missing) - len(fetched)
+
+        return {
+            symbol: quote['price']
+            for symbol in symbols
+            if (quote := cached.get(symbol) or fetched.get(symbol)) is not None
+        }
+
+    def get_price(self, symbol: str) -> float:
+        """Latest price for one symbol (0 if unavailable)"""
+        return self.get_prices([symbol]).get(symbol, 0)
+
+    def get_quote(self, symbol: str) -> Optional[Dict]:
+        """
+        Cached quote details
+
+        Returns:
+            Dict with price, tier ('fast_info' / '1m' / '1d') and age_seconds, or None
+        """
+        with self._lock:
+            quote = self._quotes.get(symbol)
+            if quote is None:
+                return None
+            return {
+                'price': quote['price'],
+                'tier': quote['tier'],
+                'age_seconds': time.monotonic() - quote['fetched_at']
+            }
+
+    def invalidate(self, symbols: List[str] = None):
+        """Drop cached quotes (all if symbols is None)"""
+        with self._lock:
+            if symbols is None:
+                self._quotes.clear()
+            else:
+                for symbol in symbols:
+                    self._quotes.pop(symbol, None)
+
+    def get_stats(self) -> Dict:
+        """Get quote statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'tiers': dict(self.stats['tiers']),
+                'symbols_cached': len(self._quotes)
+            }
+
+
+# Singleton instance
+_quote_service = None
+_quote_service_lock = threading.Lock()
+
+
+def get_quote_service() -> QuoteService:
+    """Get process-wide quote service"""
+    global _quote_service
+
+    if _quote_service is None:
+        with _quote_service_lock:
+            if _quote_service is None:
+                _quote_service = QuoteService()
+
+    return _quote_service
@@ -0,0 +1,135 @@
+"""
+🚦 RATE LIMITER - One token bucket shared by every Yahoo Finance caller
+
+Every yfinance request in the process (scanner, portfolio prices, regime
+detection, sector rotation, relative strength, Discord outlook...) takes a
+token from the SAME bucket before hitting the network.
+
+- Bursts up to YAHOO_RATE_LIMIT_CONFIG['BURST'] requests back-to-back
+- Refills at 'REQUESTS_PER_SECOND' in steady state
+- On a 429: rate is cut by 'BACKOFF_FACTOR' and the bucket is drained
+- After a quiet period the rate climbs back up to the configured maximum
+
+Thread-safe (usable from the pipelined scanner and the exit monitor).
+"""
+
+import threading
+import time
+from typing import Dict
+
+from config.settings import YAHOO_RATE_LIMIT_CONFIG
+
+
+def is_rate_limit_error(error) -> bool:
+    """Check if an exception/message looks like a Yahoo rate limit (429)"""
+    error_msg = str(error).lower()
+    return ('rate limit' in error_msg or 'too many requests' in error_msg or
+            '429' in error_msg or 'forbidden' in error_msg)
+
+
+class TokenBucketRateLimiter:
+    """
+    Adaptive token bucket (AIMD: multiplicative decrease, additive recovery)
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            config: Dict shaped like YAHOO_RATE_LIMIT_CONFIG (default: settings)
+        """
+        config = config or YAHOO_RATE_LIMIT_CONFIG
+        self.max_rate = float(config['REQUESTS_PER_SECOND'])
+        self.min_rate = float(config['MIN_REQUESTS_PER_SECOND'])
+        self.burst = float(config['BURST'])
+        self.backoff_factor = float(config['BACKOFF_FACTOR'])
+        self.recovery_delay = float(config['RECOVERY_DELAY_SECONDS'])
+        self.recovery_per_second = float(config['RECOVERY_PER_MINUTE']) / 60.0
+
+        self.rate = self.max_rate
+        self.tokens = self.burst
+        self.last_refill = time.monotonic()
+        self.last_rate_limit = None
+
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,  # Requests that had to wait for a token
+            'wait_seconds': 0.0,
+            'rate_limits': 0
+        }
+
+    def _refill(self, now: float):
+        """Add tokens for elapsed time and recover the rate after a quiet period"""
+        elapsed = now - self.last_refill
+        self.last_refill = now
+
+        if (self.rate < self.max_rate and self.last_rate_limit is not None and
+                now - self.last_rate_limit >= self.recovery_delay):
+            self.rate = min(self.max_rate, self.rate + self.recovery_per_second * elapsed)
+
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available
+
+        Tokens are reserved under the lock (the bucket may go negative), so
+        concurrent callers queue up fairly instead of racing.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+            self.stats['requests'] += 1
+            if wait > 0:
+                self.stats['throttled'] += 1
+                self.stats['wait_seconds'] += wait
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    def report_rate_limit(self):
+        """Called when Yahoo answers 429 - slow down and drain the bucket"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+            self.tokens = min(self.tokens, 0.0)
+            self.last_rate_limit = now
+            self.stats['rate_limits'] += 1
+
+    def get_stats(self) -> Dict:
+        """Get limiter statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'current_rate': round(self.rate, 2),
+                'max_rate': self.max_rate,
+                'burst': self.burst
+            }
+
+
+# Singleton instance
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucketRateLimiter:
+    """Get process-wide Yahoo Finance rate limiter"""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = TokenBucketRateLimiter()
+
+    return _rate_limiter
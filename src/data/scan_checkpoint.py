@@ -0,0 +1,141 @@
+"""
+📍 SCAN CHECKPOINT - Resume a long universe scan after a crash / restart
+
+scan_all_stocks() over 1000 symbols takes minutes. If the process dies
+halfway, the next run used to start again from symbol 1 (re-fetching and
+re-analysing everything). Now the scan cursor and the per-symbol results so
+far (qualified signals + stats) are written to disk every
+SCAN_CHECKPOINT_CONFIG['EVERY_SYMBOLS'] symbols (temp file + atomic rename).
+
+A new scan resumes from the checkpoint when it is for the same universe,
+from the same day and younger than MAX_AGE_MINUTES (same scan window);
+otherwise it starts fresh. A completed scan deletes its checkpoint.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.settings import SCAN_CHECKPOINT_CONFIG
+
+
+class ScanCheckpoint:
+    """
+    Cursor + partial results of the scan in progress
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize checkpoint
+
+        Args:
+            config: Dict shaped like SCAN_CHECKPOINT_CONFIG (default: settings)
+        """
+        config = config or SCAN_CHECKPOINT_CONFIG
+        self.path = config['PATH']
+        self.every_symbols = max(1, int(config['EVERY_SYMBOLS']))
+        self.max_age_seconds = float(config['MAX_AGE_MINUTES']) * 60
+
+        self._universe = None
+        self._started_at = None
+        self._last_cursor = 0
+
+    @staticmethod
+    def _universe_digest(stocks: List[str]) -> str:
+        return hashlib.blake2b('\n'.join(stocks).encode(), digest_size=16).hexdigest()
+
+    def _load(self) -> Optional[Dict]:
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading scan checkpoint (starting fresh): {e}")
+            return None
+
+    def begin(self, stocks: List[str]) -> Optional[Dict]:
+        """
+        Start a scan - returns the state to resume from, if there is a usable checkpoint
+
+        Args:
+            stocks: Full scan universe (in scan order)
+
+        Returns:
+            Dict with cursor (symbols already done), swing_signals, positional_signals,
+            stats, started_at and saved_at - or None to start from the first symbol
+        """
+        self._universe = self._universe_digest(stocks)
+        self._started_at = datetime.now().isoformat()
+        self._last_cursor = 0
+
+        state = self._load()
+        if state is None:
+            return None
+
+        saved_at = datetime.fromisoformat(state['saved_at'])
+        usable = (state.get('universe') == self._universe and
+                  saved_at.date() == datetime.now().date() and
+                  time.time() - saved_at.timestamp() <= self.max_age_seconds and
+                  0 < state['cursor'] < len(stocks))
+
+        if not usable:
+            self.clear()
+            return None
+
+        self._started_at = state['started_at']
+        self._last_cursor = state['cursor']
+        return state
+
+    def update(self, cursor: int, swing_signals: List[Dict], positional_signals: List[Dict], stats: Dict):
+        """
+        Record progress (written every EVERY_SYMBOLS symbols)
+
+        Args:
+            cursor: Number of symbols fully processed
+            swing_signals: Qualified swing signals so far
+            positional_signals: Qualified positional signals so far
+            stats: Scan statistics so far
+        """
+        if self._universe is None or cursor - self._last_cursor < self.every_symbols:
+            return
+
+        state = {
+            'universe': self._universe,
+            'cursor': cursor,
+            'swing_signals': swing_signals,
+            'positional_signals': positional_signals,
+            'stats': stats,
+            'started_at': self._started_at,
+            'saved_at': datetime.now().isoformat()
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._last_cursor = cursor
+        except Exception as e:
+            print(f"\n⚠️ Error saving scan checkpoint: {e}")
+
+    def complete(self):
+        """Scan finished - nothing to resume"""
+        self.clear()
+        self._universe = None
+
+    def clear(self):
+        """Delete the checkpoint file"""
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            print(f"⚠️ Error removing scan checkpoint: {e}")
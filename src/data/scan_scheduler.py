@@ -0,0 +1,203 @@
+"""
+🗓️ SCAN SCHEDULER - Closest-to-qualifying symbols first, within a request budget
+
+scan_all_stocks() walks the universe in market-cap order every cycle, so a
+symbol that just missed a signal threshold waits as long as one that is
+nowhere close. The scheduler keeps each symbol's outcome from its last scan
+and picks the symbols for the next cycle:
+
+- HOT: held positions, watchlist, setup found last time, or setup distance
+  (SetupPreFilter.distance) <= HOT_DISTANCE - due every cycle
+- WARM: distance <= WARM_DISTANCE (or unknown) - due every WARM_EVERY_CYCLES
+- COLD: further away - due every COLD_EVERY_CYCLES (never-scanned symbols are due at once)
+
+Held / watchlist symbols are always scanned - even beyond the budget or when
+they are not in the universe. Due symbols fill the rest of the budget, most
+overdue first (cycles since last scan / tier interval; ties HOT -> WARM ->
+COLD, then closest), until SCAN_SCHEDULER_CONFIG['REQUESTS_PER_CYCLE'] is used
+up; spare budget goes to the most overdue remaining symbols. The selection is
+scanned in universe order, so batched downloads and the scan checkpoint work unchanged.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from config.settings import SCAN_SCHEDULER_CONFIG
+
+HOT = 'HOT'
+WARM = 'WARM'
+COLD = 'COLD'
+TIER_RANK = {HOT: 0, WARM: 1, COLD: 2}
+
+# Yahoo requests to scan one symbol (daily + 15m)
+REQUESTS_PER_SYMBOL = 2
+
+
+class ScanScheduler:
+    """
+    Per-symbol tiers (persisted) -> symbols to scan this cycle
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize scheduler (loads the persisted tiers)
+
+        Args:
+            config: Dict shaped like SCAN_SCHEDULER_CONFIG (default: settings)
+        """
+        config = config or SCAN_SCHEDULER_CONFIG
+        self.requests_per_cycle = int(config['REQUESTS_PER_CYCLE'])
+        self.hot_distance = float(config['HOT_DISTANCE'])
+        self.warm_distance = float(config['WARM_DISTANCE'])
+        self.every_cycles = {HOT: 1, WARM: max(1, int(config['WARM_EVERY_CYCLES'])),
+                             COLD: max(1, int(config['COLD_EVERY_CYCLES']))}
+        self.watchlist = set(config.get('WATCHLIST', []))
+        self.path = config['STATE_FILE']
+
+        state = self._load()
+        self.cycle = state.get('cycle', 0)
+        self.symbols: Dict[str, Dict] = state.get('symbols', {})
+
+        self.last_selection = {}
+
+    def _load(self) -> Dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading scan scheduler state (all symbols due): {e}")
+            return {}
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'cycle': self.cycle, 'saved_at': datetime.now().isoformat(), 'symbols': self.symbols}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ Error saving scan scheduler state: {e}")
+
+    def symbol_budget(self) -> int:
+        """Symbols that fit in REQUESTS_PER_CYCLE (0 = no cap)"""
+        if self.requests_per_cycle <= 0:
+            return 0
+        # Same request estimate as scan_all_stocks: 2 Yahoo requests (daily + 15m) per stock, batched or not -
+        # a warm daily cache only shortens the daily request to today's bar, it doesn't skip it
+        return max(1, self.requests_per_cycle // REQUESTS_PER_SYMBOL)
+
+    def tier(self, symbol: str, priority: Iterable[str] = ()) -> str:
+        """Current tier of a symbol (held / watchlist symbols are always HOT)"""
+        if symbol in self.watchlist or symbol in priority:
+            return HOT
+        return self.symbols.get(symbol, {}).get('tier', COLD)
+
+    def select(self, stocks: List[str], priority: Iterable[str] = ()) -> List[str]:
+        """
+        Pick the symbols to scan this cycle
+
+        Args:
+            stocks: Full universe (in scan order)
+            priority: Symbols to treat as HOT (e.g. held positions)
+
+        Returns:
+            Selected symbols, in universe order (pinned symbols outside the universe last)
+        """
+        priority = set(priority)
+        cycle = self.cycle + 1
+        pinned = self.watchlist | priority
+        extra = sorted(pinned.difference(stocks))  # e.g. a held stock that dropped out of the universe
+
+        def overdue(symbol, tier):
+            last_cycle = self.symbols.get(symbol, {}).get('last_cycle')
+            if last_cycle is None:
+                return float('inf')
+            return (cycle - last_cycle) / self.every_cycles[tier]
+
+        ranked = []
+        for position, symbol in enumerate(stocks + extra):
+            tier = self.tier(symbol, priority)
+            distance = self.symbols.get(symbol, {}).get('distance')
+            ranked.append((symbol not in pinned, overdue(symbol, tier) < 1.0, -overdue(symbol, tier), TIER_RANK[tier],
+                           distance if distance is not None else float('inf'), position, symbol, tier))
+
+        # Held / watchlist first (never cut), then due before not-due, most overdue (relative to the tier's
+        # interval), HOT -> WARM -> COLD, closest, universe order - a HOT tier larger than the budget can't
+        # starve the others
+        ranked.sort()
+        pinned_count = sum(1 for entry in ranked if not entry[0])
+        budget = self.symbol_budget()
+        remainder = max(0, budget - pinned_count) if budget else len(ranked)
+        chosen = ranked[:pinned_count + remainder]
+        selected = {entry[6] for entry in chosen}
+
+        counts = {HOT: 0, WARM: 0, COLD: 0}
+        for entry in chosen:
+            counts[entry[7]] += 1
+        self.last_selection = {
+            'cycle': cycle,
+            'universe': len(stocks),
+            'selected': len(selected),
+            'due': sum(1 for entry in ranked if not entry[1]),
+            'tiers': counts
+        }
+
+        return [symbol for symbol in stocks + extra if symbol in selected]
+
+    def record(self, symbol_status: Dict[str, Dict]):
+        """
+        Update tiers from a finished scan (call once per cycle, after select())
+
+        Args:
+            symbol_status: {symbol: {'status': 'qualified' | 'setup' | 'no_setup' | 'no_data' | 'error',
+                            'distance': setup distance or None}} from scan_all_stocks
+        """
+        self.cycle += 1
+
+        for symbol, outcome in symbol_status.items():
+            entry = self.symbols.setdefault(symbol, {'tier': WARM, 'distance': None})
+            entry['last_cycle'] = self.cycle
+            entry['status'] = outcome['status']
+
+            if outcome['status'] in ('qualified', 'setup'):
+                entry['distance'] = 0.0
+            elif outcome['status'] == 'no_setup' and outcome.get('distance') is not None:
+                entry['distance'] = outcome['distance']
+            elif outcome['status'] != 'no_setup':
+                continue  # No data / error: keep the previous tier, retry when due
+
+            # (No distance - unchanged bars or no indicators: the previous distance still applies)
+            distance = entry['distance']
+            if distance is None:
+                entry['tier'] = WARM
+            elif distance <= self.hot_distance:
+                entry['tier'] = HOT
+            elif distance <= self.warm_distance:
+                entry['tier'] = WARM
+            else:
+                entry['tier'] = COLD
+
+        self._save()
+
+    def print_selection(self):
+        """Print what select() picked"""
+        selection = self.last_selection
+        if not selection:
+            return
+        tiers = selection['tiers']
+        print(f"🗓️ Scan scheduler (cycle {selection['cycle']}): {selection['selected']}/{selection['universe']} stocks "
+              f"({selection['due']} due) - HOT {tiers[HOT]} | WARM {tiers[WARM]} | COLD {tiers[COLD]}")
+
+    def get_stats(self) -> Dict:
+        """Get scheduler statistics"""
+        tiers = {HOT: 0, WARM: 0, COLD: 0}
+        for entry in self.symbols.values():
+            tiers[entry.get('tier', COLD)] += 1
+        return {'cycle': self.cycle, 'symbols_tracked': len(self.symbols), 'tiers': tiers,
+                'symbol_budget': self.symbol_budget(), 'last_selection': dict(self.last_selection)}
@@ -4,15 +4,48 @@ Scans stocks sequentially with proper delays (NO threads, NO API ban!)
 
 Perfect for intraday scanning every 10 minutes.
 Supports any number of stocks (currently configured for Top 1000).
+
+Optional PIPELINED mode (PIPELINED_SCAN_ENABLED): a small bounded thread pool
+prefetches the next symbols' data while the current one is analysed.
+Analysis itself stays one-by-one; every fetch still goes through the shared
+rate limiter, so the API budget is unchanged.
+
+Optional ANALYSIS POOL (ANALYSIS_POOL_CONFIG): per-stock analysis runs on
+worker processes ahead of the scan loop; results are consumed in scan order.
+
+ANALYSIS MEMO (ANALYSIS_MEMO_CONFIG): symbols whose bars are unchanged since
+their last analysis reuse the previous result instead of being re-analysed.
+
+SETUP PRE-FILTER (SETUP_PREFILTER_CONFIG): cheap vectorized gates on the latest
+indicator values drop symbols that cannot become a swing/positional setup
+before the expensive analysis runs.
+
+SCAN CHECKPOINT (SCAN_CHECKPOINT_CONFIG): progress is checkpointed to disk and
+a restarted scan in the same scan window resumes where the last one stopped.
+
+Each scanned stock's outcome (qualified / setup / no setup + distance to the
+setup gates) is returned in 'symbol_status' for the SCAN SCHEDULER
+(SCAN_SCHEDULER_CONFIG), which picks the stocks of the next cycles.
 """
 
+import io
 import time
 import pandas as pd
+from collections import deque
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator, Optional
 from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-from src.strategies.signal_generator import SignalGenerator
+from src.data.analysis_pool import AnalysisPool
+from src.data.analysis_memo import AnalysisMemo
+from src.data.analysis_results import get_analysis_result_cache
+from src.data.scan_checkpoint import ScanCheckpoint
+from src.data.benchmark_series import get_benchmark_series
+from src.indicators.panel_indicators import PanelIndicators
+from src.indicators.streaming_indicators import get_streaming_engine
 from src.strategies.multitimeframe_analyzer import MultiTimeframeAnalyzer
+from src.strategies.setup_prefilter import SetupPreFilter
 from src.strategies.market_regime_detector import MarketRegimeDetector
 from src.strategies.sector_rotation_tracker import SectorRotationTracker
 from src.strategies.bank_nifty_adjuster import BankNiftyAdjuster
@@ -37,11 +70,17 @@ class SequentialScanner:
         Initialize sequential scanner
 
         Args:
-            api_delay: Delay between each stock (0.08s = very fast, monitor for rate limits)
+            api_delay: Legacy per-stock delay (pacing is now done by the shared rate limiter)
         """
         self.data_fetcher = EnhancedDataFetcher(api_delay=api_delay)
-        self.signal_generator = SignalGenerator()
         self.mtf_analyzer = MultiTimeframeAnalyzer()
+        self.panel_indicators = PanelIndicators() if PANEL_INDICATORS_ENABLED else None  # Batch-wide daily indicators
+        self.streaming_indicators = get_streaming_engine() if STREAMING_INDICATORS_ENABLED else None  # Per-stock O(1) updates
+        self.analysis_memo = AnalysisMemo() if ANALYSIS_MEMO_CONFIG['ENABLED'] else None  # Skip unchanged symbols
+        self._memo_context = None
+        self.analysis_results = get_analysis_result_cache() if ANALYSIS_RESULT_CACHE_CONFIG['ENABLED'] else None  # Shared with the Discord outlook
+        self.prefilter = SetupPreFilter() if SETUP_PREFILTER_CONFIG['ENABLED'] else None  # Cheap gates before full analysis
+        self.checkpoint = ScanCheckpoint() if SCAN_CHECKPOINT_CONFIG['ENABLED'] else None  # Resume after crash / restart
         self.api_delay = api_delay
 
         # Market Regime Detection (Professional Feature)
@@ -64,8 +103,14 @@ class SequentialScanner:
         self.mqs_integrator = get_mqs_integrator() if self.use_mqs else None
         self.mqs_min_threshold = MQS_MIN_THRESHOLD
 
-        print(f"🚀 Sequential Scanner initialized (NO threads, 100% safe, OPTIMIZED)")
-        print(f"⏱️ API delay: {api_delay}s between stocks (optimized for speed)")
+        if PIPELINED_SCAN_ENABLED:
+            print(f"🚀 Sequential Scanner initialized (PIPELINED fetch, {PIPELINE_FETCH_WORKERS} workers, OPTIMIZED)")
+        else:
+            print(f"🚀 Sequential Scanner initialized (NO threads, 100% safe, OPTIMIZED)")
+        if ANALYSIS_POOL_CONFIG['ENABLED']:
+            print(f"⚙️ Analysis pool: ENABLED ✅ ({ANALYSIS_POOL_CONFIG['WORKERS'] or 'one per CPU'} worker processes)")
+        print(f"🚦 Rate limiter: {YAHOO_RATE_LIMIT_CONFIG['REQUESTS_PER_SECOND']} req/s "
+              f"(burst {YAHOO_RATE_LIMIT_CONFIG['BURST']}, shared by all Yahoo callers)")
 
         # Feature status
         if MARKET_REGIME_DETECTION_ENABLED:
@@ -88,6 +133,30 @@ class SequentialScanner:
         else:
             print(f"🎯 MQS Quality Filter: DISABLED")
 
+    @property
+    def signal_generator(self):
+        """Full SignalGenerator (not used by the scan loop - imported and created on first use)"""
+        if getattr(self, '_signal_generator', None) is None:
+            from src.strategies.signal_generator import SignalGenerator
+            self._signal_generator = SignalGenerator()
+        return self._signal_generator
+
+    @classmethod
+    def analysis_only(cls, current_regime: str) -> 'SequentialScanner':
+        """
+        Lightweight scanner with only what _analyze_stock needs (analysis pool workers)
+
+        Args:
+            current_regime: Market regime for adaptive classification
+
+        Returns:
+            SequentialScanner without data fetcher / regime / sector / MQS components
+        """
+        scanner = cls.__new__(cls)
+        scanner.mtf_analyzer = MultiTimeframeAnalyzer()
+        scanner.current_regime = current_regime
+        return scanner
+
     def scan_all_stocks(self, stocks: List[str], monitor_callback=None, monitor_callback_data=None) -> Dict:
         """
         Scan ALL stocks sequentially (one by one)
@@ -100,12 +169,18 @@ class SequentialScanner:
                 - 'swing_signals': List of swing signals
                 - 'positional_signals': List of positional signals
                 - 'stats': Scanning statistics
+                - 'symbol_status': {symbol: {'status', 'distance'}} outcome of every scanned stock
         """
         print(f"\n{'='*70}")
         print(f"🔍 SEQUENTIAL SCAN STARTED")
         print(f"{'='*70}")
         print(f"📊 Total stocks to scan: {len(stocks)}")
-        print(f"⏱️ Estimated time: {len(stocks) * self.api_delay / 60:.1f} minutes")
+        # Estimate from request budget: 2 Yahoo requests (daily + 15m) per stock, batched or not
+        est_requests = 2 * len(stocks)
+        print(f"⏱️ Estimated fetch time: {est_requests / YAHOO_RATE_LIMIT_CONFIG['REQUESTS_PER_SECOND'] / 60:.1f} minutes (+ analysis)")
+
+        # Index data (Nifty etc.) downloaded once for this scan, shared by RS / regime / sectors / MQS
+        get_benchmark_series().refresh()
         
         # MARKET REGIME DETECTION (if enabled)
         if self.regime_detector:
@@ -143,11 +218,48 @@ class SequentialScanner:
             'data_failed': 0,
             'swing_found': 0,
             'positional_found': 0,
-            'qualified_stocks': []
+            'qualified_stocks': [],
+            'fetch_wait_seconds': 0.0,  # Time the loop spent blocked on data
+            'analysis_seconds': 0.0,  # Time spent in indicator/quality analysis
+            'unchanged_skipped': 0,  # Symbols whose previous analysis was reused (bars unchanged)
+            'prefiltered_out': 0,  # Symbols dropped by the cheap pre-filter gates
+            'analyzed': 0,  # Symbols that went through full multi-timeframe analysis
+            'setups': 0,  # Analyzed symbols with a swing and/or positional setup (before quality checks)
+            'symbol_status': {}  # Per-symbol outcome + setup distance (returned separately, used by ScanScheduler)
         }
 
+        if self.prefilter is not None:
+            self.prefilter.reset_stats()
+
+        # Fingerprint context: regime + Nifty history + settings/code version
+        if self.analysis_memo is not None:
+            self._memo_context = self.analysis_memo.context(self.current_regime)
+
+        # Resume a crashed / interrupted scan of this universe (same scan window)
+        resume_from = 0
+        resumed = self.checkpoint.begin(stocks) if self.checkpoint is not None else None
+        if resumed is not None:
+            resume_from = resumed['cursor']
+            swing_signals = resumed['swing_signals']
+            positional_signals = resumed['positional_signals']
+            stats.update(resumed['stats'])
+            print(f"📍 Resuming scan from checkpoint: {resume_from}/{len(stocks)} stocks already done "
+                  f"(started {resumed['started_at'][11:19]}, saved {resumed['saved_at'][11:19]})")
+
+        # Data arrives in scan order (serial, batched and/or pipelined - see _iter_stock_data)
+        data_stream = self._iter_stock_data(stocks[resume_from:])
+
+        # Analysis pool: analyses are submitted ahead of this loop, results still arrive in scan order
+        analysis_pool = AnalysisPool() if ANALYSIS_POOL_CONFIG['ENABLED'] else None
+        if analysis_pool is not None:
+            data_stream = self._submit_analyses(data_stream, analysis_pool)
+
         # Scan each stock ONE BY ONE
-        for i, symbol in enumerate(stocks, 1):
+        for i, symbol in enumerate(stocks[resume_from:], resume_from + 1):
+            # Checkpoint the i-1 symbols done so far (written every EVERY_SYMBOLS symbols)
+            if self.checkpoint is not None:
+                self.checkpoint.update(i - 1, swing_signals, positional_signals, stats)
+
             # CRITICAL: Monitor positions periodically during scan (every ~2 minutes)
             # This ensures positions are checked even during long scans (7+ minutes)
             # Calculation: 7 min scan = 420s, ~0.4s per stock = 1000 stocks
@@ -166,12 +278,15 @@ class SequentialScanner:
             print(f"\n[{i}/{len(stocks)}] ({progress_pct:.1f}%) {symbol}", end='', flush=True)
 
             # STEP 1: Fetch dual data (daily + intraday)
-            data = self.data_fetcher.get_stock_data_dual(symbol, verbose=True)
+            fetch_start = time.time()
+            _, data = next(data_stream)
+            stats['fetch_wait_seconds'] += time.time() - fetch_start
 
             if not data['success'] or data['daily'] is None:
                 print(" ❌ No data")
                 stats['data_failed'] += 1
                 stats['processed'] += 1
+                stats['symbol_status'][symbol] = {'status': 'no_data', 'distance': None}
                 continue
 
             stats['data_success'] += 1
@@ -180,7 +295,32 @@ class SequentialScanner:
             # STEP 2: Analyze for signals
             try:
                 # Analyze daily data for swing + positional
-                signals = self._analyze_stock(symbol, data['daily'], data['intraday'])
+                analysis_start = time.time()
+                # (Pool mode: memo already checked when the stock was submitted)
+                signals = data.get('memoized') if analysis_pool is not None else self._memo_lookup(symbol, data)
+                if signals is not None:
+                    stats['unchanged_skipped'] += 1
+                    print(" ♻️ Unchanged", end='', flush=True)
+                else:
+                    if 'analysis' in data:
+                        signals = self._analysis_result(symbol, data, analysis_pool)
+                        stats['analyzed'] += 1
+                    else:
+                        daily_indicators = data['daily_indicators'] = self._daily_indicators(symbol, data)
+                        if self._passes_prefilter(symbol, data, daily_indicators):
+                            signals = self._analyze_stock(symbol, data['daily'], data['intraday'], daily_indicators)
+                            stats['analyzed'] += 1
+                        else:
+                            signals = self._prefiltered_result(symbol, data, daily_indicators)
+                            stats['prefiltered_out'] += 1
+                            print(" ⏭️ Pre-filtered", end='', flush=True)
+                    if signals['swing'] is not None or signals['positional'] is not None:
+                        stats['setups'] += 1
+                    if self.analysis_memo is not None:
+                        self.analysis_memo.put(symbol, data['fingerprint'], signals)
+                if self.analysis_results is not None and data.get('daily_indicators') is not None:
+                    self.analysis_results.put(symbol, data['daily'], data['daily_indicators'])
+                stats['analysis_seconds'] += time.time() - analysis_start
 
                 # Check what was found and show quality details
                 pos_sig = signals['positional']
@@ -210,7 +350,6 @@ class SequentialScanner:
                 
                 if pos_sig:
                     signal_type = pos_sig.get('signal_type', 'UNKNOWN')
-                    passed_quality = False
                     
                     # Show quality scores for positional
                     if signal_type == 'MEAN_REVERSION':
@@ -226,7 +365,6 @@ class SequentialScanner:
                         if not is_valid:
                             print(f" [Need raw≥42 for perfect or ≥47 for regular bounce]", end='', flush=True)
                         results.append(f"{'✅' if is_valid else '❌'} POSITIONAL")
-                        passed_quality = is_valid
                     elif signal_type == 'MOMENTUM':
                         momentum_score = pos_sig.get('momentum_score', 0)
                         is_valid = pos_sig.get('momentum_valid', False)
@@ -238,7 +376,6 @@ class SequentialScanner:
                         print(f"\n   📊 {signal_type} | Score: {signal_score:.1f}/10 | Quality: {normalized_mom_score:.0f}/100 {'✅' if is_valid else '❌'}")
                         print(f"      💡 {top_reason}", end='', flush=True)
                         results.append(f"{'✅' if is_valid else '❌'} POSITIONAL")
-                        passed_quality = is_valid
                     elif signal_type == 'BREAKOUT':
                         breakout_score = pos_sig.get('breakout_score', 0)
                         is_valid = pos_sig.get('breakout_valid', False)
@@ -248,40 +385,51 @@ class SequentialScanner:
                         print(f"\n   📊 {signal_type} | Score: {signal_score:.1f}/10 | Quality: {breakout_score}/100 {'✅' if is_valid else '❌'}")
                         print(f"      💡 {top_reason}", end='', flush=True)
                         results.append(f"{'✅' if is_valid else '❌'} POSITIONAL")
-                        passed_quality = is_valid
                     else:
                         # Unknown signal type - skip
                         print(f"\n   📊 {signal_type}", end='', flush=True)
                         results.append("❌ POSITIONAL")
-                        passed_quality = False
-                    
-                    # Add to results ONLY if passed quality check
-                    if passed_quality:
-                        positional_signals.append(pos_sig)
-                        stats['positional_found'] += 1
-                        stats['qualified_stocks'].append({'symbol': symbol, 'type': 'positional'})
                 else:
                     results.append("❌ Positional")
                 
-                # Add swing if passed quality AND no positional (no duplicates)
-                if swing_sig and swing_passed and not (pos_sig and passed_quality):
-                    swing_signals.append(swing_sig)
+                # Add to results ONLY if passed quality check (swing only if no positional - no duplicates)
+                qualified_swing, qualified_positional = self._qualified_signals(signals)
+                if qualified_positional:
+                    positional_signals.append(qualified_positional)
+                    stats['positional_found'] += 1
+                    stats['qualified_stocks'].append({'symbol': symbol, 'type': 'positional'})
+                if qualified_swing:
+                    swing_signals.append(qualified_swing)
                     stats['swing_found'] += 1
                     stats['qualified_stocks'].append({'symbol': symbol, 'type': 'swing'})
 
                 print(f" | {' '.join(results)}", end='', flush=True)
 
+                stats['symbol_status'][symbol] = self._symbol_status(symbol, data, signals, stats)
+
             except Exception as e:
                 print(f" ⚠️ Analysis error: {str(e)[:50]}", end='', flush=True)
+                stats['symbol_status'][symbol] = {'status': 'error', 'distance': None}
 
             stats['processed'] += 1
 
-            # Brief pause before next stock
-            if i < len(stocks):  # Don't delay after last stock
-                time.sleep(self.api_delay)
+            # No fixed pause between stocks - every fetch is paced by the shared rate limiter
 
         # Scan complete
         elapsed = time.time() - start_time
+        data_stream.close()  # Stops prefetch threads / analysis workers
+        if self.checkpoint is not None:
+            self.checkpoint.complete()
+
+        symbol_status = stats.pop('symbol_status')
+
+        # Persist streaming indicator states for the next rescan
+        if self.streaming_indicators is not None:
+            self.streaming_indicators.save()
+        if self.analysis_memo is not None:
+            self.analysis_memo.save()
+        if self.analysis_results is not None:
+            self.analysis_results.save()
 
         print("\n" + "="*70)
         print(f"✅ Sequential Scan Complete!")
@@ -292,13 +440,25 @@ class SequentialScanner:
         success_rate = (stats['data_success']/stats['total']*100) if stats['total'] > 0 else 0
         print(f"✅ Data Success: {stats['data_success']} ({success_rate:.1f}%)")
         print(f"❌ Data Failed: {stats['data_failed']}")
+        print(f"⏱️ Waiting on data: {stats['fetch_wait_seconds']:.1f}s | Analysis: {stats['analysis_seconds']:.1f}s"
+              f"{' (pipelined)' if PIPELINED_SCAN_ENABLED else ''}")
+        if self.analysis_memo is not None:
+            print(f"♻️ Unchanged (analysis skipped): {stats['unchanged_skipped']}/{stats['data_success']} stocks")
+        self._print_funnel(stats)
+        if analysis_pool is not None:
+            pool_stats = analysis_pool.get_stats()
+            print(f"⚙️ Analysis pool: {pool_stats['tasks']} stocks on {pool_stats['workers']} workers "
+                  f"(fallbacks: {pool_stats['fallbacks']})")
         
         # Show rate limit warnings if any (VERBOSE - tells you if too fast)
         fetcher_stats = self.data_fetcher.stats
         if fetcher_stats.get('rate_limits', 0) > 0:
-            print(f"🚨 RATE LIMITS HIT: {fetcher_stats['rate_limits']} times - TOO FAST! Consider increasing delay")
+            limiter_stats = self.data_fetcher.rate_limiter.get_stats()
+            print(f"🚨 RATE LIMITS HIT: {fetcher_stats['rate_limits']} times - limiter slowed to {limiter_stats['current_rate']} req/s")
         if fetcher_stats.get('retries', 0) > 0:
             print(f"🔄 Retries: {fetcher_stats['retries']} (some fetches needed retry)")
+        if fetcher_stats.get('batch_requests', 0) > 0:
+            print(f"📦 Chunk downloads: {fetcher_stats['batch_requests']} (fallbacks: {fetcher_stats.get('batch_fallbacks', 0)})")
         
         print(f"🔥 Swing Signals: {stats['swing_found']}")
         print(f"📈 Positional Signals: {stats['positional_found']}")
@@ -372,6 +532,49 @@ class SequentialScanner:
                     tech_score = sig.get('score', 0)
                     print(f"      {i}. {sig['symbol']:15s} MQS:{mqs_score:4.1f}/8  Tech:{tech_score:6.1f}  [{sig.get('mqs_recommendation', 'N/A')}]")
 
+        ranked = self._rank_signals(swing_signals, positional_signals)
+        swing_signals = ranked['swing_signals']
+        positional_signals = ranked['positional_signals']
+        mr_signals, momentum_signals = ranked['mr_signals'], ranked['momentum_signals']
+        top_mr, top_momentum = ranked['top_mr'], ranked['top_momentum']
+        allocation_msg = ranked['allocation_msg']
+        original_swing_count = ranked['original_swing_count']
+
+        # Show filtering info
+        if original_swing_count > len(swing_signals):
+            print(f"\n📊 Filtered swing signals: {original_swing_count} → {len(swing_signals)} (top {len(swing_signals)} by score)")
+
+        print(f"📊 Positional signals ranked with ADAPTIVE allocation:")
+        print(f"   Allocation: {allocation_msg}")
+        print(f"   Mean Reversion: {len(top_mr)} signals")
+        print(f"   Momentum: {len(top_momentum)} signals")
+        print(f"   Total: {len(top_mr) + len(top_momentum)} signals ready for equal ₹8.5K allocation")
+
+        # DETAILED RANKINGS DISPLAY - Show strategy-specific top 5
+        # CRITICAL: Pass ORIGINAL mr_signals and momentum_signals (not trimmed positional_signals)
+        # This allows display of ALL mean reversion candidates, not just the 1 selected
+        self._print_detailed_rankings(mr_signals, momentum_signals, positional_signals)
+
+        return {
+            'swing_signals': swing_signals,
+            'positional_signals': positional_signals,
+            'stats': stats,
+            'symbol_status': symbol_status
+        }
+
+    @staticmethod
+    def _rank_signals(swing_signals: List[Dict], positional_signals: List[Dict]) -> Dict:
+        """
+        Rank qualified signals by score and keep the top N per scan (scan_all_stocks / backtest)
+
+        Args:
+            swing_signals: Qualified swing signals
+            positional_signals: Qualified positional signals
+
+        Returns:
+            Dict with swing_signals and positional_signals (ranked, trimmed), plus the per-strategy
+            lists (mr_signals, momentum_signals, top_mr, top_momentum), allocation_msg and counts before trimming
+        """
         # CRITICAL FIX: Sort signals by score (highest first) and take top N
         # This ensures we get BEST quality signals, not first-found signals
 
@@ -408,28 +611,244 @@ class SequentialScanner:
         swing_signals = swing_signals[:MAX_SWING_SIGNALS_PER_SCAN]
         positional_signals = positional_signals[:MAX_POSITIONAL_SIGNALS_PER_SCAN]
 
-        # Show filtering info
-        if original_swing_count > len(swing_signals):
-            print(f"\n📊 Filtered swing signals: {original_swing_count} → {len(swing_signals)} (top {len(swing_signals)} by score)")
-
-        print(f"📊 Positional signals ranked with ADAPTIVE allocation:")
-        print(f"   Allocation: {allocation_msg}")
-        print(f"   Mean Reversion: {len(top_mr)} signals")
-        print(f"   Momentum: {len(top_momentum)} signals")
-        print(f"   Total: {len(top_mr) + len(top_momentum)} signals ready for equal ₹8.5K allocation")
-
-        # DETAILED RANKINGS DISPLAY - Show strategy-specific top 5
-        # CRITICAL: Pass ORIGINAL mr_signals and momentum_signals (not trimmed positional_signals)
-        # This allows display of ALL mean reversion candidates, not just the 1 selected
-        self._print_detailed_rankings(mr_signals, momentum_signals, positional_signals)
-
         return {
             'swing_signals': swing_signals,
             'positional_signals': positional_signals,
-            'stats': stats
+            'mr_signals': mr_signals,
+            'momentum_signals': momentum_signals,
+            'top_mr': top_mr,
+            'top_momentum': top_momentum,
+            'allocation_msg': allocation_msg,
+            'original_swing_count': original_swing_count,
+            'original_positional_count': original_positional_count
         }
 
-    def _analyze_stock(self, symbol: str, daily_df, intraday_df) -> Dict:
+    def _iter_stock_data(self, stocks: List[str]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Yield (symbol, data) for every stock, in scan order
+
+        Modes (from settings):
+        - Default: fetch each stock when the scan loop reaches it
+        - BATCH_DOWNLOAD_ENABLED: fetch chunks of symbols (2 paced requests per symbol)
+        - PIPELINED_SCAN_ENABLED: fetch ahead on a bounded thread pool while
+          the scan loop analyses the current stock
+
+        Args:
+            stocks: List of stock symbols
+
+        Yields:
+            (symbol, data dict from EnhancedDataFetcher)
+        """
+        if BATCH_DOWNLOAD_ENABLED:
+            chunk_size = BATCH_DOWNLOAD_CHUNK_SIZE
+            chunks = [stocks[i:i + chunk_size] for i in range(0, len(stocks), chunk_size)]
+
+            def fetch_chunk(chunk):
+                batch = self.data_fetcher.get_stock_data_batch(chunk, chunk_size=chunk_size, verbose=False)
+                self._attach_panel_indicators(batch)
+                return batch
+
+            if PIPELINED_SCAN_ENABLED and chunks:
+                # ONE chunk in flight - its requests share the rate limiter anyway
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(fetch_chunk, chunks[0])
+                    for idx, chunk in enumerate(chunks):
+                        batch = self._future_result(future, {})
+                        if idx + 1 < len(chunks):
+                            future = executor.submit(fetch_chunk, chunks[idx + 1])
+                        for symbol in chunk:
+                            yield symbol, batch.get(symbol) or self.data_fetcher.get_stock_data_dual(symbol, verbose=True)
+            else:
+                for chunk in chunks:
+                    batch = fetch_chunk(chunk)
+                    for symbol in chunk:
+                        yield symbol, batch.get(symbol) or self.data_fetcher.get_stock_data_dual(symbol, verbose=True)
+
+        elif PIPELINED_SCAN_ENABLED:
+            # Keep PIPELINE_PREFETCH_DEPTH fetches in flight (verbose off - worker output would interleave)
+            depth = max(1, PIPELINE_PREFETCH_DEPTH)
+            with ThreadPoolExecutor(max_workers=max(1, PIPELINE_FETCH_WORKERS)) as executor:
+                pending = deque()
+                remaining = iter(stocks)
+
+                for symbol in remaining:
+                    pending.append((symbol, executor.submit(self.data_fetcher.get_stock_data_dual, symbol, False)))
+                    if len(pending) >= depth:
+                        break
+
+                while pending:
+                    symbol, future = pending.popleft()
+                    next_symbol = next(remaining, None)
+                    if next_symbol is not None:
+                        pending.append((next_symbol, executor.submit(self.data_fetcher.get_stock_data_dual, next_symbol, False)))
+                    yield symbol, self._future_result(future, {'symbol': symbol, 'daily': None, 'intraday': None, 'success': False})
+
+        else:
+            for symbol in stocks:
+                yield symbol, self.data_fetcher.get_stock_data_dual(symbol, verbose=True)
+
+    def _attach_panel_indicators(self, batch: Dict[str, Dict]):
+        """Compute daily indicators for a whole batch in one vectorized pass (PanelIndicators)"""
+        if self.panel_indicators is None:
+            return
+
+        frames = {symbol: data['daily'] for symbol, data in batch.items()
+                  if data.get('success') and data.get('daily') is not None}
+
+        try:
+            indicators = self.panel_indicators.calculate_all(frames)
+        except Exception as e:
+            print(f"\n⚠️ Panel indicators failed - computing per stock: {str(e)[:50]}")
+            return
+
+        for symbol, result in indicators.items():
+            if result is not None:
+                batch[symbol]['daily_indicators'] = result
+
+        # Pre-filter the whole batch in one vectorized pass
+        if self.prefilter is not None:
+            passed = self.prefilter.evaluate({symbol: result for symbol, result in indicators.items() if result is not None})
+            distances = self.prefilter.distance({symbol: result for symbol, result in indicators.items() if result is not None})
+            for symbol, ok in passed.items():
+                batch[symbol]['prefilter_pass'] = ok
+                batch[symbol]['setup_distance'] = distances[symbol]
+
+    def _future_result(self, future, default):
+        """Result of a prefetch future (default on worker error - never stops the scan)"""
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"\n⚠️ Prefetch error: {str(e)[:50]}")
+            return default
+
+    def _daily_indicators(self, symbol: str, data: Dict) -> Dict:
+        """Pre-computed daily indicators: panel result if attached, else streaming update (None = compute per stock)"""
+        daily_indicators = data.get('daily_indicators')
+        if daily_indicators is None and self.streaming_indicators is not None:
+            daily_indicators = self.streaming_indicators.update_from_frame(symbol, '1d', data['daily'])
+        return daily_indicators
+
+    def _memo_lookup(self, symbol: str, data: Dict) -> Dict:
+        """Previous analysis result if the symbol's bars are unchanged (fingerprint kept in data['fingerprint'])"""
+        if self.analysis_memo is None:
+            return None
+
+        if 'fingerprint' not in data:
+            data['fingerprint'] = self.analysis_memo.fingerprint(data['daily'], data['intraday'], self._memo_context)
+        return self.analysis_memo.get(symbol, data['fingerprint'])
+
+    def _passes_prefilter(self, symbol: str, data: Dict, daily_indicators: Dict) -> bool:
+        """Pre-filter verdict (batch result if attached, else evaluated for this symbol alone)"""
+        if self.prefilter is None or daily_indicators is None:
+            return True
+
+        if 'prefilter_pass' not in data:
+            data['prefilter_pass'] = self.prefilter.evaluate({symbol: daily_indicators})[symbol]
+        return data['prefilter_pass']
+
+    def _prefiltered_result(self, symbol: str, data: Dict, daily_indicators: Dict) -> Dict:
+        """Result for a pre-filtered symbol (verification mode: full analysis, mismatches reported)"""
+        result = {'swing': None, 'positional': None}
+
+        if self.prefilter.verify:
+            with redirect_stdout(io.StringIO()):
+                signals = self._analyze_stock(symbol, data['daily'], data['intraday'], daily_indicators)
+            self.prefilter.record_verification(symbol, signals)
+
+        return result
+
+    @staticmethod
+    def _qualified_signals(signals: Dict) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Quality gate of one stock's setups (same decisions the scan loop prints)
+
+        Args:
+            signals: {'swing': signal or None, 'positional': signal or None} from _analyze_stock
+
+        Returns:
+            (swing signal or None, positional signal or None) - swing only when no positional qualified
+        """
+        swing_sig, pos_sig = signals['swing'], signals['positional']
+
+        # Positional: the quality flag of its strategy (unknown signal types never qualify)
+        quality_flags = {'MEAN_REVERSION': 'mean_reversion_valid', 'MOMENTUM': 'momentum_valid', 'BREAKOUT': 'breakout_valid'}
+        positional = None
+        if pos_sig and pos_sig.get(quality_flags.get(pos_sig.get('signal_type'), ''), False):
+            positional = pos_sig
+
+        # Swing: MOMENTUM ONLY (optimized for 1-2% quick moves), no duplicate of a positional signal
+        swing = None
+        if swing_sig and positional is None and swing_sig.get('signal_type') == 'MOMENTUM' and swing_sig.get('momentum_valid', False):
+            swing = swing_sig
+
+        return swing, positional
+
+    def _symbol_status(self, symbol: str, data: Dict, signals: Dict, stats: Dict) -> Dict:
+        """Outcome of a scanned stock: qualified / setup / no_setup (+ distance to the setup gates if known)"""
+        qualified = stats['qualified_stocks'] and stats['qualified_stocks'][-1]['symbol'] == symbol
+        if qualified:
+            return {'status': 'qualified', 'distance': 0.0}
+        if signals['swing'] is not None or signals['positional'] is not None:
+            return {'status': 'setup', 'distance': 0.0}
+
+        # Unchanged (memoized) stocks have no fresh indicators - scheduler keeps their previous distance
+        distance = data.get('setup_distance')
+        daily_indicators = data.get('daily_indicators')
+        if distance is None and self.prefilter is not None and daily_indicators is not None:
+            distance = self.prefilter.distance({symbol: daily_indicators})[symbol]
+        return {'status': 'no_setup', 'distance': distance}
+
+    def _submit_analyses(self, data_stream: Iterator[Tuple[str, Dict]], analysis_pool: AnalysisPool) -> Iterator[Tuple[str, Dict]]:
+        """
+        Run ahead of the scan loop: submit each stock's analysis to the pool as its data arrives
+
+        Indicators are prepared here, in scan order (streaming indicator state stays in
+        this process). Yields (symbol, data) with data['analysis'] = Future (or
+        data['memoized'] for unchanged symbols), keeping up to MAX_IN_FLIGHT stocks
+        ahead. Closing the generator stops the workers.
+        """
+        analysis_pool.start(self.current_regime)
+        pending = deque()
+
+        try:
+            for symbol, data in data_stream:
+                if data.get('success') and data.get('daily') is not None:
+                    # Unchanged symbols reuse their memoized result - nothing to submit
+                    memoized = self._memo_lookup(symbol, data)
+                    if memoized is not None:
+                        data['memoized'] = memoized
+                    else:
+                        try:
+                            data['daily_indicators'] = self._daily_indicators(symbol, data)
+                            # Pre-filtered symbols are handled by the scan loop (no submission)
+                            if self._passes_prefilter(symbol, data, data['daily_indicators']):
+                                data['analysis'] = analysis_pool.submit(symbol, data['daily'], data['intraday'], data['daily_indicators'])
+                        except Exception as e:
+                            print(f"\n⚠️ Analysis submit error ({symbol}): {str(e)[:50]}")
+
+                pending.append((symbol, data))
+                if len(pending) >= analysis_pool.max_in_flight:
+                    yield pending.popleft()
+
+            while pending:
+                yield pending.popleft()
+        finally:
+            analysis_pool.close()
+            data_stream.close()
+
+    def _analysis_result(self, symbol: str, data: Dict, analysis_pool: AnalysisPool) -> Dict:
+        """Signals from the pool (prints the worker's captured output; re-runs here if the worker failed)"""
+        try:
+            signals, output = data['analysis'].result()
+        except Exception as e:
+            print(f"\n⚠️ Analysis worker error: {str(e)[:50]} - analysing in scan process", end='', flush=True)
+            analysis_pool.stats['fallbacks'] += 1
+            return self._analyze_stock(symbol, data['daily'], data['intraday'], data.get('daily_indicators'))
+
+        print(output, end='', flush=True)
+        return signals
+
+    def _analyze_stock(self, symbol: str, daily_df, intraday_df, daily_indicators: Dict = None) -> Dict:
         """
         Analyze a stock for signals
 
@@ -437,6 +856,7 @@ class SequentialScanner:
             symbol: Stock symbol
             daily_df: Daily OHLCV data (3 months)
             intraday_df: Intraday 15-min data (today)
+            daily_indicators: Daily indicators pre-computed for the whole batch (optional)
 
         Returns:
             Dict with 'swing' and 'positional' signals (or None)
@@ -453,7 +873,8 @@ class SequentialScanner:
                 symbol=symbol,
                 daily_df=daily_df,
                 intraday_df=intraday_df,
-                market_regime=self.current_regime  # Pass current market regime
+                market_regime=self.current_regime,  # Pass current market regime
+                daily_indicators=daily_indicators
             )
 
             if not mtf_result:
@@ -1057,6 +1478,21 @@ class SequentialScanner:
 
         return signal
 
+    def _print_funnel(self, stats: Dict):
+        """Symbols left after each stage of the scan"""
+        qualified = stats['swing_found'] + stats['positional_found']
+        print(f"🔻 Funnel: {stats['total']} stocks → {stats['data_success']} with data → "
+              f"{stats['data_success'] - stats['unchanged_skipped']} changed → "
+              f"{stats['analyzed']} analysed (pre-filtered out: {stats['prefiltered_out']}) → "
+              f"{stats['setups']} setups → {qualified} qualified")
+
+        if self.prefilter is not None:
+            prefilter_stats = self.prefilter.get_stats()
+            verified = (f" | verified {prefilter_stats['verified']}, mismatches {prefilter_stats['mismatches']}"
+                        if self.prefilter.verify else "")
+            print(f"   Pre-filter: {prefilter_stats['passed']}/{prefilter_stats['evaluated']} passed "
+                  f"in {prefilter_stats['seconds'] * 1000:.0f}ms{verified}")
+
     def _print_detailed_rankings(self, mr_signals: List[Dict], momentum_signals: List[Dict], positional_signals: List[Dict]):
         """
         Print detailed strategy-specific rankings
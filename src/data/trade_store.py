@@ -0,0 +1,481 @@
+"""
+🗄️ TRADE STORE - SQLite database for positions, trades, signals and scans
+
+The dashboard and summaries used to re-read and re-parse every portfolio /
+trades JSON file on each refresh, and there was no way to ask "trades in
+RELIANCE last month" without loading everything. This store keeps:
+
+- portfolios: capital / performance per portfolio ('swing', 'positional', ...)
+- positions:  open positions (one row each)
+- trades:     completed trades - indexed by symbol, exit date, strategy
+- scans:      one row per intraday scan (counts + stats)
+- signals:    every signal a scan emitted - indexed by symbol, date, strategy
+
+PaperTrader syncs into it on every save (only changed positions / new trades),
+so existing JSON files are migrated the first time a portfolio is loaded.
+WAL mode: the dashboard process reads while the trading system writes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import TRADE_STORE_CONFIG
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS portfolios (
+    portfolio TEXT PRIMARY KEY,
+    capital REAL,
+    initial_capital REAL,
+    start_date TEXT,
+    performance TEXT,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS positions (
+    portfolio TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    strategy TEXT,
+    signal_type TEXT,
+    entry_date TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT,
+    PRIMARY KEY (portfolio, symbol)
+);
+
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    portfolio TEXT NOT NULL,
+    trade_index INTEGER NOT NULL,
+    symbol TEXT,
+    strategy TEXT,
+    signal_type TEXT,
+    entry_date TEXT,
+    exit_date TEXT,
+    pnl REAL,
+    holding_days REAL,
+    data TEXT NOT NULL,
+    UNIQUE (portfolio, trade_index)
+);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades (symbol);
+CREATE INDEX IF NOT EXISTS idx_trades_exit_date ON trades (exit_date);
+CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades (strategy);
+
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    finished_at TEXT,
+    total INTEGER,
+    processed INTEGER,
+    data_success INTEGER,
+    data_failed INTEGER,
+    swing_found INTEGER,
+    positional_found INTEGER,
+    stats TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scans_finished_at ON scans (finished_at);
+
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id INTEGER,
+    created_at TEXT,
+    symbol TEXT,
+    strategy TEXT,
+    signal_type TEXT,
+    score REAL,
+    entry_price REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_signals_symbol ON signals (symbol);
+CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals (created_at);
+CREATE INDEX IF NOT EXISTS idx_signals_strategy ON signals (strategy);
+"""
+
+
+def _dumps(value) -> str:
+    """JSON for storage (numpy scalars / timestamps become strings rather than failing)"""
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _number(value) -> Optional[float]:
+    """Plain float for numeric columns (numpy scalars aren't valid SQLite parameters)"""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def portfolio_name(portfolio_file: str) -> str:
+    """'data/swing_portfolio.json' -> 'swing'"""
+    name = os.path.splitext(os.path.basename(portfolio_file))[0]
+    return name[:-len('_portfolio')] if name.endswith('_portfolio') else name
+
+
+class TradeStore:
+    """
+    SQLite-backed store (one connection, serialized by a lock)
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Initialize store (creates / upgrades the schema)
+
+        Args:
+            path: Database file (default: TRADE_STORE_CONFIG['PATH'])
+        """
+        self.path = path or TRADE_STORE_CONFIG['PATH']
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._migrate_schema()
+
+        # Per-portfolio sync state (what the DB already holds)
+        self._synced_positions: Dict[str, Dict[str, str]] = {}
+        self._synced_trades: Dict[str, int] = {}
+
+    def _migrate_schema(self):
+        with self._lock:
+            version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < 1:
+                self._conn.executescript(_SCHEMA)
+            # Future schema changes: `if version < 2: ...`
+            self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            self._conn.commit()
+
+    # ─── Writes ──────────────────────────────────────────────────
+
+    def sync_portfolio(self, portfolio: str, state: Dict, trade_history: List[Dict]):
+        """
+        Bring a portfolio up to date (only changed positions / new trades are written)
+
+        Args:
+            portfolio: Portfolio name ('swing', 'positional', ...)
+            state: Dict with capital, positions, performance, start_date, initial_capital
+            trade_history: Full trade list (entries past the stored count are inserted; a history that
+                no longer extends the stored one - PaperTrader.reset(), deleted JSON files - replaces it)
+        """
+        now = datetime.now().isoformat()
+
+        with self._lock:
+            if portfolio not in self._synced_positions:
+                self._synced_positions[portfolio] = {
+                    row['symbol']: row['data'] for row in self._conn.execute(
+                        'SELECT symbol, data FROM positions WHERE portfolio = ?', (portfolio,))
+                }
+                next_index = self._conn.execute(
+                    'SELECT COALESCE(MAX(trade_index) + 1, 0) FROM trades WHERE portfolio = ?', (portfolio,)
+                ).fetchone()[0]
+                self._synced_trades[portfolio] = next_index
+
+            synced = self._synced_positions[portfolio]
+            positions = state.get('positions', {})
+            serialized = {symbol: _dumps(position) for symbol, position in positions.items()}
+
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO portfolios VALUES (?, ?, ?, ?, ?, ?)',
+                    (portfolio, _number(state.get('capital')), _number(state.get('initial_capital')), state.get('start_date'),
+                     _dumps(state.get('performance', {})), now)
+                )
+
+                for symbol, text in serialized.items():
+                    if synced.get(symbol) == text:
+                        continue
+                    position = positions[symbol]
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO positions VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (portfolio, symbol, position.get('strategy'), position.get('signal_type'),
+                         position.get('entry_date'), text, now)
+                    )
+
+                removed = [symbol for symbol in synced if symbol not in serialized]
+                self._conn.executemany(
+                    'DELETE FROM positions WHERE portfolio = ? AND symbol = ?',
+                    [(portfolio, symbol) for symbol in removed]
+                )
+
+                start = self._synced_trades[portfolio]
+                if not self._extends_stored_trades(portfolio, start, trade_history):
+                    self._conn.execute('DELETE FROM trades WHERE portfolio = ?', (portfolio,))
+                    start = 0
+
+                self._conn.executemany(
+                    'INSERT INTO trades (portfolio, trade_index, symbol, strategy, signal_type, '
+                    'entry_date, exit_date, pnl, holding_days, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(portfolio, index, trade.get('symbol'), trade.get('strategy'), trade.get('signal_type'),
+                      trade.get('entry_date'), trade.get('exit_date'), _number(trade.get('pnl')), _number(trade.get('holding_days')),
+                      _dumps(trade))
+                     for index, trade in enumerate(trade_history[start:], start)]
+                )
+
+            self._synced_positions[portfolio] = serialized
+            self._synced_trades[portfolio] = len(trade_history)
+
+    def _extends_stored_trades(self, portfolio: str, stored: int, trade_history: List[Dict]) -> bool:
+        """True if trade_history starts with the stored trades (checked on the last stored one)"""
+        if stored == 0:
+            return True
+        if len(trade_history) < stored:
+            return False
+        row = self._conn.execute('SELECT data FROM trades WHERE portfolio = ? AND trade_index = ?',
+                                 (portfolio, stored - 1)).fetchone()
+        return row is not None and row['data'] == _dumps(trade_history[stored - 1])
+
+    def migrate_json(self, portfolio_file: str, trades_file: str, portfolio: str = None) -> bool:
+        """
+        Import a portfolio from its JSON snapshot (+ trade journal)
+
+        Args:
+            portfolio_file: e.g. data/positional_portfolio.json
+            trades_file: e.g. data/positional_trades.json
+            portfolio: Name to store under (default: derived from the file name)
+
+        Returns:
+            True if anything was imported
+        """
+        from src.paper_trading.trade_journal import replay
+
+        data, trades, _ = replay(portfolio_file, trades_file)
+        if data is None and not trades:
+            return False
+
+        self.sync_portfolio(portfolio or portfolio_name(portfolio_file), data or {}, trades)
+        return True
+
+    def record_scan(self, scan_result: Dict, started_at: datetime = None) -> int:
+        """
+        Store one scan and every signal it emitted
+
+        Args:
+            scan_result: Dict from SequentialScanner.scan_all_stocks
+            started_at: Scan start time
+
+        Returns:
+            Scan id
+        """
+        stats = scan_result.get('stats', {})
+        now = datetime.now().isoformat()
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                'INSERT INTO scans (started_at, finished_at, total, processed, data_success, data_failed, '
+                'swing_found, positional_found, stats) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (started_at.isoformat() if started_at else None, now, stats.get('total'), stats.get('processed'),
+                 stats.get('data_success'), stats.get('data_failed'), stats.get('swing_found'),
+                 stats.get('positional_found'), _dumps(stats))
+            )
+            scan_id = cursor.lastrowid
+
+            rows = []
+            for strategy, key in (('swing', 'swing_signals'), ('positional', 'positional_signals')):
+                for signal in scan_result.get(key, []):
+                    rows.append((scan_id, now, signal.get('symbol'), strategy, signal.get('signal_type'),
+                                 _number(signal.get('score')), _number(signal.get('entry_price')), _dumps(signal)))
+
+            self._conn.executemany(
+                'INSERT INTO signals (scan_id, created_at, symbol, strategy, signal_type, score, entry_price, data) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows
+            )
+
+        return scan_id
+
+    # ─── Queries ─────────────────────────────────────────────────
+
+    def load_portfolio(self, portfolio: str) -> Optional[Dict]:
+        """
+        Portfolio in the same shape as the *_portfolio.json snapshot
+
+        Returns:
+            Dict with capital, positions, performance, start_date, initial_capital, last_updated (None if unknown)
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM portfolios WHERE portfolio = ?', (portfolio,)).fetchone()
+            if row is None:
+                return None
+
+            positions = {
+                position['symbol']: json.loads(position['data'])
+                for position in self._conn.execute(
+                    'SELECT symbol, data FROM positions WHERE portfolio = ?', (portfolio,))
+            }
+
+        return {
+            'capital': row['capital'],
+            'positions': positions,
+            'performance': json.loads(row['performance'] or '{}'),
+            'start_date': row['start_date'],
+            'initial_capital': row['initial_capital'],
+            'last_updated': row['updated_at'],
+            'mode': 'PAPER_TRADING'
+        }
+
+    def get_trades(self, portfolio: str = None, symbol: str = None, strategy: str = None,
+                   since: str = None, until: str = None, limit: int = None) -> List[Dict]:
+        """
+        Completed trades, oldest first (indexed filters)
+
+        Args:
+            portfolio: Portfolio name
+            symbol: Stock symbol
+            strategy: 'swing' / 'positional'
+            since: ISO date/time - exit_date >= since
+            until: ISO date/time - exit_date < until
+            limit: Most recent N trades only
+
+        Returns:
+            List of trade dicts (same shape as *_trades.json entries)
+        """
+        clauses, params = [], []
+        for column, value in (('portfolio', portfolio), ('symbol', symbol), ('strategy', strategy)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            clauses.append('exit_date >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('exit_date < ?')
+            params.append(until)
+
+        query = 'SELECT data FROM trades'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY id DESC'
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [json.loads(row['data']) for row in reversed(rows)]
+
+    def get_new_trades(self, portfolio: str, after_id: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Trades added since a previous call (incremental refresh)
+
+        Args:
+            portfolio: Portfolio name
+            after_id: Last id returned by a previous call (0 = everything)
+
+        Returns:
+            Tuple of (new trades oldest first, id to pass next time)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, data FROM trades WHERE portfolio = ? AND id > ? ORDER BY id', (portfolio, after_id)
+            ).fetchall()
+
+        if not rows:
+            return [], after_id
+        return [json.loads(row['data']) for row in rows], rows[-1]['id']
+
+    def get_trade_stats(self, portfolio: str = None, strategy: str = None) -> Dict:
+        """
+        Aggregate trade statistics (computed in SQL)
+
+        Returns:
+            Dict with trades, wins, losses, total_pnl, avg_pnl, avg_holding_days
+        """
+        clauses, params = [], []
+        for column, value in (('portfolio', portfolio), ('strategy', strategy)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT COUNT(*) AS trades, SUM(pnl > 0) AS wins, SUM(pnl <= 0) AS losses, '
+                'COALESCE(SUM(pnl), 0) AS total_pnl, COALESCE(AVG(pnl), 0) AS avg_pnl, '
+                'COALESCE(AVG(holding_days), 0) AS avg_holding_days FROM trades' + where, params
+            ).fetchone()
+
+        return {
+            'trades': row['trades'],
+            'wins': row['wins'] or 0,
+            'losses': row['losses'] or 0,
+            'total_pnl': row['total_pnl'],
+            'avg_pnl': row['avg_pnl'],
+            'avg_holding_days': row['avg_holding_days']
+        }
+
+    def get_signals(self, symbol: str = None, strategy: str = None, since: str = None,
+                    scan_id: int = None, limit: int = 100) -> List[Dict]:
+        """
+        Emitted signals, newest first
+
+        Returns:
+            List of signal dicts (with 'scan_id' and 'created_at' added)
+        """
+        clauses, params = [], []
+        for column, value in (('symbol', symbol), ('strategy', strategy), ('scan_id', scan_id)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            clauses.append('created_at >= ?')
+            params.append(since)
+
+        query = 'SELECT scan_id, created_at, data FROM signals'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += f' ORDER BY id DESC LIMIT {int(limit)}'
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [{**json.loads(row['data']), 'scan_id': row['scan_id'], 'created_at': row['created_at']} for row in rows]
+
+    def get_scans(self, limit: int = 20) -> List[Dict]:
+        """Most recent scans (newest first)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, started_at, finished_at, total, processed, data_success, data_failed, '
+                'swing_found, positional_found FROM scans ORDER BY id DESC LIMIT ?', (limit,)
+            ).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Singleton instance
+_trade_store = None
+_trade_store_lock = threading.Lock()
+
+
+def get_trade_store() -> TradeStore:
+    """Get process-wide trade store"""
+    global _trade_store
+
+    if _trade_store is None:
+        with _trade_store_lock:
+            if _trade_store is None:
+                _trade_store = TradeStore()
+
+    return _trade_store
+
+
+if __name__ == "__main__":
+    # Migrate existing JSON portfolios into the store
+    store = get_trade_store()
+
+    for name in ('swing', 'positional', 'etf'):
+        if store.migrate_json(f'data/{name}_portfolio.json', f'data/{name}_trades.json', name):
+            stats = store.get_trade_stats(name)
+            print(f"✅ {name}: migrated ({stats['trades']} trades)")
+        else:
+            print(f"⚠️ {name}: nothing to migrate")
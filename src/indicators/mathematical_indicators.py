@@ -8,7 +8,6 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
-import yfinance as yf
 
 from config.settings import *
 
@@ -256,37 +255,30 @@ class MathematicalIndicators:
 
     def _find_support_resistance(self, df: pd.DataFrame) -> Dict:
         """
-        Identify key support and resistance levels using multiple touches
+        Identify key support and resistance levels using swing pivots
+
+        A bar is a swing high (resistance) when its High is >= the highest High
+        of the SR_PIVOT_WINDOW bars on each side; swing lows (support) likewise.
+        Pivots are found with sliding-window max/min over NumPy arrays - no
+        per-bar pandas slicing.
         """
         try:
-            recent_data = df.tail(100)
-
-            # Find levels where price has bounced multiple times
-            price_levels = []
-
-            # Use clustering to find frequently tested levels
-            all_highs = recent_data['High'].values
-            all_lows = recent_data['Low'].values
+            recent_data = df.tail(SR_LOOKBACK_BARS)
 
-            # Simplified: use recent swing highs/lows as S/R
-            resistance_levels = []
-            support_levels = []
+            all_highs = recent_data['High'].to_numpy(dtype=np.float64)
+            all_lows = recent_data['Low'].to_numpy(dtype=np.float64)
 
-            # Find local maxima (resistance)
-            for i in range(5, len(recent_data) - 5):
-                if (recent_data['High'].iloc[i] >= recent_data['High'].iloc[i-5:i].max() and
-                    recent_data['High'].iloc[i] >= recent_data['High'].iloc[i+1:i+6].max()):
-                    resistance_levels.append(recent_data['High'].iloc[i])
+            resistance_levels = self._swing_pivots(all_highs, SR_PIVOT_WINDOW, highs=True)
+            support_levels = self._swing_pivots(all_lows, SR_PIVOT_WINDOW, highs=False)
 
-            # Find local minima (support)
-            for i in range(5, len(recent_data) - 5):
-                if (recent_data['Low'].iloc[i] <= recent_data['Low'].iloc[i-5:i].min() and
-                    recent_data['Low'].iloc[i] <= recent_data['Low'].iloc[i+1:i+6].min()):
-                    support_levels.append(recent_data['Low'].iloc[i])
+            # Optionally merge nearby pivots into one level
+            if SR_CLUSTER_TOLERANCE > 0:
+                resistance_levels = self._cluster_levels(resistance_levels, SR_CLUSTER_TOLERANCE)
+                support_levels = self._cluster_levels(support_levels, SR_CLUSTER_TOLERANCE)
 
-            # Remove duplicates and sort
-            resistance_levels = sorted(list(set([round(r, 2) for r in resistance_levels])), reverse=True)[:5]
-            support_levels = sorted(list(set([round(s, 2) for s in support_levels])))[:5]
+            # Remove duplicates and sort (np.unique sorts ascending)
+            resistance_levels = np.unique(np.round(resistance_levels, 2))[::-1][:5].tolist()
+            support_levels = np.unique(np.round(support_levels, 2))[:5].tolist()
 
             current_price = df['Close'].iloc[-1]
 
@@ -302,6 +294,59 @@ class MathematicalIndicators:
             print(f"❌ Support/Resistance error: {e}")
             return {}
 
+    def _swing_pivots(self, values: np.ndarray, window: int, highs: bool = True) -> np.ndarray:
+        """
+        Vectorized swing pivot detection
+
+        Args:
+            values: Highs (for swing highs) or Lows (for swing lows)
+            window: Bars that must lie on each side of the pivot
+            highs: True for swing highs, False for swing lows
+
+        Returns:
+            Pivot values in bar order
+        """
+        n = len(values)
+        if window < 1 or n < 2 * window + 1:
+            return np.empty(0)
+
+        # windows[j] = values[j:j + window]; pivot i compares against windows[i - window] and windows[i + 1]
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        extreme = np.nanmax(windows, axis=1) if highs else np.nanmin(windows, axis=1)
+
+        centre = values[window:n - window]
+        left = extreme[:n - 2 * window]
+        right = extreme[window + 1:]
+
+        if highs:
+            mask = (centre >= left) & (centre >= right)
+        else:
+            mask = (centre <= left) & (centre <= right)
+
+        return centre[mask]
+
+    def _cluster_levels(self, levels: np.ndarray, tolerance: float) -> np.ndarray:
+        """
+        Merge levels lying within `tolerance` (fraction of price) of their neighbour
+
+        Args:
+            levels: Pivot levels
+            tolerance: Relative gap that still counts as the same level (0.01 = 1%)
+
+        Returns:
+            Mean level of each cluster
+        """
+        if len(levels) < 2:
+            return np.asarray(levels, dtype=np.float64)
+
+        ordered = np.sort(levels)
+        gaps = np.diff(ordered) / ordered[:-1]
+        cluster_ids = np.concatenate(([0], np.cumsum(gaps > tolerance)))
+
+        sums = np.bincount(cluster_ids, weights=ordered)
+        counts = np.bincount(cluster_ids)
+        return sums / counts
+
     def _calculate_mathematical_score(self, df: pd.DataFrame, fibonacci: Dict,
                                       elliott: Dict, gann: Dict, sr: Dict) -> float:
         """
@@ -430,6 +475,8 @@ def test_mathematical_indicators():
     """Test the mathematical indicators module"""
     print("🧪 Testing Mathematical Indicators...")
 
+    import yfinance as yf
+
     # Fetch sample data
     ticker = yf.Ticker('RELIANCE.NS')
     df = ticker.history(period='6mo')
@@ -0,0 +1,342 @@
+"""
+📊 PANEL INDICATORS - Cross-sectional, vectorized technical indicators
+
+Same indicators as TechnicalIndicators.calculate_all(), computed for MANY
+stocks at once. Every OHLCV field is a 2-D NumPy array (symbols x bars),
+right-aligned so the last column is the latest bar for every symbol (shorter
+histories are NaN-padded on the left).
+
+- Rolling windows: strided views (no per-symbol pandas objects)
+- EMAs: one pass over the bar axis, vectorized across all symbols
+- Signals / technical score: vectorized, then unpacked per symbol
+
+Output per symbol has the SAME shape as TechnicalIndicators.calculate_all()
+(drop-in for MultiTimeframeAnalyzer._analyze_daily).
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import *
+from src.data.benchmark_series import get_benchmark_series
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def _shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+    out[:, periods:] = x[:, :-periods]
+    return out
+
+
+def _rolling(x: np.ndarray, window: int, func, **kwargs) -> np.ndarray:
+    """Rolling reduction along bars (NaN until a full window of valid values)"""
+    out = np.full_like(x, np.nan)
+    if x.shape[1] >= window:
+        out[:, window - 1:] = func(sliding_window_view(x, window, axis=1), axis=-1, **kwargs)
+    return out
+
+
+def _ewm(x: np.ndarray, span: int) -> np.ndarray:
+    """EMA (pandas ewm(span, adjust=False)) - starts at each symbol's first valid value"""
+    alpha = 2.0 / (span + 1.0)
+    out = np.empty_like(x)
+    missing = np.isnan(x)
+
+    # Leading padding -> first valid value (EMA of a constant prefix is that constant)
+    first = np.where(missing.all(axis=1), 0, missing.argmin(axis=1))
+    rows = np.arange(x.shape[0])
+    leading = np.arange(x.shape[1]) < first[:, None]
+    filled = np.where(leading, x[rows, first][:, None], x)
+
+    if np.isnan(filled).any():
+        # Gaps inside a series - NaN-aware recursion (carry the last EMA over gaps)
+        prev = np.full(x.shape[0], np.nan)
+        for t in range(x.shape[1]):
+            value = x[:, t]
+            updated = alpha * value + (1.0 - alpha) * prev
+            prev = np.where(np.isnan(prev), value, np.where(np.isnan(value), prev, updated))
+            out[:, t] = prev
+        return out
+
+    prev = filled[:, 0]
+    out[:, 0] = prev
+    for t in range(1, x.shape[1]):
+        prev = alpha * filled[:, t] + (1.0 - alpha) * prev
+        out[:, t] = prev
+
+    out[leading] = np.nan
+    return out
+
+
+class PanelIndicators:
+    """
+    Vectorized indicator engine over a symbol x time panel
+    """
+
+    def __init__(self, min_bars: int = 50):
+        """
+        Initialize panel engine
+
+        Args:
+            min_bars: Symbols with fewer bars get None (same as calculate_all)
+        """
+        self.min_bars = min_bars
+
+    def build_panel(self, frames: Dict[str, pd.DataFrame]) -> Tuple[List[str], Dict[str, np.ndarray], np.ndarray]:
+        """
+        Stack per-symbol OHLCV frames into right-aligned 2-D arrays
+
+        Args:
+            frames: symbol -> DataFrame with OHLCV columns (any case)
+
+        Returns:
+            (symbols, {field: symbols x bars array}, bars per symbol)
+        """
+        symbols = [symbol for symbol, df in frames.items() if df is not None and len(df) > 0]
+        lengths = np.array([len(frames[symbol]) for symbol in symbols], dtype=np.int64)
+        width = int(lengths.max()) if len(lengths) else 0
+
+        stacked = np.full((len(FIELDS), len(symbols), width), np.nan)
+        for row, symbol in enumerate(symbols):
+            df = frames[symbol]
+            positions = {str(c).capitalize(): i for i, c in enumerate(df.columns)}
+            values = df.to_numpy(dtype=np.float64)
+            stacked[:, row, width - len(df):] = values[:, [positions[field] for field in FIELDS]].T
+
+        return symbols, dict(zip(FIELDS, stacked)), lengths
+
+    def compute(self, open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                volume: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute every indicator for the whole panel in one pass
+
+        Args:
+            open_, high, low, close, volume: symbols x bars arrays (NaN-padded on the left)
+
+        Returns:
+            Dict of column name (same names as calculate_all's df) -> symbols x bars array
+        """
+        out = {'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}
+        valid = ~np.isnan(close)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # EMAs
+            for period in EMA_PERIODS:
+                out[f'EMA_{period}'] = _ewm(close, period)
+
+            # RSI (rolling mean of gains / losses)
+            delta = close - _shift(close)
+            gain = np.where(valid, np.where(delta > 0, delta, 0.0), np.nan)
+            loss = np.where(valid, np.where(delta < 0, -delta, 0.0), np.nan)
+            rs = _rolling(gain, RSI_PERIOD, np.mean) / _rolling(loss, RSI_PERIOD, np.mean)
+            out['RSI'] = 100 - (100 / (1 + rs))
+
+            # MACD
+            out['MACD'] = _ewm(close, MACD_FAST) - _ewm(close, MACD_SLOW)
+            out['MACD_Signal'] = _ewm(out['MACD'], MACD_SIGNAL)
+            out['MACD_Hist'] = out['MACD'] - out['MACD_Signal']
+
+            # Bollinger Bands
+            bb_middle = _rolling(close, BB_PERIOD, np.mean)
+            bb_std = _rolling(close, BB_PERIOD, np.std, ddof=1)
+            out['BB_Middle'] = bb_middle
+            out['BB_Upper'] = bb_middle + bb_std * BB_STD
+            out['BB_Lower'] = bb_middle - bb_std * BB_STD
+            out['BB_Position'] = np.clip((close - out['BB_Lower']) / (out['BB_Upper'] - out['BB_Lower']), 0, 1)
+
+            # Stochastic (14, 3)
+            low_min = _rolling(low, 14, np.min)
+            high_max = _rolling(high, 14, np.max)
+            stoch_k = 100 * ((close - low_min) / (high_max - low_min))
+            stoch_d = _rolling(stoch_k, 3, np.mean)
+            out['Stoch_K'] = np.where(np.isnan(stoch_k), 50.0, stoch_k)
+            out['Stoch_D'] = np.where(np.isnan(stoch_d), 50.0, stoch_d)
+
+            # ADX / ATR
+            plus_dm = high - _shift(high)
+            minus_dm = -(low - _shift(low))
+            plus_dm = np.where(plus_dm < 0, 0.0, plus_dm)
+            minus_dm = np.where(minus_dm < 0, 0.0, minus_dm)
+
+            prev_close = _shift(close)
+            tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+            atr = _rolling(tr, ADX_PERIOD, np.mean)
+            out['ATR'] = atr
+            out['+DI'] = 100 * (_rolling(plus_dm, ADX_PERIOD, np.mean) / atr)
+            out['-DI'] = 100 * (_rolling(minus_dm, ADX_PERIOD, np.mean) / atr)
+            dx = 100 * np.abs(out['+DI'] - out['-DI']) / (out['+DI'] + out['-DI'])
+            out['ADX'] = _rolling(dx, ADX_PERIOD, np.mean)
+
+            # Volume
+            out['Volume_MA'] = _rolling(volume, VOLUME_MA_PERIOD, np.mean)
+            out['Volume_Ratio'] = volume / out['Volume_MA']
+            obv_step = np.sign(delta) * volume
+            out['OBV'] = np.cumsum(np.where(np.isnan(obv_step), 0.0, obv_step), axis=1)
+
+            # Momentum
+            close_5 = _shift(close, 5)
+            close_20 = _shift(close, 20)
+            out['Momentum_5D'] = (close - close_5) / close_5 * 100
+            out['Momentum_20D'] = (close - close_20) / close_20 * 100
+
+        return out
+
+    def _relative_strength(self, close: np.ndarray, frames: Dict[str, pd.DataFrame], symbols: List[str]) -> np.ndarray:
+        """RS_Rating vs Nifty 50 (neutral 100 when benchmark data is unavailable)"""
+        width = close.shape[1]
+        bench = np.full_like(close, np.nan)
+        benchmark = get_benchmark_series()
+
+        for row, symbol in enumerate(symbols):
+            try:
+                aligned = benchmark.get_close_aligned(frames[symbol].index)
+            except Exception:
+                aligned = None
+            if aligned is not None and np.count_nonzero(~np.isnan(aligned)) >= 20:
+                bench[row, width - len(aligned):] = aligned
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            close_20 = _shift(close, 20)
+            bench_20 = _shift(bench, 20)
+            stock_return = (close - close_20) / close_20
+            bench_return = (bench - bench_20) / bench_20
+            rs = ((1 + stock_return) / (1 + bench_return) - 1) * 100 + 100
+
+        return np.where(np.isnan(rs), 100.0, rs)
+
+    def generate_signals(self, ind: Dict[str, np.ndarray]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Vectorized TechnicalIndicators._generate_signals (latest vs previous bar)
+
+        Returns:
+            ({signal name: array of labels}, raw score array)
+        """
+        def last(name):
+            return ind[name][:, -1]
+
+        def prev(name):
+            return ind[name][:, -2]
+
+        signals = {}
+        score = np.zeros(ind['Close'].shape[0])
+
+        # 1. EMA Trend Signal
+        bullish = (last('Close') > last('EMA_21')) & (last('EMA_21') > last('EMA_50'))
+        bearish = (last('Close') < last('EMA_21')) & (last('EMA_21') < last('EMA_50'))
+        signals['ema_trend'] = np.select([bullish, bearish], ['BULLISH', 'BEARISH'], 'NEUTRAL')
+        score = score + np.select([bullish, bearish], [1.0, 0.0], 0.5)
+
+        # 2. RSI Signal
+        rsi = last('RSI')
+        conditions = [(RSI_BULLISH_THRESHOLD < rsi) & (rsi < RSI_OVERBOUGHT), rsi > RSI_OVERBOUGHT, rsi < RSI_OVERSOLD]
+        signals['rsi_signal'] = np.select(conditions, ['BULLISH', 'OVERBOUGHT', 'OVERSOLD'], 'NEUTRAL')
+        score = score + np.select(conditions, [1.0, 0.0, 0.5], 0.3)
+
+        # 3. MACD Signal
+        conditions = [
+            (last('MACD') > last('MACD_Signal')) & (last('MACD_Hist') > 0),
+            (prev('MACD') <= prev('MACD_Signal')) & (last('MACD') > last('MACD_Signal')),
+            last('MACD') < last('MACD_Signal')
+        ]
+        signals['macd_signal'] = np.select(conditions, ['BULLISH', 'BULLISH_CROSSOVER', 'BEARISH'], 'NEUTRAL')
+        score = score + np.select(conditions, [1.0, 1.2, 0.0], 0.3)
+
+        # 4. Bollinger Bands Signal
+        conditions = [last('BB_Position') > 0.8, (last('BB_Position') < 0.3) & (prev('BB_Position') < last('BB_Position'))]
+        signals['bb_signal'] = np.select(conditions, ['NEAR_UPPER', 'BOUNCE_FROM_LOWER'], 'NEUTRAL')
+        score = score + np.select(conditions, [0.0, 1.0], 0.5)
+
+        # 5. ADX Trend Strength
+        strong = last('ADX') > ADX_STRONG_TREND
+        up = last('+DI') > last('-DI')
+        conditions = [strong & up, strong]
+        signals['adx_signal'] = np.select(conditions, ['STRONG_UPTREND', 'STRONG_DOWNTREND'], 'WEAK_TREND')
+        score = score + np.select(conditions, [1.0, 0.0], 0.3)
+
+        # 6. Volume Signal
+        high_volume = last('Volume_Ratio') > VOLUME_SURGE_MULTIPLIER
+        signals['volume_signal'] = np.where(high_volume, 'HIGH_VOLUME', 'NORMAL_VOLUME')
+        score = score + np.where(high_volume, 1.0, 0.5)
+
+        # 7. Momentum Signal
+        conditions = [(last('Momentum_5D') > 3) & (last('Momentum_20D') > 5), last('Momentum_5D') > 0]
+        signals['momentum_signal'] = np.select(conditions, ['STRONG_MOMENTUM', 'POSITIVE_MOMENTUM'], 'NEGATIVE_MOMENTUM')
+        score = score + np.select(conditions, [1.0, 0.7], 0.0)
+
+        return signals, score
+
+    def calculate_all(self, frames: Dict[str, pd.DataFrame], include_df: bool = True) -> Dict[str, Optional[Dict]]:
+        """
+        Calculate all technical indicators for many stocks at once
+
+        Args:
+            frames: symbol -> daily OHLCV DataFrame
+            include_df: Attach a per-symbol indicator DataFrame ('df') like calculate_all does
+
+        Returns:
+            symbol -> same dict as TechnicalIndicators.calculate_all() (None if < min_bars)
+        """
+        results = {symbol: None for symbol in frames}
+
+        symbols, panel, lengths = self.build_panel(frames)
+        if not symbols:
+            return results
+
+        ind = self.compute(panel['Open'], panel['High'], panel['Low'], panel['Close'], panel['Volume'])
+        ind['RS_Rating'] = self._relative_strength(panel['Close'], frames, symbols)
+        signals, score = self.generate_signals(ind)
+
+        max_score = 7
+        latest = {name: values[:, -1] for name, values in ind.items()}
+
+        def value(name, row, default):
+            return latest[name][row] if name in latest else default
+
+        for row, symbol in enumerate(symbols):
+            if lengths[row] < self.min_bars:
+                continue
+
+            symbol_signals = {name: str(labels[row]) for name, labels in signals.items()}
+            symbol_signals['technical_score'] = round(score[row] / max_score * 10, 2)
+            symbol_signals['raw_score'] = score[row]
+            symbol_signals['max_score'] = max_score
+
+            df = None
+            if include_df:
+                start = ind['Close'].shape[1] - lengths[row]
+                df = pd.DataFrame({name: values[row, start:] for name, values in ind.items()},
+                                  index=frames[symbol].index)
+
+            results[symbol] = {
+                'price': latest['Close'][row],
+                'ema_8': value('EMA_8', row, 0),
+                'ema_20': value('EMA_20', row, 0),
+                'ema_21': value('EMA_21', row, 0),
+                'ema_50': value('EMA_50', row, 0),
+                'ema_200': value('EMA_200', row, 0),
+                'rsi': latest['RSI'][row],
+                'macd': latest['MACD'][row],
+                'macd_signal': latest['MACD_Signal'][row],
+                'macd_histogram': latest['MACD_Hist'][row],
+                'bb_upper': latest['BB_Upper'][row],
+                'bb_middle': latest['BB_Middle'][row],
+                'bb_lower': latest['BB_Lower'][row],
+                'bb_position': latest['BB_Position'][row],
+                'stoch_k': latest['Stoch_K'][row],
+                'stoch_d': latest['Stoch_D'][row],
+                'adx': latest['ADX'][row],
+                'plus_di': latest['+DI'][row],
+                'minus_di': latest['-DI'][row],
+                'atr': latest['ATR'][row],
+                'volume_ratio': latest['Volume_Ratio'][row],
+                'momentum_1d': value('Momentum_1D', row, 0),
+                'momentum_5d': latest['Momentum_5D'][row],
+                'momentum_20d': latest['Momentum_20D'][row],
+                'signals': symbol_signals,
+                'df': df
+            }
+
+        return results
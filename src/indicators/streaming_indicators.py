@@ -0,0 +1,475 @@
+"""
+⚡ STREAMING INDICATORS - O(1) incremental indicator state per symbol/timeframe
+
+Intraday rescans only change the LATEST candle. Instead of recomputing every
+EMA / RSI / MACD / ATR / ADX / Bollinger / volume MA over 75 days of history,
+each symbol keeps a small state object:
+
+- A NEW candle advances the state by one bar
+- An UPDATED candle (same timestamp, new prices) re-applies the last bar only
+- Work per candle is constant (fixed-size windows, no history scan)
+
+Outputs match TechnicalIndicators.calculate_all() (same dict, same signals;
+'df' is None because no history is kept). EMAs are seeded from the frame's
+first bar like calculate_all(), so a state is replayed once whenever the
+history window moves (daily: first scan of the day). Verification mode
+recomputes the full history with calculate_all() and reports any mismatch.
+
+States are persisted next to the data cache (one pickle per timeframe).
+"""
+
+import math
+import pickle
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import *
+from src.indicators.technical_indicators import TechnicalIndicators
+
+STOCH_K_PERIOD = 14  # Same as TechnicalIndicators._calculate_stochastic defaults
+STOCH_D_PERIOD = 3
+MIN_BARS = 50  # calculate_all() needs 50 bars
+
+# Values compared in verification mode
+VERIFY_KEYS = ['price', 'ema_8', 'ema_21', 'ema_50', 'ema_200', 'rsi', 'macd', 'macd_signal',
+               'macd_histogram', 'bb_upper', 'bb_middle', 'bb_lower', 'bb_position', 'stoch_k',
+               'stoch_d', 'adx', 'plus_di', 'minus_di', 'atr', 'volume_ratio', 'momentum_5d', 'momentum_20d']
+
+
+def _window_mean(values: deque, window: int) -> float:
+    """Rolling mean (NaN until the window is full of valid values - like pandas rolling)"""
+    if len(values) < window:
+        return math.nan
+    return float(np.mean(values))
+
+
+def _ema(prev: Optional[float], value: float, span: int) -> float:
+    """One step of pandas ewm(span, adjust=False)"""
+    if prev is None:
+        return value
+    alpha = 2.0 / (span + 1.0)
+    return alpha * value + (1.0 - alpha) * prev
+
+
+class _BarState:
+    """Indicator state after one bar (copied before each step)"""
+
+    def __init__(self):
+        self.bars = 0
+        self.timestamp = None
+        self.emas = {period: None for period in EMA_PERIODS}
+        self.ema_fast = None
+        self.ema_slow = None
+        self.macd_signal = None
+        self.obv = 0.0
+
+        self.closes = deque(maxlen=21)  # Momentum 5D/20D + previous close
+        self.highs = deque(maxlen=STOCH_K_PERIOD)
+        self.lows = deque(maxlen=STOCH_K_PERIOD)
+        self.gains = deque(maxlen=RSI_PERIOD)
+        self.losses = deque(maxlen=RSI_PERIOD)
+        self.bb_closes = deque(maxlen=BB_PERIOD)
+        self.stoch_k = deque(maxlen=STOCH_D_PERIOD)
+        self.plus_dm = deque(maxlen=ADX_PERIOD)
+        self.minus_dm = deque(maxlen=ADX_PERIOD)
+        self.tr = deque(maxlen=ADX_PERIOD)
+        self.dx = deque(maxlen=ADX_PERIOD)
+        self.volumes = deque(maxlen=VOLUME_MA_PERIOD)
+
+        self.prev_high = None
+        self.prev_low = None
+        self.row = {}  # Indicator values at this bar (calculate_all column names)
+
+    def copy(self) -> '_BarState':
+        """Copy with fresh windows (cheaper than deepcopy - called once per candle)"""
+        new = _BarState.__new__(_BarState)
+        new.__dict__.update(self.__dict__)
+        new.emas = dict(self.emas)
+        for name, value in self.__dict__.items():
+            if isinstance(value, deque):
+                setattr(new, name, deque(value, maxlen=value.maxlen))
+        return new
+
+
+class _TwoRows:
+    """Previous + latest row, shaped for TechnicalIndicators._generate_signals (df.iloc[-2], df.iloc[-1])"""
+
+    def __init__(self, prev: Dict, latest: Dict):
+        self.iloc = [prev, latest]
+
+
+class StreamingIndicatorState:
+    """
+    Incremental indicators for ONE symbol on ONE timeframe
+    """
+
+    def __init__(self):
+        self._committed = _BarState()  # State up to the bar BEFORE the latest one
+        self._current = None  # State including the latest bar
+        self.origin = None  # Timestamp of the first bar (EMAs are seeded from it)
+
+    @property
+    def bars(self) -> int:
+        return self._current.bars if self._current else 0
+
+    @property
+    def last_timestamp(self):
+        return self._current.timestamp if self._current else None
+
+    @property
+    def last_close(self) -> Optional[float]:
+        return self._current.row.get('Close') if self._current else None
+
+    def update(self, timestamp, open_: float, high: float, low: float, close: float, volume: float):
+        """
+        Apply one candle
+
+        Args:
+            timestamp: Candle time - same as the latest bar = UPDATE, later = NEW bar
+        """
+        if self._current is None:
+            self.origin = timestamp
+        elif timestamp != self._current.timestamp:
+            if timestamp < self._current.timestamp:
+                raise ValueError(f"candle {timestamp} is older than {self._current.timestamp}")
+            self._committed = self._current
+
+        self._current = self._step(self._committed.copy(), timestamp, open_, high, low, close, volume)
+
+    def _step(self, s: _BarState, timestamp, open_: float, high: float, low: float, close: float,
+              volume: float) -> _BarState:
+        """Advance a copied state by one bar - O(1) (fixed-size windows only)"""
+        row = {'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}
+        prev_close = s.closes[-1] if s.closes else None
+
+        # EMAs / MACD
+        for period in EMA_PERIODS:
+            s.emas[period] = _ema(s.emas[period], close, period)
+            row[f'EMA_{period}'] = s.emas[period]
+        s.ema_fast = _ema(s.ema_fast, close, MACD_FAST)
+        s.ema_slow = _ema(s.ema_slow, close, MACD_SLOW)
+        macd = s.ema_fast - s.ema_slow
+        s.macd_signal = _ema(s.macd_signal, macd, MACD_SIGNAL)
+        row['MACD'] = macd
+        row['MACD_Signal'] = s.macd_signal
+        row['MACD_Hist'] = macd - s.macd_signal
+
+        # RSI (rolling mean - first bar's missing diff counts as 0 gain / 0 loss)
+        delta = close - prev_close if prev_close is not None else math.nan
+        s.gains.append(delta if delta > 0 else 0.0)
+        s.losses.append(-delta if delta < 0 else 0.0)
+        avg_gain = _window_mean(s.gains, RSI_PERIOD)
+        avg_loss = _window_mean(s.losses, RSI_PERIOD)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = np.float64(avg_gain) / np.float64(avg_loss)
+            row['RSI'] = float(100 - (100 / (1 + rs)))
+
+        # Bollinger Bands
+        s.bb_closes.append(close)
+        if len(s.bb_closes) == BB_PERIOD:
+            window = np.array(s.bb_closes)
+            bb_middle = float(window.mean())
+            bb_std = float(window.std(ddof=1))
+        else:
+            bb_middle = bb_std = math.nan
+        row['BB_Middle'] = bb_middle
+        row['BB_Upper'] = bb_middle + bb_std * BB_STD
+        row['BB_Lower'] = bb_middle - bb_std * BB_STD
+        width = row['BB_Upper'] - row['BB_Lower']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position = float(np.float64(close - row['BB_Lower']) / np.float64(width))
+        row['BB_Position'] = position if math.isnan(position) else min(max(position, 0.0), 1.0)
+
+        # Stochastic
+        s.highs.append(high)
+        s.lows.append(low)
+        if len(s.highs) == STOCH_K_PERIOD:
+            low_min, high_max = min(s.lows), max(s.highs)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                stoch_k = float(100 * (np.float64(close - low_min) / np.float64(high_max - low_min)))
+        else:
+            stoch_k = math.nan
+        s.stoch_k.append(stoch_k)
+        stoch_d = _window_mean(s.stoch_k, STOCH_D_PERIOD)
+        row['Stoch_K'] = 50.0 if math.isnan(stoch_k) else stoch_k
+        row['Stoch_D'] = 50.0 if math.isnan(stoch_d) else stoch_d
+
+        # ADX / ATR (first bar has no +DM/-DM; TR falls back to high - low)
+        if s.prev_high is None:
+            plus_dm = minus_dm = math.nan
+            tr = high - low
+        else:
+            plus_dm = max(high - s.prev_high, 0.0)
+            minus_dm = max(s.prev_low - low, 0.0)
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        s.plus_dm.append(plus_dm)
+        s.minus_dm.append(minus_dm)
+        s.tr.append(tr)
+
+        atr = _window_mean(s.tr, ADX_PERIOD)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = float(100 * (np.float64(_window_mean(s.plus_dm, ADX_PERIOD)) / np.float64(atr)))
+            minus_di = float(100 * (np.float64(_window_mean(s.minus_dm, ADX_PERIOD)) / np.float64(atr)))
+            dx = float(100 * abs(np.float64(plus_di - minus_di)) / np.float64(plus_di + minus_di))
+        s.dx.append(dx)
+        row['ATR'] = atr
+        row['+DI'] = plus_di
+        row['-DI'] = minus_di
+        row['ADX'] = _window_mean(s.dx, ADX_PERIOD)
+
+        # Volume
+        s.volumes.append(volume)
+        row['Volume_MA'] = _window_mean(s.volumes, VOLUME_MA_PERIOD)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            row['Volume_Ratio'] = float(np.float64(volume) / np.float64(row['Volume_MA']))
+        if prev_close is not None:
+            s.obv += float(np.sign(delta)) * volume
+        row['OBV'] = s.obv
+
+        # Momentum
+        s.closes.append(close)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for days, column in ((5, 'Momentum_5D'), (20, 'Momentum_20D')):
+                if len(s.closes) > days:
+                    past = np.float64(s.closes[-1 - days])
+                    row[column] = float((close - past) / past * 100)
+                else:
+                    row[column] = math.nan
+
+        s.prev_high = high
+        s.prev_low = low
+        s.bars += 1
+        s.timestamp = timestamp
+        s.row = row
+        return s
+
+    def result(self, technical: TechnicalIndicators) -> Optional[Dict]:
+        """
+        Latest indicator dict (same shape as TechnicalIndicators.calculate_all)
+
+        Returns:
+            Dict, or None with fewer than 50 bars
+        """
+        if self._current is None or self._current.bars < MIN_BARS:
+            return None
+
+        latest = self._current.row
+        signals = technical._generate_signals(_TwoRows(self._committed.row, latest))
+
+        return {
+            'price': latest['Close'],
+            'ema_8': latest.get('EMA_8', 0),
+            'ema_20': latest.get('EMA_20', 0),
+            'ema_21': latest.get('EMA_21', 0),
+            'ema_50': latest.get('EMA_50', 0),
+            'ema_200': latest.get('EMA_200', 0),
+            'rsi': latest.get('RSI', 50),
+            'macd': latest.get('MACD', 0),
+            'macd_signal': latest.get('MACD_Signal', 0),
+            'macd_histogram': latest.get('MACD_Hist', 0),
+            'bb_upper': latest.get('BB_Upper', 0),
+            'bb_middle': latest.get('BB_Middle', 0),
+            'bb_lower': latest.get('BB_Lower', 0),
+            'bb_position': latest.get('BB_Position', 0.5),
+            'stoch_k': latest.get('Stoch_K', 50),
+            'stoch_d': latest.get('Stoch_D', 50),
+            'adx': latest.get('ADX', 0),
+            'plus_di': latest.get('+DI', 0),
+            'minus_di': latest.get('-DI', 0),
+            'atr': latest.get('ATR', 0),
+            'volume_ratio': latest.get('Volume_Ratio', 1.0),
+            'momentum_1d': latest.get('Momentum_1D', 0),
+            'momentum_5d': latest.get('Momentum_5D', 0),
+            'momentum_20d': latest.get('Momentum_20D', 0),
+            'signals': signals,
+            'df': None  # No history kept - use calculate_all() when the full frame is needed
+        }
+
+
+class StreamingIndicatorEngine:
+    """
+    Streaming indicator states for every symbol / timeframe, persisted to disk
+    """
+
+    def __init__(self, cache_dir: str = CACHE_FOLDER, verify: bool = None):
+        """
+        Initialize engine
+
+        Args:
+            cache_dir: Data cache folder (states are stored in <cache_dir>/indicator_state)
+            verify: Compare every result with a full calculate_all() recompute
+                    (default: STREAMING_INDICATORS_VERIFY)
+        """
+        self.state_dir = Path(cache_dir) / 'indicator_state'
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.verify = STREAMING_INDICATORS_VERIFY if verify is None else verify
+
+        self.technical = TechnicalIndicators()
+        self._states: Dict[str, Dict[str, StreamingIndicatorState]] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'incremental': 0,  # Results produced from 0-2 new/updated candles
+            'rebuilt': 0,  # States replayed from the full history
+            'verified': 0,
+            'mismatches': 0
+        }
+
+    def _interval_states(self, interval: str) -> Dict[str, StreamingIndicatorState]:
+        if interval not in self._states:
+            self._states[interval] = self._load(interval)
+        return self._states[interval]
+
+    def _state_path(self, interval: str) -> Path:
+        return self.state_dir / f"{interval}.pkl"
+
+    def _load(self, interval: str) -> Dict[str, StreamingIndicatorState]:
+        path = self._state_path(interval)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Error loading indicator state ({interval}): {e}")
+            return {}
+
+    def save(self):
+        """Persist all loaded states (call at the end of a scan)"""
+        with self._lock:
+            for interval, states in self._states.items():
+                path = self._state_path(interval)
+                tmp_path = path.with_suffix('.pkl.tmp')
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        pickle.dump(states, f)
+                    tmp_path.replace(path)
+                except Exception as e:
+                    print(f"⚠️ Error saving indicator state ({interval}): {e}")
+
+    @staticmethod
+    def _columns(df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        columns = {str(c).capitalize(): c for c in df.columns}
+        return tuple(df[columns[name]].to_numpy(dtype=np.float64) for name in ['Open', 'High', 'Low', 'Close', 'Volume'])
+
+    def update_from_frame(self, symbol: str, interval: str, df: pd.DataFrame) -> Optional[Dict]:
+        """
+        Bring a symbol's state up to date with its latest OHLCV frame
+
+        Only candles at/after the state's latest bar are applied. The state is
+        replayed from scratch when the history doesn't line up (first use,
+        gaps, split/dividend adjustments of older bars).
+
+        Args:
+            symbol: Stock symbol
+            interval: Timeframe key ('1d', '15m', ...)
+            df: OHLCV frame (the scanner's daily / intraday data)
+
+        Returns:
+            Same dict as TechnicalIndicators.calculate_all() (None if < 50 bars)
+        """
+        if df is None or len(df) == 0:
+            return None
+
+        open_, high, low, close, volume = self._columns(df)
+        index = df.index
+
+        with self._lock:
+            states = self._interval_states(interval)
+            state = states.get(symbol)
+            start = self._resume_position(state, index, close)
+
+            if start is None:
+                state = StreamingIndicatorState()
+                start = 0
+                self.stats['rebuilt'] += 1
+            else:
+                self.stats['incremental'] += 1
+
+            for i in range(start, len(index)):
+                state.update(index[i], open_[i], high[i], low[i], close[i], volume[i])
+            states[symbol] = state
+
+        result = state.result(self.technical)
+
+        if self.verify:
+            self._verify(symbol, interval, df, result)
+
+        return result
+
+    @staticmethod
+    def _resume_position(state: Optional[StreamingIndicatorState], index: pd.Index, close: np.ndarray) -> Optional[int]:
+        """Position of the state's latest bar in the frame (None = rebuild)"""
+        if state is None or state.last_timestamp is None:
+            return None
+
+        if index[0] != state.origin:
+            return None  # History window moved - EMAs must be re-seeded like calculate_all()
+
+        position = index.searchsorted(state.last_timestamp)
+        if position >= len(index) or index[position] != state.last_timestamp:
+            return None  # Latest bar dropped from the frame - history changed
+
+        if len(index) - position > 2:
+            return None  # Missed scans - replay is cheaper than guessing
+
+        # Older bars must be untouched (no adjustment) - compare the bar before the latest
+        committed = state._committed
+        if committed.timestamp is not None:
+            if position == 0 or index[position - 1] != committed.timestamp:
+                return None
+            if not math.isclose(close[position - 1], committed.row['Close'], rel_tol=1e-9):
+                return None
+
+        return position
+
+    def _verify(self, symbol: str, interval: str, df: pd.DataFrame, result: Optional[Dict]):
+        """Compare streaming values with a full recompute"""
+        expected = self.technical.calculate_all(df)
+        self.stats['verified'] += 1
+
+        if expected is None or result is None:
+            if (expected is None) != (result is None):
+                self.stats['mismatches'] += 1
+                print(f"⚠️ Streaming indicators {symbol} ({interval}): result={result is not None} expected={expected is not None}")
+            return
+
+        mismatched = []
+        for key in VERIFY_KEYS:
+            a, b = float(result[key]), float(expected[key])
+            if not ((math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=1e-6, abs_tol=1e-8)):
+                mismatched.append(f"{key}={a:.6g}/{b:.6g}")
+
+        for key, value in expected['signals'].items():
+            if key not in ('raw_score',) and result['signals'].get(key) != value:
+                mismatched.append(f"{key}={result['signals'].get(key)}/{value}")
+
+        if mismatched:
+            self.stats['mismatches'] += 1
+            print(f"⚠️ Streaming indicators {symbol} ({interval}) mismatch: {', '.join(mismatched[:5])}")
+
+    def get_stats(self) -> Dict:
+        """Get engine statistics"""
+        return {**self.stats, 'symbols': sum(len(states) for states in self._states.values())}
+
+
+# Singleton instance
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_streaming_engine() -> StreamingIndicatorEngine:
+    """Get shared streaming indicator engine"""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = StreamingIndicatorEngine()
+
+    return _engine
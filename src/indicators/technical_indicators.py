@@ -8,9 +8,9 @@ import numpy as np
 from typing import Dict, Tuple
 import warnings
 warnings.filterwarnings('ignore')
-import yfinance as yf
 
 from config.settings import *
+from src.data.benchmark_series import get_benchmark_series
 
 
 class TechnicalIndicators:
@@ -226,16 +226,15 @@ class TechnicalIndicators:
         RS > 100 = Outperforming, RS < 100 = Underperforming
         """
         try:
-            # Get benchmark data for same period
-            benchmark = yf.Ticker(benchmark_symbol)
-            bench_df = benchmark.history(start=df.index[0], end=df.index[-1])
-            
-            if not bench_df.empty and len(bench_df) >= 20:
+            # Get benchmark closes for same dates (shared cache - no download per stock)
+            bench_close = get_benchmark_series().get_close_aligned(df.index, benchmark_symbol)
+
+            if bench_close is not None and np.count_nonzero(~np.isnan(bench_close)) >= 20:
                 # Calculate 20-day returns for stock
                 stock_return = df['Close'].pct_change(periods=20)
                 
                 # Calculate 20-day returns for benchmark
-                bench_return = bench_df['Close'].reindex(df.index, method='ffill').pct_change(periods=20)
+                bench_return = pd.Series(bench_close, index=df.index).pct_change(periods=20)
                 
                 # RS Rating (100 = matching index)
                 df['RS_Rating'] = ((1 + stock_return) / (1 + bench_return) - 1) * 100 + 100
@@ -357,6 +356,8 @@ def test_indicators():
     """Test the technical indicators module"""
     print("🧪 Testing Technical Indicators...")
 
+    import yfinance as yf
+
     # Fetch sample data
     ticker = yf.Ticker('RELIANCE.NS')
     df = ticker.history(period='6mo')
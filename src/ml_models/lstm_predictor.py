@@ -8,18 +8,27 @@ import numpy as np
 from typing import Dict, Tuple
 import warnings
 warnings.filterwarnings('ignore')
-import yfinance as yf
 
 from config.settings import *
 
-# Try to import TensorFlow, but make it optional
-try:
-    from tensorflow import keras
-    from sklearn.preprocessing import MinMaxScaler
-    TF_AVAILABLE = True
-except ImportError:
-    TF_AVAILABLE = False
-    print("⚠️ TensorFlow not available - ML predictions disabled")
+# TensorFlow / scikit-learn are optional and take seconds to import - loaded on first use
+keras = None
+MinMaxScaler = None
+TF_AVAILABLE = None  # Unknown until _load_ml_backend() runs
+
+
+def _load_ml_backend() -> bool:
+    """Import TensorFlow + scikit-learn once (True if available)"""
+    global keras, MinMaxScaler, TF_AVAILABLE
+    if TF_AVAILABLE is None:
+        try:
+            from tensorflow import keras
+            from sklearn.preprocessing import MinMaxScaler
+            TF_AVAILABLE = True
+        except ImportError:
+            TF_AVAILABLE = False
+            print("⚠️ TensorFlow not available - ML predictions disabled")
+    return TF_AVAILABLE
 
 
 class LSTMPredictor:
@@ -35,7 +44,7 @@ class LSTMPredictor:
 
     def __init__(self):
         self.model = None
-        self.scaler = MinMaxScaler() if TF_AVAILABLE else None
+        self.scaler = None  # MinMaxScaler, created with the ML backend (_prepare_features)
         self.is_trained = False
         self.sequence_length = LSTM_SEQUENCE_LENGTH
 
@@ -50,7 +59,7 @@ class LSTMPredictor:
         Returns:
             Dict with prediction, confidence, and direction
         """
-        if not TF_AVAILABLE or not LSTM_ENABLED:
+        if not LSTM_ENABLED or not _load_ml_backend():
             # Return statistical prediction if ML not available
             return self._statistical_prediction(df, indicators)
 
@@ -167,6 +176,8 @@ class LSTMPredictor:
             df_features['ADX'] = indicators.get('adx', 0)
 
             # Normalize features
+            if self.scaler is None:
+                self.scaler = MinMaxScaler()
             scaled_features = self.scaler.fit_transform(df_features.tail(self.sequence_length))
 
             return scaled_features
@@ -183,7 +194,7 @@ class LSTMPredictor:
             historical_data: DataFrame with historical price data
             epochs: Number of training epochs
         """
-        if not TF_AVAILABLE:
+        if not _load_ml_backend():
             print("⚠️ TensorFlow not available - cannot train model")
             return False
 
@@ -259,6 +270,8 @@ def test_ml_predictor():
     """Test the ML predictor module"""
     print("🧪 Testing ML Predictor...")
 
+    import yfinance as yf
+
     # Fetch sample data
     ticker = yf.Ticker('RELIANCE.NS')
     df = ticker.history(period='6mo')
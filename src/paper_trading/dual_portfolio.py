@@ -5,11 +5,15 @@ Manages both swing and positional trading portfolios simultaneously
 
 import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from src.paper_trading.paper_trader import PaperTrader
-import yfinance as yf
-from config.settings import INITIAL_CAPITAL, SWING_CAPITAL, MAX_POSITIONS, MAX_POSITIONS_SWING
+from config.settings import (INITIAL_CAPITAL, SWING_CAPITAL, MAX_POSITIONS, MAX_POSITIONS_SWING, TRADE_STORE_CONFIG,
+                             MIN_SIGNAL_SCORE, MIN_SIGNAL_SCORE_MEAN_REVERSION, MIN_SWING_SIGNAL_SCORE,
+                             MAX_SWING_SIGNALS_PER_SCAN, MAX_POSITIONAL_SIGNALS_PER_SCAN)
+from src.data.quote_service import get_quote_service
+from src.data.trade_store import get_trade_store
 
 
 class DualPortfolio:
@@ -45,11 +49,82 @@ class DualPortfolio:
 
         self.total_initial_capital = positional_capital + swing_capital
 
+        # Signal execution (scan thread) and exit checks (exit monitor thread) must not interleave
+        self.lock = threading.RLock()
+
         print(f"💼 INTERMEDIATE Positional Strategy - Dual Portfolio Initialized:")
         print(f"   📈 Positional Portfolio (MAIN): ₹{positional_capital:,.0f} (100%) - 5-14 days, targets 5/10/15%")
         print(f"   🔥 Swing Portfolio (DISABLED): ₹{swing_capital:,.0f} (0%) - Not using swing strategy")
         print(f"   💰 Total Capital: ₹{self.total_initial_capital:,.0f} • Max {MAX_POSITIONS} positions")
 
+    @classmethod
+    def from_portfolios(cls, swing_portfolio: PaperTrader, positional_portfolio: PaperTrader) -> 'DualPortfolio':
+        """
+        Dual portfolio over existing paper traders (e.g. in-memory backtest portfolios)
+
+        Args:
+            swing_portfolio: Swing PaperTrader
+            positional_portfolio: Positional PaperTrader
+
+        Returns:
+            DualPortfolio without the default portfolio files
+        """
+        dual = cls.__new__(cls)
+        dual.swing_portfolio = swing_portfolio
+        dual.positional_portfolio = positional_portfolio
+        dual.total_initial_capital = swing_portfolio.initial_capital + positional_portfolio.initial_capital
+        dual.lock = threading.RLock()
+        return dual
+
+    @staticmethod
+    def select_signals(swing_signals: List[Dict], positional_signals: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Signals worth executing from one scan: minimum score per strategy, best first, top N
+
+        Args:
+            swing_signals: Qualified swing signals from the scanner
+            positional_signals: Qualified positional signals from the scanner
+
+        Returns:
+            (swing signals, positional signals) sorted by score, then quality score
+        """
+        # Filter by minimum score (FIX: Use correct threshold for swing and mean reversion)
+        swing_signals = [s for s in swing_signals if s.get('score', 0) >= MIN_SWING_SIGNAL_SCORE]
+        # Use strategy-specific thresholds: MR needs 7.5, others need 7.7
+        filtered_positional = []
+        for s in positional_signals:
+            score = s.get('score', 0)
+            signal_type = s.get('signal_type', 'MOMENTUM')
+            min_threshold = MIN_SIGNAL_SCORE_MEAN_REVERSION if signal_type == 'MEAN_REVERSION' else MIN_SIGNAL_SCORE
+            if score >= min_threshold:
+                filtered_positional.append(s)
+        positional_signals = filtered_positional
+
+        # Sort by score (primary) and quality score (secondary tiebreaker) - take top N
+        def get_sort_key(signal):
+            """Sort by signal score first, then quality score as tiebreaker"""
+            score = signal.get('score', 0)
+            signal_type = signal.get('signal_type', 'MOMENTUM')
+            
+            # Get quality score based on signal type
+            if signal_type == 'MEAN_REVERSION':
+                quality = signal.get('mean_reversion_score', 0)
+            elif signal_type == 'MOMENTUM':
+                quality = signal.get('momentum_score', 0)
+            elif signal_type == 'BREAKOUT':
+                quality = signal.get('breakout_score', 0)
+            else:
+                quality = 0
+            
+            # Return tuple: (signal_score, quality_score) for sorting
+            # This ensures signals with same score are sorted by quality
+            return (score, quality)
+        
+        swing_signals = sorted(swing_signals, key=get_sort_key, reverse=True)[:MAX_SWING_SIGNALS_PER_SCAN]
+        positional_signals = sorted(positional_signals, key=get_sort_key, reverse=True)[:MAX_POSITIONAL_SIGNALS_PER_SCAN]
+
+        return swing_signals, positional_signals
+
     def execute_swing_signal(self, signal: Dict) -> bool:
         """
         Execute swing trading signal with smart cross-portfolio management
@@ -60,18 +135,19 @@ class DualPortfolio:
         Returns:
             True if executed successfully
         """
-        # CRITICAL FIX #2: Check cross-portfolio duplicates
-        symbol = signal['symbol']
-        if symbol in self.positional_portfolio.positions:
-            print(f"⚠️ {symbol} already in positional portfolio, skipping swing signal")
-            return False
+        with self.lock:
+            # CRITICAL FIX #2: Check cross-portfolio duplicates
+            symbol = signal['symbol']
+            if symbol in self.positional_portfolio.positions:
+                print(f"⚠️ {symbol} already in positional portfolio, skipping swing signal")
+                return False
 
-        # Add strategy tag
-        signal['strategy'] = 'swing'
+            # Add strategy tag
+            signal['strategy'] = 'swing'
 
-        # Try to execute in swing portfolio
-        # Smart replacement will handle capital/position limits automatically
-        return self.swing_portfolio.execute_signal(signal)
+            # Try to execute in swing portfolio
+            # Smart replacement will handle capital/position limits automatically
+            return self.swing_portfolio.execute_signal(signal)
 
     def execute_positional_signal(self, signal: Dict) -> bool:
         """
@@ -83,18 +159,19 @@ class DualPortfolio:
         Returns:
             True if executed successfully
         """
-        # CRITICAL FIX #2: Check cross-portfolio duplicates
-        symbol = signal['symbol']
-        if symbol in self.swing_portfolio.positions:
-            print(f"⚠️ {symbol} already in swing portfolio, skipping positional signal")
-            return False
+        with self.lock:
+            # CRITICAL FIX #2: Check cross-portfolio duplicates
+            symbol = signal['symbol']
+            if symbol in self.swing_portfolio.positions:
+                print(f"⚠️ {symbol} already in swing portfolio, skipping positional signal")
+                return False
 
-        # Add strategy tag
-        signal['strategy'] = 'positional'
+            # Add strategy tag
+            signal['strategy'] = 'positional'
 
-        # Try to execute in positional portfolio
-        # Smart replacement will handle capital/position limits automatically
-        return self.positional_portfolio.execute_signal(signal)
+            # Try to execute in positional portfolio
+            # Smart replacement will handle capital/position limits automatically
+            return self.positional_portfolio.execute_signal(signal)
 
     def get_strategy_allocation_status(self) -> Dict:
         """
@@ -105,12 +182,12 @@ class DualPortfolio:
         Returns:
             Dict with allocation counts and what's needed next
         """
-        positions = self.positional_portfolio.positions
-
-        # Count current positions by signal type
-        mean_reversion_count = sum(1 for p in positions.values() if p.get('signal_type') == 'MEAN_REVERSION')
-        momentum_count = sum(1 for p in positions.values() if p.get('signal_type') == 'MOMENTUM')
-        total_count = len(positions)
+        # Count current positions by signal type (under the lock - the exit monitor removes positions)
+        with self.lock:
+            positions = self.positional_portfolio.positions
+            mean_reversion_count = sum(1 for p in positions.values() if p.get('signal_type') == 'MEAN_REVERSION')
+            momentum_count = sum(1 for p in positions.values() if p.get('signal_type') == 'MOMENTUM')
+            total_count = len(positions)
 
         # MOMENTUM ONLY: 6 positions, all momentum (no mean reversion)
         target_mr = 0  # No mean reversion
@@ -230,7 +307,8 @@ class DualPortfolio:
         Returns:
             Tuple of (exit signals, trailing stop activations)
         """
-        return self.swing_portfolio.check_exits(current_prices)
+        with self.lock:
+            return self.swing_portfolio.check_exits(current_prices)
 
     def monitor_positional_positions(self, current_prices: Dict[str, float]) -> tuple[List[Dict], List[Dict]]:
         """
@@ -244,7 +322,8 @@ class DualPortfolio:
         Returns:
             Tuple of (exit signals, trailing stop activations)
         """
-        return self.positional_portfolio.check_exits(current_prices)
+        with self.lock:
+            return self.positional_portfolio.check_exits(current_prices)
 
     def get_combined_summary(self) -> Dict:
         """
@@ -255,24 +334,21 @@ class DualPortfolio:
         Returns:
             Combined portfolio summary
         """
-        # Fetch current prices for all open positions
-        current_prices = {}
-
-        # Get prices for swing positions
-        for symbol in self.swing_portfolio.positions.keys():
-            price = self._get_current_price(symbol)
-            if price > 0:
-                current_prices[symbol] = price
-
-        # Get prices for positional positions
-        for symbol in self.positional_portfolio.positions.keys():
-            price = self._get_current_price(symbol)
-            if price > 0:
-                current_prices[symbol] = price
+        # Fetch current prices for all open positions (one QuoteService call) - before taking the lock,
+        # so the network round trip doesn't hold up exits
+        positions = self.get_all_open_positions()
+        current_prices = get_quote_service().get_prices(list(positions['swing']) + list(positions['positional']))
 
         # Get summaries with current market prices
-        swing_summary = self.swing_portfolio.get_summary(current_prices)
-        positional_summary = self.positional_portfolio.get_summary(current_prices)
+        with self.lock:
+            swing_summary = self.swing_portfolio.get_summary(current_prices)
+            positional_summary = self.positional_portfolio.get_summary(current_prices)
+
+        # Average holding period straight from the trade store (SQL aggregate, no trade list scan)
+        if TRADE_STORE_CONFIG['ENABLED']:
+            store = get_trade_store()
+            swing_summary['avg_holding_days'] = store.get_trade_stats(self.swing_portfolio.store_name)['avg_holding_days']
+            positional_summary['avg_holding_days'] = store.get_trade_stats(self.positional_portfolio.store_name)['avg_holding_days']
 
         # Calculate combined metrics
         total_portfolio_value = swing_summary['portfolio_value'] + positional_summary['portfolio_value']
@@ -321,31 +397,36 @@ class DualPortfolio:
 
     def get_swing_summary(self) -> Dict:
         """Get swing portfolio summary"""
-        return self.swing_portfolio.get_summary()
+        with self.lock:
+            return self.swing_portfolio.get_summary()
 
     def get_positional_summary(self) -> Dict:
         """Get positional portfolio summary"""
-        return self.positional_portfolio.get_summary()
+        with self.lock:
+            return self.positional_portfolio.get_summary()
 
     def get_all_open_positions(self) -> Dict:
         """
         Get all open positions from both portfolios
 
         Returns:
-            Dict with 'swing' and 'positional' positions
+            Dict with 'swing' and 'positional' positions (snapshots - safe to iterate
+            while the exit monitor updates the portfolios)
         """
-        return {
-            'swing': self.swing_portfolio.positions,
-            'positional': self.positional_portfolio.positions,
-        }
+        with self.lock:
+            return {
+                'swing': dict(self.swing_portfolio.positions),
+                'positional': dict(self.positional_portfolio.positions),
+            }
 
     def save_state(self):
         """Save state of both portfolios"""
-        # Both portfolios auto-save, but we can trigger explicit save
-        self.swing_portfolio._save_portfolio()
-        self.swing_portfolio._save_trades()
-        self.positional_portfolio._save_portfolio()
-        self.positional_portfolio._save_trades()
+        # Both portfolios auto-save, but we can trigger explicit save (never a half-applied exit)
+        with self.lock:
+            self.swing_portfolio._save_portfolio()
+            self.swing_portfolio._save_trades()
+            self.positional_portfolio._save_portfolio()
+            self.positional_portfolio._save_trades()
 
     def print_summary(self):
         """Print formatted summary of both portfolios"""
@@ -376,26 +457,3 @@ class DualPortfolio:
         print(f"   Positions: {summary['swing']['positions']}/7 • Holding: {summary['swing']['avg_holding_days']:.1f} days (Max: 10)")
         print(f"   Trades: {summary['swing']['trades']} (Win Rate: {summary['swing']['win_rate']:.1f}%)")
         print(f"   Strategy: Score ≥8.0 • ADX ≥30 • Targets: 2.5%, 5%, 7.5%")
-
-    def _get_current_price(self, symbol: str) -> float:
-        """
-        Fetch current market price for a symbol
-
-        Args:
-            symbol: Stock symbol (e.g., 'RELIANCE.NS')
-
-        Returns:
-            Current price or 0 if failed
-        """
-        try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='1d', interval='1d')
-
-            if not data.empty:
-                return float(data['Close'].iloc[-1])
-
-            return 0
-
-        except Exception:
-            # Silent fail - will use entry price as fallback
-            return 0
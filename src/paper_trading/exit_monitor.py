@@ -0,0 +1,158 @@
+"""
+👁️ EXIT MONITOR - Position exits on their own thread, independent of scan speed
+
+Before: exits were only checked when the scanner fired its callback (every
+50 symbols) or in the main loop between scans, so a slow scan meant a slow
+stop loss. Now each monitor job (swing / positional) runs on a background
+thread at a fixed cadence while the scanner keeps going:
+
+- Job due every N seconds -> fetch quotes (QuoteService) -> check_exits
+- Reaction time is bounded by interval + one cycle, and measured:
+  lag (how late a cycle started) and cycle duration per job
+
+The portfolio is shared with the scan thread - DualPortfolio serializes
+signal execution and exit checks with its lock.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class ExitMonitor:
+    """
+    Fixed-cadence background runner for position monitoring jobs
+    """
+
+    def __init__(self, gate: Optional[Callable[[], bool]] = None):
+        """
+        Initialize exit monitor
+
+        Args:
+            gate: Optional check run before each cycle (e.g. is_market_hours) - cycle skipped if False
+        """
+        self.gate = gate
+        self._jobs: Dict[str, Dict] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def add_job(self, name: str, interval_seconds: float, job: Callable[[], None]):
+        """
+        Register a monitoring job
+
+        Args:
+            name: Job name (e.g. 'swing', 'positional')
+            interval_seconds: Cadence (e.g. SWING_MONITOR_INTERVAL * 60)
+            job: Callable doing one full monitoring pass
+        """
+        with self._lock:
+            self._jobs[name] = {
+                'interval': float(interval_seconds),
+                'job': job,
+                'next_due': time.monotonic(),
+                'runs': 0,
+                'skipped': 0,
+                'errors': 0,
+                'last_duration': 0.0,
+                'max_duration': 0.0,
+                'max_lag': 0.0,
+                'last_run': None  # Wall clock (time.time()) of last completed cycle
+            }
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background thread (no-op if already running)"""
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        now = time.monotonic()
+        with self._lock:
+            for state in self._jobs.values():
+                state['next_due'] = now
+
+        self._thread = threading.Thread(target=self._run, name='ExitMonitor', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 30.0):
+        """Stop the thread (waits for the current cycle to finish)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            with self._lock:
+                due = [(name, state) for name, state in self._jobs.items()
+                       if time.monotonic() >= state['next_due']]
+
+            for name, state in due:
+                if self._stop_event.is_set():
+                    break
+                self._run_job(name, state)
+
+            with self._lock:
+                next_due = min((state['next_due'] for state in self._jobs.values()), default=None)
+
+            wait = 1.0 if next_due is None else max(0.0, next_due - time.monotonic())
+            self._stop_event.wait(min(wait, 1.0))
+
+    def _run_job(self, name: str, state: Dict):
+        started = time.monotonic()
+        lag = started - state['next_due']
+
+        # Fixed cadence: schedule from the due time, not from when the cycle finished
+        state['next_due'] += state['interval']
+        if state['next_due'] <= started:
+            state['next_due'] = started + state['interval']
+
+        if self.gate is not None and not self.gate():
+            state['skipped'] += 1
+            return
+
+        try:
+            state['job']()
+        except Exception as e:
+            state['errors'] += 1
+            print(f"⚠️ Exit monitor ({name}) error: {e}")
+
+        duration = time.monotonic() - started
+        state['runs'] += 1
+        state['last_duration'] = duration
+        state['max_duration'] = max(state['max_duration'], duration)
+        state['max_lag'] = max(state['max_lag'], lag)
+        state['last_run'] = time.time()
+
+    def get_stats(self) -> Dict:
+        """
+        Per-job statistics
+
+        worst_reaction_seconds bounds how long a stop/target hit can go
+        unnoticed: one interval plus the worst observed lag and cycle time.
+        """
+        with self._lock:
+            return {
+                name: {
+                    'runs': state['runs'],
+                    'skipped': state['skipped'],
+                    'errors': state['errors'],
+                    'interval_seconds': state['interval'],
+                    'last_cycle_seconds': round(state['last_duration'], 3),
+                    'max_cycle_seconds': round(state['max_duration'], 3),
+                    'max_lag_seconds': round(state['max_lag'], 3),
+                    'worst_reaction_seconds': round(state['interval'] + state['max_lag'] + state['max_duration'], 3)
+                }
+                for name, state in self._jobs.items()
+            }
+
+    def print_stats(self):
+        """Print one line per job"""
+        for name, stats in self.get_stats().items():
+            print(f"👁️ Exit monitor [{name}]: {stats['runs']} cycles • "
+                  f"last {stats['last_cycle_seconds']:.1f}s • max lag {stats['max_lag_seconds']:.1f}s • "
+                  f"worst reaction {stats['worst_reaction_seconds']:.0f}s")
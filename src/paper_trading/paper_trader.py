@@ -13,6 +13,8 @@ from config.settings import *
 from src.utils.trading_calendar import calculate_trading_days
 from src.utils.position_sizer import PositionSizer
 from src.data.enhanced_data_fetcher import EnhancedDataFetcher
+from src.paper_trading.trade_journal import TradeJournal
+from src.data.trade_store import get_trade_store, portfolio_name
 
 
 class PaperTrader:
@@ -27,7 +29,8 @@ class PaperTrader:
     - Position management (targets & stop loss)
     """
 
-    def __init__(self, capital: float = None, data_file: str = None, portfolio_file: str = None):
+    def __init__(self, capital: float = None, data_file: str = None, portfolio_file: str = None,
+                 persist: bool = True, clock=None, data_fetcher=None):
         """
         Initialize paper trader
 
@@ -35,21 +38,50 @@ class PaperTrader:
             capital: Initial capital (if starting fresh)
             data_file: Path to trades history file
             portfolio_file: Path to portfolio state file
+            persist: Load / save the portfolio files (False = in-memory portfolio, e.g. backtests)
+            clock: Object with now(tz=None) used instead of the wall clock (e.g. simulated backtest clock)
+            data_fetcher: Price / history source with get_current_price() and get_stock_data_dual()
+                          (default: EnhancedDataFetcher, created on first use)
         """
         # Use provided files or defaults
         self.trades_file = data_file if data_file else 'data/trades.json'
         self.portfolio_file = portfolio_file if portfolio_file else PAPER_TRADING_FILE
         self.initial_capital = capital if capital else PAPER_TRADING_CAPITAL
+        self.persist = persist
+        self.clock = clock
+        self._data_fetcher = data_fetcher
 
         # Initialize position sizer for volatility-based sizing
         self.position_sizer = PositionSizer()
 
+        # Append-only journal (snapshot + replay) instead of rewriting the JSON files on every change
+        self.journal = None
+        if TRADE_JOURNAL_CONFIG['ENABLED'] and persist:
+            self.journal = TradeJournal(self.portfolio_file, self.trades_file)
+
+        # SQLite store (dashboard / summary queries) - synced on every save
+        self.trade_store = get_trade_store() if TRADE_STORE_CONFIG['ENABLED'] and persist else None
+        self.store_name = portfolio_name(self.portfolio_file)
+
         # Load or initialize portfolio
-        if os.path.exists(self.portfolio_file):
+        if persist and (os.path.exists(self.portfolio_file) or (self.journal and os.path.exists(self.journal.journal_file))):
             self._load_portfolio()
         else:
             self._initialize_portfolio()
 
+    @property
+    def data_fetcher(self):
+        """Live prices + history for entries, sizing and replacements (EnhancedDataFetcher unless injected)"""
+        if self._data_fetcher is None:
+            self._data_fetcher = EnhancedDataFetcher()
+        return self._data_fetcher
+
+    def _now(self, tz=None) -> datetime:
+        """Current time (simulated clock if one was given)"""
+        if self.clock is not None:
+            return self.clock.now(tz)
+        return datetime.now(tz)
+
     def _initialize_portfolio(self):
         """Initialize new paper portfolio"""
         self.capital = self.initial_capital
@@ -63,7 +95,7 @@ class PaperTrader:
             'best_trade': 0,
             'worst_trade': 0
         }
-        self.start_date = datetime.now().isoformat()
+        self.start_date = self._now().isoformat()
         self._save_portfolio()
 
         print(f"📄 Paper Trading initialized - Capital: ₹{self.capital:,.0f}")
@@ -71,8 +103,13 @@ class PaperTrader:
     def _load_portfolio(self):
         """Load existing portfolio from file"""
         try:
-            with open(self.portfolio_file, 'r') as f:
-                data = json.load(f)
+            if self.journal is not None:
+                data, trades = self.journal.load()
+                if data is None:
+                    raise ValueError("no saved portfolio")
+            else:
+                with open(self.portfolio_file, 'r') as f:
+                    data = json.load(f)
 
             self.capital = data.get('capital', self.initial_capital)
             
@@ -81,15 +118,21 @@ class PaperTrader:
             self.positions = positions_data if isinstance(positions_data, dict) else {}
             
             self.performance = data.get('performance', {})
-            self.start_date = data.get('start_date', datetime.now().isoformat())
+            self.start_date = data.get('start_date', self._now().isoformat())
 
             # Load initial capital from saved data
             saved_initial = data.get('initial_capital')
             if saved_initial:
                 self.initial_capital = saved_initial
 
-            # Load trade history from separate file
-            self._load_trades()
+            # Load trade history from separate file (journal: already replayed)
+            if self.journal is not None:
+                self.trade_history = trades
+            else:
+                self._load_trades()
+
+            # First load with the store enabled migrates the JSON portfolio into it
+            self._sync_store()
 
             print(f"📄 Paper Portfolio loaded - Capital: ₹{self.capital:,.0f}")
 
@@ -110,8 +153,16 @@ class PaperTrader:
             self.trade_history = []
 
     def _save_portfolio(self):
-        """Save portfolio to file"""
+        """Save portfolio to file (journal: append changed positions only)"""
+        if not self.persist:
+            return
+
         try:
+            if self.journal is not None:
+                self._commit_journal()
+                self._sync_store()
+                return
+
             os.makedirs(os.path.dirname(self.portfolio_file), exist_ok=True)
 
             data = {
@@ -119,7 +170,7 @@ class PaperTrader:
                 'positions': self.positions,
                 'performance': self.performance,
                 'start_date': self.start_date,
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': self._now().isoformat(),
                 'initial_capital': self.initial_capital,
                 'mode': 'PAPER_TRADING'
             }
@@ -127,17 +178,53 @@ class PaperTrader:
             with open(self.portfolio_file, 'w') as f:
                 json.dump(data, f, indent=2)
 
+            self._sync_store()
+
         except Exception as e:
             print(f"❌ Error saving portfolio: {e}")
 
+    def _portfolio_state(self) -> Dict:
+        """Portfolio fields persisted by the journal / trade store"""
+        return {
+            'capital': self.capital,
+            'positions': self.positions,
+            'performance': self.performance,
+            'start_date': self.start_date,
+            'initial_capital': self.initial_capital
+        }
+
+    def _commit_journal(self):
+        """Append portfolio changes + new trades to the journal"""
+        self.journal.commit(self._portfolio_state(), self.trade_history)
+
+    def _sync_store(self):
+        """Mirror portfolio changes + new trades into the SQLite trade store"""
+        if self.trade_store is None:
+            return
+
+        try:
+            self.trade_store.sync_portfolio(self.store_name, self._portfolio_state(), self.trade_history)
+        except Exception as e:
+            print(f"⚠️ Trade store sync failed: {e}")
+
     def _save_trades(self):
-        """Save trade history to separate file"""
+        """Save trade history to separate file (journal: append new trades only)"""
+        if not self.persist:
+            return
+
         try:
+            if self.journal is not None:
+                self._commit_journal()
+                self._sync_store()
+                return
+
             os.makedirs(os.path.dirname(self.trades_file), exist_ok=True)
 
             with open(self.trades_file, 'w') as f:
                 json.dump(self.trade_history, f, indent=2)
 
+            self._sync_store()
+
         except Exception as e:
             print(f"❌ Error saving trades: {e}")
 
@@ -198,7 +285,7 @@ class PaperTrader:
                 # Note: datetime is already imported at top of file (line 8)
                 
                 IST = pytz.timezone('Asia/Kolkata')
-                current_time_ist = datetime.now(IST)
+                current_time_ist = self._now(IST)
                 current_hour = current_time_ist.hour
                 current_minute = current_time_ist.minute
                 current_time_str = f"{current_hour:02d}:{current_minute:02d}"
@@ -220,7 +307,7 @@ class PaperTrader:
             # For swing trades: Don't re-enter a stock that lost >1% in the last 24 hours
             if strategy == 'swing':
                 from datetime import timedelta
-                recent_cutoff = datetime.now() - timedelta(hours=24)
+                recent_cutoff = self._now() - timedelta(hours=24)
                 
                 # Check recent trades for this symbol
                 recent_losing_trades = [
@@ -292,9 +379,7 @@ class PaperTrader:
 
             # CRITICAL FIX: Get REAL-TIME price for execution (don't use cached scan price)
             # Scan price could be hours old (morning open), need current market price
-            from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-            data_fetcher = EnhancedDataFetcher()
-            current_price = data_fetcher.get_current_price(symbol)
+            current_price = self.data_fetcher.get_current_price(symbol)
 
             # Fallback to signal price if real-time fetch fails
             if current_price <= 0:
@@ -408,7 +493,7 @@ class PaperTrader:
                 'shares': shares,
                 'initial_shares': shares,  # Track initial shares for partial exit tracking
                 'entry_price': entry_price,
-                'entry_date': datetime.now().isoformat(),
+                'entry_date': self._now().isoformat(),
                 'trade_type': signal['trade_type'],
                 'target1': new_target1,
                 'target2': new_target2,
@@ -725,7 +810,7 @@ class PaperTrader:
                 try:
                     import pytz
                     IST = pytz.timezone('Asia/Kolkata')
-                    current_time_ist = datetime.now(IST)
+                    current_time_ist = self._now(IST)
                     current_hour = current_time_ist.hour
                     current_minute = current_time_ist.minute
                     current_time_str = f"{current_hour:02d}:{current_minute:02d}"
@@ -750,7 +835,7 @@ class PaperTrader:
                 try:
                     entry_date = datetime.fromisoformat(position['entry_date'])
                     # CRITICAL FIX: Use TRADING DAYS instead of calendar days
-                    trading_days_held = calculate_trading_days(entry_date, datetime.now())
+                    trading_days_held = calculate_trading_days(entry_date, self._now())
                     max_days = position['max_holding_days']
 
                     # Only exit on time if:
@@ -891,7 +976,7 @@ class PaperTrader:
             entry_date_str = position['entry_date']
             try:
                 entry_dt = datetime.fromisoformat(entry_date_str)
-                exit_dt = datetime.now()
+                exit_dt = self._now()
                 holding_days = (exit_dt - entry_dt).days
                 holding_hours = (exit_dt - entry_dt).total_seconds() / 3600
             except:
@@ -904,7 +989,7 @@ class PaperTrader:
                 'exit_price': exit_price,
                 'shares': shares_to_sell,
                 'entry_date': position['entry_date'],
-                'exit_date': datetime.now().isoformat(),
+                'exit_date': self._now().isoformat(),
                 'pnl': round(pnl, 2),  # Net P&L (after charges)
                 'pnl_percent': round(pnl_percent, 2),  # Gross % (for reference)
                 'reason': reason,
@@ -1037,8 +1122,7 @@ class PaperTrader:
                     symbol = signal.get('symbol', '')
                     if symbol:
                         # Fetch historical data for ATR calculation
-                        fetcher = EnhancedDataFetcher(api_delay=0.1)
-                        data_result = fetcher.get_stock_data_dual(symbol, verbose=False)
+                        data_result = self.data_fetcher.get_stock_data_dual(symbol, verbose=False)
                         if data_result and data_result.get('daily') is not None:
                             df = data_result['daily']
                             if df is not None and not df.empty:
@@ -1171,8 +1255,7 @@ class PaperTrader:
 
         # Find weakest position by combined P&L and score ranking
         # We need current prices to calculate P&L
-        from src.data.enhanced_data_fetcher import EnhancedDataFetcher
-        fetcher = EnhancedDataFetcher(api_delay=0.2)
+        fetcher = self.data_fetcher
 
         weakest_symbol = None
         weakest_rank = float('inf')  # Lower is worse
@@ -1235,7 +1318,7 @@ class PaperTrader:
 
         try:
             entry_date = datetime.fromisoformat(self.positions[symbol]['entry_date'])
-            return calculate_trading_days(entry_date, datetime.now())
+            return calculate_trading_days(entry_date, self._now())
         except Exception as e:
             print(f"⚠️ Error calculating trading days for {symbol}: {e}")
             return 0
@@ -0,0 +1,312 @@
+"""
+📒 TRADE JOURNAL - Append-only log for paper portfolios (snapshot + replay)
+
+Before: every change (a buy, an exit, a trailing-stop milestone) rewrote the
+whole *_portfolio.json and *_trades.json with indent=2 - cost grew with the
+trade history, and a crash mid-write could corrupt the file.
+
+Now each change appends ONE line to <portfolio>.journal.jsonl:
+- {"type": "state"}: capital / performance + only the positions that changed
+- {"type": "trade"}: one completed trade (with its index in the history)
+
+The JSON files become compacted snapshots, rewritten every
+TRADE_JOURNAL_CONFIG['SNAPSHOT_EVERY_RECORDS'] records / 'SNAPSHOT_MINUTES'
+(and at exit) via temp file + atomic rename; the journal is then truncated.
+
+Load = snapshot + replay. Replay is idempotent (state records carry absolute
+values, trades are keyed by index), so a crash between writing a snapshot and
+truncating the journal is harmless. A torn last line is skipped (and cut
+off on load, before the next append).
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import TRADE_JOURNAL_CONFIG
+
+# Portfolio fields stored in every state record (positions are diffed)
+_STATE_FIELDS = ('capital', 'performance', 'start_date', 'initial_capital')
+
+
+def _read_json(path: str):
+    """Read a JSON file (None if missing)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _read_journal(path: str) -> List[Dict]:
+    """Read journal records (skips a torn/corrupt line instead of failing)"""
+    records = []
+    if not os.path.exists(path):
+        return records
+
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+    return records
+
+
+def _drop_torn_tail(path: str) -> bool:
+    """Cut a torn last line (no trailing newline) so the next append starts on a fresh line"""
+    if not os.path.exists(path):
+        return False
+
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return False
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return False
+
+        f.seek(0)
+        keep = f.read().rfind(b'\n') + 1
+        f.truncate(keep)
+        f.flush()
+        os.fsync(f.fileno())
+
+    return True
+
+
+def _write_json_atomic(path: str, data):
+    """Write JSON to a temp file, fsync, then rename over the target"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def journal_path(portfolio_file: str) -> str:
+    """Journal file that belongs to a portfolio snapshot"""
+    base, _ = os.path.splitext(portfolio_file)
+    return f"{base}.journal.jsonl"
+
+
+def replay(portfolio_file: str, trades_file: str) -> Tuple[Optional[Dict], List[Dict], int]:
+    """
+    Rebuild portfolio state from snapshot + journal (read-only)
+
+    Safe to call from another process (e.g. the dashboard) while the trading
+    system is appending.
+
+    Returns:
+        Tuple of (portfolio dict or None if nothing saved yet, trade history, journal records replayed)
+    """
+    data = _read_json(portfolio_file)
+    trades = _read_json(trades_file)
+    trades = trades if isinstance(trades, list) else []
+    records = _read_journal(journal_path(portfolio_file))
+
+    if data is None and not records:
+        return None, trades, 0
+
+    data = dict(data or {})
+    positions = data.get('positions', {})
+    positions = dict(positions) if isinstance(positions, dict) else {}
+
+    for record in records:
+        record_type = record.get('type')
+
+        if record_type == 'state':
+            for field in _STATE_FIELDS:
+                if field in record:
+                    data[field] = record[field]
+            positions.update(record.get('upsert', {}))
+            for symbol in record.get('remove', []):
+                positions.pop(symbol, None)
+            data['last_updated'] = record.get('ts', data.get('last_updated'))
+
+        elif record_type == 'trade':
+            # Trades already in the snapshot (index < len) are skipped
+            if record.get('index', len(trades)) >= len(trades):
+                trades.append(record['trade'])
+
+    data['positions'] = positions
+    return data, trades, len(records)
+
+
+class TradeJournal:
+    """
+    Write-ahead journal for one PaperTrader (portfolio + trades files)
+    """
+
+    def __init__(self, portfolio_file: str, trades_file: str, config: Dict = None):
+        """
+        Initialize journal
+
+        Args:
+            portfolio_file: Portfolio snapshot (e.g. data/positional_portfolio.json)
+            trades_file: Trade history snapshot (e.g. data/positional_trades.json)
+            config: Dict shaped like TRADE_JOURNAL_CONFIG (default: settings)
+        """
+        config = config or TRADE_JOURNAL_CONFIG
+        self.snapshot_every = int(config['SNAPSHOT_EVERY_RECORDS'])
+        self.snapshot_seconds = float(config['SNAPSHOT_MINUTES']) * 60
+
+        self.portfolio_file = portfolio_file
+        self.trades_file = trades_file
+        self.journal_file = journal_path(portfolio_file)
+
+        self._lock = threading.Lock()
+        self._persisted_positions: Dict[str, str] = {}  # symbol -> serialized position (as last journaled)
+        self._persisted_state: Dict = {}
+        self._persisted_trades = 0
+        self._snapshot_trades = 0  # Trades already in the trades snapshot
+        self._pending_records = 0
+        self._last_snapshot = time.monotonic()
+        self._last_commit: Optional[Tuple[Dict, List[Dict]]] = None
+
+        self.stats = {
+            'records': 0,
+            'snapshots': 0,
+            'replayed': 0
+        }
+
+        atexit.register(self.close)
+
+    def load(self) -> Tuple[Optional[Dict], List[Dict]]:
+        """
+        Load snapshot + replay journal, and use it as the diff baseline
+
+        Returns:
+            Tuple of (portfolio dict or None if nothing saved yet, trade history)
+        """
+        data, trades, replayed = replay(self.portfolio_file, self.trades_file)
+
+        with self._lock:
+            # A crash mid-append leaves a partial line - appending after it would corrupt the next record
+            if _drop_torn_tail(self.journal_file):
+                print(f"⚠️ Trade journal: dropped a torn last line in {self.journal_file}")
+            snapshot_trades = _read_json(self.trades_file)
+            self._snapshot_trades = len(snapshot_trades) if isinstance(snapshot_trades, list) else 0
+            self._pending_records = replayed
+            self.stats['replayed'] = replayed
+
+            if data is not None:
+                self._set_baseline(data, trades)
+                # Replayed records are compacted by the next due snapshot (or at exit)
+                self._last_commit = ({field: data.get(field) for field in _STATE_FIELDS + ('positions',)}, trades)
+
+        return data, trades
+
+    def _set_baseline(self, state: Dict, trade_history: List[Dict]):
+        self._persisted_positions = {
+            symbol: json.dumps(position, sort_keys=True)
+            for symbol, position in state.get('positions', {}).items()
+        }
+        self._persisted_state = {field: json.dumps(state.get(field), sort_keys=True) for field in _STATE_FIELDS}
+        self._persisted_trades = len(trade_history)
+
+    def commit(self, state: Dict, trade_history: List[Dict]):
+        """
+        Journal whatever changed since the last commit (O(open positions + new trades), not O(history))
+
+        Args:
+            state: Portfolio dict (capital, positions, performance, start_date, initial_capital)
+            trade_history: Full trade history list (only new entries are written)
+        """
+        with self._lock:
+            self._last_commit = (state, trade_history)
+            records = []
+            now = datetime.now().isoformat()
+
+            # Positions that changed / disappeared
+            positions = state.get('positions', {})
+            serialized = {symbol: json.dumps(position, sort_keys=True) for symbol, position in positions.items()}
+            upsert = {symbol: positions[symbol] for symbol, text in serialized.items()
+                      if self._persisted_positions.get(symbol) != text}
+            remove = [symbol for symbol in self._persisted_positions if symbol not in serialized]
+
+            state_serialized = {field: json.dumps(state.get(field), sort_keys=True) for field in _STATE_FIELDS}
+            if upsert or remove or state_serialized != self._persisted_state:
+                record = {'type': 'state', 'ts': now}
+                record.update({field: state.get(field) for field in _STATE_FIELDS})
+                record['upsert'] = upsert
+                record['remove'] = remove
+                records.append(record)
+
+            # Completed trades not yet journaled
+            for index in range(self._persisted_trades, len(trade_history)):
+                records.append({'type': 'trade', 'ts': now, 'index': index, 'trade': trade_history[index]})
+
+            if records:
+                lines = ''.join(json.dumps(record) + '\n' for record in records)
+                directory = os.path.dirname(self.journal_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.journal_file, 'a') as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                self._persisted_positions = serialized
+                self._persisted_state = state_serialized
+                self._persisted_trades = len(trade_history)
+                self._pending_records += len(records)
+                self.stats['records'] += len(records)
+
+            due = (not os.path.exists(self.portfolio_file) or
+                   self._pending_records >= self.snapshot_every or
+                   (self._pending_records > 0 and time.monotonic() - self._last_snapshot >= self.snapshot_seconds))
+
+            if due:
+                self._snapshot(state, trade_history)
+
+    def _snapshot(self, state: Dict, trade_history: List[Dict]):
+        """Write compacted snapshots (atomic rename), then truncate the journal"""
+        data = dict(state)
+        data['last_updated'] = datetime.now().isoformat()
+        data['mode'] = 'PAPER_TRADING'
+
+        # Trades first: a crash before the portfolio snapshot just replays (skips) them
+        if len(trade_history) != self._snapshot_trades or not os.path.exists(self.trades_file):
+            _write_json_atomic(self.trades_file, trade_history)
+            self._snapshot_trades = len(trade_history)
+
+        _write_json_atomic(self.portfolio_file, data)
+
+        with open(self.journal_file, 'w'):
+            pass
+
+        self._pending_records = 0
+        self._last_snapshot = time.monotonic()
+        self.stats['snapshots'] += 1
+
+    def snapshot(self):
+        """Force a snapshot of the last committed state"""
+        with self._lock:
+            if self._last_commit is not None:
+                self._snapshot(*self._last_commit)
+
+    def close(self):
+        """Snapshot pending records (registered with atexit)"""
+        with self._lock:
+            if self._last_commit is not None and self._pending_records > 0:
+                try:
+                    self._snapshot(*self._last_commit)
+                except Exception as e:
+                    print(f"⚠️ Trade journal snapshot failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """Get journal statistics"""
+        return {**self.stats, 'pending_records': self._pending_records}
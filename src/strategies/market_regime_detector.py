@@ -5,11 +5,11 @@ Professional feature used by institutional traders
 """
 
 import pandas as pd
-import yfinance as yf
 from datetime import datetime
 from typing import Dict, Tuple
 
 from config.settings import MARKET_REGIME_CONFIG, NIFTY_SYMBOL
+from src.data.benchmark_series import get_benchmark_series
 
 
 class MarketRegimeDetector:
@@ -37,9 +37,8 @@ class MarketRegimeDetector:
             regime_details: Dict with analysis details
         """
         try:
-            # Fetch Nifty 50 data
-            nifty = yf.Ticker(NIFTY_SYMBOL)
-            df = nifty.history(period=self.config['LOOKBACK_PERIOD'])
+            # Fetch Nifty 50 data (shared benchmark cache)
+            df = get_benchmark_series().get_history(NIFTY_SYMBOL, period=self.config['LOOKBACK_PERIOD'])
             
             if df is None or len(df) < 50:
                 print("⚠️ Insufficient Nifty data for regime detection")
@@ -3,11 +3,11 @@
 Uses both Daily and 15-minute candles for better entry/exit timing
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 from datetime import datetime
 
-from src.data.data_fetcher import DataFetcher
 from src.indicators.technical_indicators import TechnicalIndicators
 from src.indicators.mathematical_indicators import MathematicalIndicators
 
@@ -22,10 +22,18 @@ class MultiTimeframeAnalyzer:
     """
 
     def __init__(self):
-        self.data_fetcher = DataFetcher()
+        self._data_fetcher = None  # Only analyze(symbol) fetches - the scanner passes its own data
         self.technical_indicators = TechnicalIndicators()
         self.mathematical_indicators = MathematicalIndicators()
 
+    @property
+    def data_fetcher(self):
+        """DataFetcher (+ its disk cache), created on first analyze(symbol)"""
+        if self._data_fetcher is None:
+            from src.data.data_fetcher import DataFetcher
+            self._data_fetcher = DataFetcher()
+        return self._data_fetcher
+
     def analyze(self, symbol: str) -> Optional[Dict]:
         """
         Perform multi-timeframe analysis
@@ -65,7 +73,8 @@ class MultiTimeframeAnalyzer:
             print(f"⚠️ Error analyzing {symbol}: {e}")
             return None
 
-    def analyze_stock(self, symbol: str, daily_df: pd.DataFrame, intraday_df: Optional[pd.DataFrame] = None, market_regime: Optional[str] = None) -> Optional[Dict]:
+    def analyze_stock(self, symbol: str, daily_df: pd.DataFrame, intraday_df: Optional[pd.DataFrame] = None, market_regime: Optional[str] = None,
+                      daily_indicators: Optional[Dict] = None) -> Optional[Dict]:
         """
         Perform multi-timeframe analysis with pre-fetched data
 
@@ -76,6 +85,7 @@ class MultiTimeframeAnalyzer:
             daily_df: Pre-fetched daily OHLCV data
             intraday_df: Pre-fetched 15-min OHLCV data (optional)
             market_regime: Current market regime ('BULL', 'SIDEWAYS', 'BEAR') for adaptive classification
+            daily_indicators: Pre-computed daily indicators (PanelIndicators) - skips calculate_all
 
         Returns:
             Dictionary with analysis results or None
@@ -85,7 +95,7 @@ class MultiTimeframeAnalyzer:
                 return None
 
             # Analyze daily timeframe (trend confirmation)
-            daily_analysis = self._analyze_daily(daily_df)
+            daily_analysis = self._analyze_daily(daily_df, indicators=daily_indicators)
 
             # Analyze 15-minute timeframe (entry/exit timing) if available
             intraday_analysis = self._analyze_intraday(intraday_df) if intraday_df is not None and len(intraday_df) > 10 else None
@@ -100,18 +110,20 @@ class MultiTimeframeAnalyzer:
             # Silent fail for individual stocks
             return None
 
-    def _analyze_daily(self, df: pd.DataFrame) -> Dict:
+    def _analyze_daily(self, df: pd.DataFrame, indicators: Optional[Dict] = None) -> Dict:
         """
         Analyze daily timeframe for trend and signal quality
 
         Args:
             df: Daily OHLCV data
+            indicators: Pre-computed calculate_all() result (e.g. from PanelIndicators)
 
         Returns:
             Daily analysis results
         """
-        # Calculate technical indicators
-        indicators = self.technical_indicators.calculate_all(df)
+        # Calculate technical indicators (unless computed for the whole batch already)
+        if indicators is None:
+            indicators = self.technical_indicators.calculate_all(df)
 
         # Check if indicators failed
         if indicators is None:
@@ -656,21 +668,23 @@ class MultiTimeframeAnalyzer:
         # Analyze last 10 days to detect oversold -> bounce timing
         df = daily.get('df')
 
+        # RSI for every day, computed ONCE (same values as _calculate_rsi on each prefix)
+        rsi_history = self._rsi_history(df, 14) if df is not None else None
+
         if df is not None and len(df) >= 10:
-            # Get last 10 days of RSI to detect oversold period
-            last_10_days = df.tail(11).iloc[:-1]  # Exclude current day
+            # Get last 10 days of RSI to detect oversold period (excluding current day)
+            last_10_rsi = rsi_history[-11:-1]
 
             # Find when RSI was last oversold (<30)
             oversold_days_ago = None
-            for i, (idx, row) in enumerate(last_10_days[::-1].iterrows()):
-                row_rsi = self._calculate_rsi(df.loc[:idx, 'Close'], 14)
+            for i, row_rsi in enumerate(last_10_rsi[::-1]):
                 if row_rsi < 30:
                     oversold_days_ago = i + 1
                     break
 
             # Check if RSI is now rising (bounce confirmation)
             current_rsi = rsi
-            yesterday_rsi = self._calculate_rsi(df['Close'].iloc[:-1], 14) if len(df) >= 15 else current_rsi
+            yesterday_rsi = rsi_history[-2] if len(df) >= 15 else current_rsi
             rsi_rising = current_rsi > yesterday_rsi
 
             # Check if price is bouncing off support (20-MA or Bollinger lower band)
@@ -794,7 +808,7 @@ class MultiTimeframeAnalyzer:
         if df is not None and len(df) >= 15:
             try:
                 current_rsi_check = rsi
-                yesterday_rsi_check = self._calculate_rsi(df['Close'].iloc[:-1], 14)
+                yesterday_rsi_check = rsi_history[-2]
                 is_bouncing_up = current_rsi_check > yesterday_rsi_check and current_rsi_check >= 30
             except:
                 pass
@@ -1262,6 +1276,28 @@ class MultiTimeframeAnalyzer:
 
         return quality
 
+    def _rsi_history(self, df: pd.DataFrame, period: int = 14) -> np.ndarray:
+        """
+        RSI at every bar in one O(n) pass
+
+        Element i equals _calculate_rsi(df['Close'].iloc[:i + 1], period)
+        (rolling RSI is causal, so each prefix gives the same value).
+
+        Args:
+            df: OHLCV (or indicator) DataFrame
+            period: RSI period (default 14)
+
+        Returns:
+            Array of RSI values (50.0 where not enough data)
+        """
+        delta = df['Close'].diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        rsi = (100 - (100 / (1 + gain / loss))).to_numpy(dtype=float, copy=True)
+
+        rsi[:period] = np.nan  # _calculate_rsi needs period + 1 prices
+        return np.where(np.isnan(rsi), 50.0, rsi)
+
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> float:
         """
         Calculate RSI for a price series
@@ -4,12 +4,12 @@ Tracks Indian market sector performance vs Nifty 50
 Identifies leading and lagging sectors for better signal selection
 """
 
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 
 from config.settings import SECTOR_ROTATION_CONFIG, NIFTY_SYMBOL
+from src.data.benchmark_series import get_benchmark_series
 
 
 class SectorRotationTracker:
@@ -103,10 +103,8 @@ class SectorRotationTracker:
     def _get_index_return(self, symbol: str, days: int) -> float:
         """Get index return over specified days"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days+10)  # Extra buffer
-            
-            data = yf.download(symbol, start=start_date, end=end_date, progress=False)
+            # Shared benchmark cache - each index/stock downloaded once per refresh window
+            data = get_benchmark_series().get_history(symbol, days=days+10)  # Extra buffer
             
             if data is None or len(data) < 2:
                 return None
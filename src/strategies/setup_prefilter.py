@@ -0,0 +1,202 @@
+"""
+🔻 SETUP PRE-FILTER - Cheap vectorized gates before full multi-timeframe analysis
+
+Most symbols are rejected by the simple gates of _is_swing_setup /
+_is_positional_setup (uptrend, ADX, RSI band, volume, minimum signal score),
+but only after Fibonacci / Elliott / Gann / S&R and quality scoring ran.
+This stage evaluates the NECESSARY conditions of those gates on the latest
+indicator values of a whole batch at once (one NumPy array per field):
+
+- Uptrend: price above EMA 50 or EMA 200 (same trend rules as _analyze_daily)
+- ADX / RSI / volume gates of every signal type (type is not known yet - any type may pass)
+- Signal score UPPER BOUND: technical score + trend score with the best possible
+  math score, intraday entry quality and strategy boost (_combine_timeframes)
+
+A symbol is dropped only if it fails every swing AND positional path, so
+the signals produced are unchanged. Comparisons mirror the original code
+(NaN included). Verification mode (SETUP_PREFILTER_CONFIG['VERIFY']) runs the
+full analysis on dropped symbols anyway and reports any that had a setup.
+"""
+
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from config.settings import (SETUP_PREFILTER_CONFIG, MIN_SIGNAL_SCORE, MIN_SIGNAL_SCORE_MEAN_REVERSION,
+                             MIN_SWING_SIGNAL_SCORE, VOLUME_SWING_MULTIPLIER)
+
+# Best case of the parts of signal_score computed after this stage (MultiTimeframeAnalyzer._combine_timeframes)
+MAX_MATH_SCORE = 10.0
+MAX_ENTRY_QUALITY = 10.0
+MAX_MEAN_REVERSION_BOOST = 2.4  # 1.5 (MR quality) + 0.7 (stock trend) + 0.2 (sideways market)
+MAX_MOMENTUM_BOOST = 0.5  # Strong uptrend
+SCORE_TOLERANCE = 1e-6  # Float rounding slack - the bound must never be below the real score
+
+
+class SetupPreFilter:
+    """
+    Batch-wide necessary conditions for a swing or positional setup
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize pre-filter
+
+        Args:
+            config: Dict shaped like SETUP_PREFILTER_CONFIG (default: settings)
+        """
+        config = config or SETUP_PREFILTER_CONFIG
+        self.verify = bool(config['VERIFY'])
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start counting for a new scan"""
+        self.stats = {
+            'evaluated': 0,
+            'passed': 0,
+            'seconds': 0.0,
+            'verified': 0,
+            'mismatches': 0  # Dropped symbols that had a setup (verification mode)
+        }
+
+    def evaluate(self, indicators: Dict[str, Optional[Dict]]) -> Dict[str, bool]:
+        """
+        Evaluate the gates for many symbols at once
+
+        Args:
+            indicators: {symbol: calculate_all()-shaped dict} (None = not available, always passes)
+
+        Returns:
+            {symbol: True if the symbol may produce a setup (run full analysis)}
+        """
+        start = time.time()
+        symbols = [symbol for symbol, values in indicators.items() if values is not None]
+        result = {symbol: True for symbol, values in indicators.items() if values is None}
+
+        if symbols:
+            gates = self._gates([indicators[symbol] for symbol in symbols])
+            result.update(zip(symbols, (gates['swing'] | gates['positional']).tolist()))
+
+        self.stats['evaluated'] += len(result)
+        self.stats['passed'] += sum(result.values())
+        self.stats['seconds'] += time.time() - start
+        return result
+
+    def distance(self, indicators: Dict[str, Optional[Dict]]) -> Dict[str, Optional[float]]:
+        """
+        How far each symbol is from passing the gates (used to rank symbols for rescans)
+
+        Sum of normalized shortfalls on the closest swing/positional path:
+        trend gap (price below the lower EMA, x10 per 100%), ADX shortfall
+        (fraction of the required ADX), RSI outside its band (per 10 points),
+        volume shortfall (fraction of the required ratio) and signal score
+        bound shortfall (per 10 points). NaN values count as passing, like the gates.
+
+        Args:
+            indicators: {symbol: calculate_all()-shaped dict} (None = not available)
+
+        Returns:
+            {symbol: 0.0 if the symbol may produce a setup, else distance > 0 (None = not available)}
+        """
+        symbols = [symbol for symbol, values in indicators.items() if values is not None]
+        result = {symbol: None for symbol, values in indicators.items() if values is None}
+
+        if symbols:
+            gates = self._gates([indicators[symbol] for symbol in symbols])
+            rsi = gates['rsi']
+
+            def shortfall(gap):
+                return np.nan_to_num(np.maximum(gap, 0.0), nan=0.0)
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                trend_gap = shortfall(np.minimum(gates['ema_50'], gates['ema_200']) / gates['price'] - 1.0) * 10.0
+
+                def path(min_adx, min_score, boost, rsi_band=None, min_volume=None):
+                    gap = shortfall((min_adx - gates['adx']) / min_adx)
+                    gap = gap + shortfall(min_score - gates['score_bound'](boost)) / 10.0
+                    if rsi_band is not None:
+                        gap = gap + shortfall(np.maximum(rsi_band[0] - rsi, rsi - rsi_band[1])) / 10.0
+                    if min_volume is not None:
+                        gap = gap + shortfall((min_volume - gates['volume_ratio']) / min_volume)
+                    return gap
+
+                closest_path = np.minimum.reduce([
+                    path(12, MIN_SWING_SIGNAL_SCORE, MAX_MEAN_REVERSION_BOOST, (40, 72), VOLUME_SWING_MULTIPLIER),
+                    path(12, MIN_SIGNAL_SCORE_MEAN_REVERSION, MAX_MEAN_REVERSION_BOOST),
+                    path(22, MIN_SIGNAL_SCORE, MAX_MOMENTUM_BOOST),
+                    path(18, MIN_SIGNAL_SCORE, 0.0, (40, 75), 1.5)
+                ])
+
+            distance = np.where(gates['swing'] | gates['positional'], 0.0, trend_gap + closest_path)
+            result.update(zip(symbols, distance.tolist()))
+
+        return result
+
+    def _gates(self, rows) -> Dict:
+        """Indicator arrays + swing / positional gate verdicts for a list of indicator dicts"""
+
+        def column(name, default=0.0):
+            return np.array([row.get(name, default) for row in rows], dtype=np.float64)
+
+        price = column('price')
+        ema_50 = column('ema_50')
+        ema_200 = column('ema_200')
+        adx = column('adx')
+        rsi = column('rsi')
+        technical_score = np.array([row.get('signals', {}).get('technical_score', 5.0) for row in rows], dtype=np.float64)
+        # Analyzer passes volume_ratio 1.5 for a 'STRONG' volume trend, else 1.0
+        volume_ratio = np.array([1.5 if row.get('signals', {}).get('volume_signal') == 'STRONG' else 1.0 for row in rows])
+
+        with np.errstate(invalid='ignore'):
+            # Trend (same order of rules as _analyze_daily)
+            trend_score = np.select(
+                [(price > ema_50) & (ema_50 > ema_200), price > ema_50, price > ema_200, (price < ema_50) & (ema_50 < ema_200)],
+                [10.0, 8.0, 6.0, 2.0],
+                default=5.0
+            )
+            uptrend = (price > ema_50) | (price > ema_200)
+
+            # Highest overall_quality possible (with or without intraday data)
+            quality_bound = technical_score * 0.50 + np.maximum(
+                trend_score * 0.30 + MAX_ENTRY_QUALITY * 0.10 + MAX_MATH_SCORE * 0.10,
+                trend_score * 0.40 + MAX_MATH_SCORE * 0.10
+            ) + SCORE_TOLERANCE
+
+            def score_bound(boost):
+                return np.minimum(10.0 + SCORE_TOLERANCE, quality_bound + boost)
+
+            rsi_swing = (40 <= rsi) & (rsi <= 72)
+
+            swing = (uptrend & ~(adx < 12) & rsi_swing & ~(volume_ratio < VOLUME_SWING_MULTIPLIER) &
+                     (score_bound(MAX_MEAN_REVERSION_BOOST) >= MIN_SWING_SIGNAL_SCORE))
+
+            mean_reversion = ~(adx < 12) & (score_bound(MAX_MEAN_REVERSION_BOOST) >= MIN_SIGNAL_SCORE_MEAN_REVERSION)
+            momentum = ~(adx < 22) & (score_bound(MAX_MOMENTUM_BOOST) >= MIN_SIGNAL_SCORE)
+            breakout = (~(adx < 18) & (40 <= rsi) & (rsi <= 75) & ~(volume_ratio < 1.5) &
+                        (score_bound(0.0) >= MIN_SIGNAL_SCORE))
+            positional = uptrend & (mean_reversion | momentum | breakout)
+
+        return {
+            'price': price,
+            'ema_50': ema_50,
+            'ema_200': ema_200,
+            'adx': adx,
+            'rsi': rsi,
+            'volume_ratio': volume_ratio,
+            'score_bound': score_bound,
+            'swing': swing,
+            'positional': positional
+        }
+
+    def record_verification(self, symbol: str, signals: Dict):
+        """Verification mode: full analysis result of a dropped symbol"""
+        self.stats['verified'] += 1
+        if signals.get('swing') is not None or signals.get('positional') is not None:
+            self.stats['mismatches'] += 1
+            print(f"\n⚠️ Pre-filter dropped {symbol} but full analysis found a setup")
+
+    def get_stats(self) -> Dict:
+        """Get pre-filter statistics"""
+        return dict(self.stats)
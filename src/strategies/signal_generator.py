@@ -11,7 +11,6 @@ from datetime import datetime
 from config.settings import *
 from src.indicators.technical_indicators import TechnicalIndicators
 from src.indicators.mathematical_indicators import MathematicalIndicators
-from src.ml_models.lstm_predictor import LSTMPredictor
 
 
 class SignalGenerator:
@@ -30,7 +29,15 @@ class SignalGenerator:
     def __init__(self):
         self.technical = TechnicalIndicators()
         self.mathematical = MathematicalIndicators()
-        self.ml_predictor = LSTMPredictor()
+        self._ml_predictor = None
+
+    @property
+    def ml_predictor(self):
+        """LSTMPredictor (ML stack imported on first prediction, not at startup)"""
+        if self._ml_predictor is None:
+            from src.ml_models.lstm_predictor import LSTMPredictor
+            self._ml_predictor = LSTMPredictor()
+        return self._ml_predictor
 
     def generate_signal(self, symbol: str, df: pd.DataFrame) -> Optional[Dict]:
         """
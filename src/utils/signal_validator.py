@@ -5,8 +5,8 @@ Validates trading signals for freshness, liquidity, and quality
 
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional
-import yfinance as yf
 from config.settings import *
+from src.data.rate_limiter import get_rate_limiter, is_rate_limit_error
 
 
 class SignalValidator:
@@ -83,10 +83,13 @@ class SignalValidator:
         Returns:
             (is_liquid, reason)
         """
+        import yfinance as yf
+
         try:
             ticker = yf.Ticker(symbol)
 
             # Get recent trading data
+            get_rate_limiter().acquire()
             hist = ticker.history(period='5d')
 
             if hist.empty:
@@ -108,6 +111,8 @@ class SignalValidator:
             return True, "OK"
 
         except Exception as e:
+            if is_rate_limit_error(e):
+                get_rate_limiter().report_rate_limit()
             print(f"⚠️ Liquidity check error for {symbol}: {e}")
             return True, "OK"  # Default to allow on error (conservative)
 
@@ -129,8 +134,11 @@ class SignalValidator:
         Returns:
             (is_acceptable, reason)
         """
+        import yfinance as yf
+
         try:
             ticker = yf.Ticker(symbol)
+            get_rate_limiter().acquire()
             hist = ticker.history(period='1d')
 
             if hist.empty:
@@ -154,6 +162,8 @@ class SignalValidator:
             return True, "OK"
 
         except Exception as e:
+            if is_rate_limit_error(e):
+                get_rate_limiter().report_rate_limit()
             print(f"⚠️ Spread check error for {symbol}: {e}")
             return True, "OK"  # Default to allow
 
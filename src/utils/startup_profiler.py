@@ -0,0 +1,103 @@
+"""
+⏱️ STARTUP PROFILER - Where does a cold start of main_eod_system go?
+Run: python main_eod_system.py --profile-startup
+
+Starts a FRESH interpreter with Python's own import profiler (-X importtime),
+imports main_eod_system and builds EODIntradaySystem, then reports:
+- Wall time of the imports and of the system initialization
+- Slowest packages (cumulative import time of each top-level package)
+- Slowest project modules (src.* / config.*)
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+STARTUP_TARGET_SECONDS = 1.0
+
+# Runs in the child interpreter (stdout = system banners, last line = timings)
+_CHILD_CODE = """
+import json, time
+start = time.perf_counter()
+import main_eod_system
+imported = time.perf_counter()
+main_eod_system.EODIntradaySystem()
+ready = time.perf_counter()
+print('\\n' + json.dumps({'imports': imported - start, 'init': ready - imported}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """-X importtime lines -> [(module, depth, self_us, cumulative_us)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            depth = (len(name) - len(name.lstrip())) // 2
+            rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return rows
+
+
+def _package_times(rows: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """Self time of every module summed per top-level package (microseconds)"""
+    packages = {}
+    for name, _, self_us, _ in rows:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+
+def profile_startup(top: int = 12) -> Dict:
+    """
+    Profile a cold start in a child interpreter and print the report
+
+    Args:
+        top: Number of packages / modules to list
+
+    Returns:
+        Dict with imports_seconds, init_seconds, total_seconds, packages ({name: seconds})
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD_CODE],
+        capture_output=True, text=True, env=env
+    )
+    if completed.returncode != 0:
+        print(f"❌ Startup profile failed:\n{completed.stderr[-2000:]}")
+        return {}
+
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    rows = _parse_importtime(completed.stderr)
+    packages = _package_times(rows)
+    total = timings['imports'] + timings['init']
+
+    print(f"\n{'='*70}")
+    print(f"⏱️ STARTUP PROFILE (fresh interpreter)")
+    print(f"{'='*70}")
+    print(f"📦 Imports: {timings['imports']:.3f}s | 🏗️ System init: {timings['init']:.3f}s | "
+          f"Total: {total:.3f}s {'✅' if total < STARTUP_TARGET_SECONDS else '⚠️'} (target < {STARTUP_TARGET_SECONDS:.0f}s)")
+
+    print(f"\n📦 Slowest packages (self time of all their modules):")
+    for name, micros in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"   {name:30s} {micros / 1e6:7.3f}s")
+
+    project = [row for row in rows if row[0].split('.')[0] in ('src', 'config', 'main_eod_system')]
+    print(f"\n🧩 Slowest project modules (cumulative - includes what they import):")
+    for name, _, _, cumulative_us in sorted(project, key=lambda row: row[3], reverse=True)[:top]:
+        print(f"   {name:45s} {cumulative_us / 1e6:7.3f}s")
+    print(f"{'='*70}")
+
+    return {
+        'imports_seconds': timings['imports'],
+        'init_seconds': timings['init'],
+        'total_seconds': total,
+        'packages': {name: micros / 1e6 for name, micros in packages.items()}
+    }
@@ -1,52 +1,205 @@
 """
 📅 Trading Calendar Utility
 Calculate trading days excluding weekends and NSE holidays
+
+The NSE sessions of TRADING_CALENDAR_CONFIG's year range are precomputed once
+into a sorted NumPy array plus a per-calendar-day ordinal (sessions on or
+before that day), so trading-day counts, next / previous session and session
+ranges are array lookups instead of day-by-day loops. Holidays are read from
+HOLIDAYS_FILE (config/nse_holidays.csv).
 """
 
-from datetime import datetime, timedelta
-from typing import List
-
-# NSE Holidays for 2024-2025
-# Source: https://www.nseindia.com/regulations/holiday-master-2024
-NSE_HOLIDAYS_2024 = [
-    datetime(2024, 1, 26),  # Republic Day
-    datetime(2024, 3, 8),   # Maha Shivaratri
-    datetime(2024, 3, 25),  # Holi
-    datetime(2024, 3, 29),  # Good Friday
-    datetime(2024, 4, 11),  # Id-Ul-Fitr
-    datetime(2024, 4, 17),  # Shri Ram Navami
-    datetime(2024, 4, 21),  # Mahavir Jayanti
-    datetime(2024, 5, 1),   # Maharashtra Day
-    datetime(2024, 6, 17),  # Bakri Id
-    datetime(2024, 7, 17),  # Moharram
-    datetime(2024, 8, 15),  # Independence Day
-    datetime(2024, 10, 2),  # Mahatma Gandhi Jayanti
-    datetime(2024, 11, 1),  # Diwali
-    datetime(2024, 11, 15), # Guru Nanak Jayanti
-    datetime(2024, 12, 25), # Christmas
-]
-
-NSE_HOLIDAYS_2025 = [
-    datetime(2025, 1, 26),  # Republic Day
-    datetime(2025, 2, 26),  # Maha Shivaratri
-    datetime(2025, 3, 14),  # Holi
-    datetime(2025, 3, 31),  # Id-Ul-Fitr
-    datetime(2025, 4, 10),  # Mahavir Jayanti
-    datetime(2025, 4, 14),  # Dr. Ambedkar Jayanti
-    datetime(2025, 4, 18),  # Good Friday
-    datetime(2025, 5, 1),   # Maharashtra Day
-    datetime(2025, 6, 7),   # Bakri Id
-    datetime(2025, 8, 15),  # Independence Day
-    datetime(2025, 8, 27),  # Ganesh Chaturthi
-    datetime(2025, 10, 2),  # Mahatma Gandhi Jayanti
-    datetime(2025, 10, 21), # Dussehra
-    datetime(2025, 10, 24), # Diwali
-    datetime(2025, 11, 5),  # Guru Nanak Jayanti
-    datetime(2025, 12, 25), # Christmas
-]
-
-# Combine all holidays
-NSE_HOLIDAYS = NSE_HOLIDAYS_2024 + NSE_HOLIDAYS_2025
+import csv
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+from config.settings import TRADING_CALENDAR_CONFIG, MARKET_OPEN_TIME
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Monday-Friday sessions
+WEEKMASK = '1111100'
+
+DateLike = Union[datetime, date, str, np.datetime64]
+
+
+def load_holidays(path: str = None) -> List[datetime]:
+    """
+    Read the NSE holiday list
+
+    Args:
+        path: date,holiday CSV, '#' lines are comments (default: TRADING_CALENDAR_CONFIG['HOLIDAYS_FILE'],
+            relative to the project root)
+
+    Returns:
+        Sorted holiday dates (empty if the file is missing - weekdays only)
+    """
+    path = path or TRADING_CALENDAR_CONFIG['HOLIDAYS_FILE']
+    if not os.path.isabs(path):
+        path = os.path.join(PROJECT_ROOT, path)
+
+    try:
+        with open(path, newline='') as f:
+            rows = csv.DictReader(line for line in f if not line.startswith('#'))
+            return sorted(datetime.strptime(row['date'], '%Y-%m-%d') for row in rows if row.get('date'))
+    except FileNotFoundError:
+        print(f"⚠️ Holiday file not found: {path} - counting weekdays only")
+        return []
+
+
+def _to_day(value: DateLike) -> np.datetime64:
+    """Calendar day of a date / datetime (time of day and timezone dropped)"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, 'D')
+
+
+def _to_days(values) -> np.ndarray:
+    """Calendar days of many dates / datetimes as datetime64[D]"""
+    index = pd.DatetimeIndex(np.atleast_1d(values))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]')
+
+
+class TradingCalendar:
+    """
+    Precomputed NSE session index
+    """
+
+    def __init__(self, holidays: List[DateLike] = None, first_year: int = None, last_year: int = None):
+        """
+        Initialize calendar
+
+        Args:
+            holidays: NSE holidays (default: load_holidays())
+            first_year: First year of the session index (default: settings)
+            last_year: Last year of the session index (default: settings)
+        """
+        holidays = load_holidays() if holidays is None else holidays
+        self.holidays = np.unique(np.array([_to_day(h) for h in holidays], dtype='datetime64[D]'))
+        self.busdaycal = np.busdaycalendar(weekmask=WEEKMASK, holidays=self.holidays)
+
+        first_year = first_year or TRADING_CALENDAR_CONFIG['FIRST_YEAR']
+        last_year = last_year or TRADING_CALENDAR_CONFIG['LAST_YEAR']
+        self.first_day = np.datetime64(f"{first_year}-01-01")
+        self.last_day = np.datetime64(f"{last_year}-12-31")
+
+        # Years without holidays count every weekday as a session - say so instead of miscounting silently
+        last_holiday_year = int(str(self.holidays[-1])[:4]) if len(self.holidays) else None
+        if last_holiday_year is not None and last_holiday_year < last_year:
+            print(f"⚠️ NSE holidays only listed up to {last_holiday_year} - trading days after that count weekdays only "
+                  f"(add the next year's list to {TRADING_CALENDAR_CONFIG['HOLIDAYS_FILE']})")
+
+        days = np.arange(self.first_day, self.last_day + 1)
+        self._is_session = np.is_busday(days, busdaycal=self.busdaycal)
+        self.sessions = days[self._is_session]
+
+        # Ordinal of every calendar day = sessions on or before it (a session's ordinal is its 1-based position)
+        self._ordinal = np.cumsum(self._is_session)
+
+    def _offset(self, day: np.datetime64) -> int:
+        """Position of a calendar day in the index (-1 if outside)"""
+        offset = int((day - self.first_day).astype(int))
+        return offset if 0 <= offset < len(self._ordinal) else -1
+
+    def is_session(self, value: DateLike) -> bool:
+        """True if the day is a trading session (not a weekend or NSE holiday)"""
+        day = _to_day(value)
+        offset = self._offset(day)
+        if offset < 0:
+            return bool(np.is_busday(day, busdaycal=self.busdaycal))
+        return bool(self._is_session[offset])
+
+    def count_sessions(self, start: DateLike, end: DateLike) -> int:
+        """
+        Trading sessions from start to end, both days included (order doesn't matter)
+
+        Args:
+            start: First day
+            end: Last day
+
+        Returns:
+            Number of sessions
+        """
+        start, end = sorted((_to_day(start), _to_day(end)))
+        first, last = self._offset(start), self._offset(end)
+        if first < 0 or last < 0:
+            return int(np.busday_count(start, end + 1, busdaycal=self.busdaycal))
+        return int(self._ordinal[last] - self._ordinal[first] + self._is_session[first])
+
+    def count_sessions_many(self, starts, ends) -> np.ndarray:
+        """
+        Vectorized count_sessions for many (start, end) pairs - e.g. holding periods of every backtest position
+
+        Args:
+            starts: First days (array-like of dates / datetimes)
+            ends: Last days (array-like, or one date for all)
+
+        Returns:
+            int array of session counts
+        """
+        starts = _to_days(starts)
+        ends = np.broadcast_to(_to_days(ends), starts.shape)
+        starts, ends = np.minimum(starts, ends), np.maximum(starts, ends)
+
+        first = (starts - self.first_day).astype(int)
+        last = (ends - self.first_day).astype(int)
+        inside = (first >= 0) & (last < len(self._ordinal))
+
+        counts = np.empty(len(starts), dtype=int)
+        f, l = first[inside], last[inside]
+        counts[inside] = self._ordinal[l] - self._ordinal[f] + self._is_session[f]
+        if not inside.all():
+            counts[~inside] = np.busday_count(starts[~inside], ends[~inside] + 1, busdaycal=self.busdaycal)
+        return counts
+
+    def next_session(self, value: DateLike) -> np.datetime64:
+        """First session after the day"""
+        day = _to_day(value)
+        offset = self._offset(day)
+        if offset < 0 or self._ordinal[offset] >= len(self.sessions):
+            return np.busday_offset(day + 1, 0, roll='forward', busdaycal=self.busdaycal)
+        return self.sessions[self._ordinal[offset]]
+
+    def previous_session(self, value: DateLike) -> np.datetime64:
+        """Last session before the day"""
+        day = _to_day(value)
+        offset = self._offset(day - 1)
+        if offset < 0 or self._ordinal[offset] == 0:
+            return np.busday_offset(day - 1, 0, roll='backward', busdaycal=self.busdaycal)
+        return self.sessions[self._ordinal[offset] - 1]
+
+    def sessions_between(self, start: DateLike, end: DateLike) -> np.ndarray:
+        """Sessions from start to end, both days included (datetime64[D] array)"""
+        start, end = _to_day(start), _to_day(end)
+        first, last = self._offset(start), self._offset(end)
+        if first < 0 or last < 0:
+            days = np.arange(start, end + 1)
+            return days[np.is_busday(days, busdaycal=self.busdaycal)]
+        return self.sessions[self._ordinal[first] - self._is_session[first]:self._ordinal[last]]
+
+
+# Singleton instance
+_trading_calendar = None
+_trading_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """Get process-wide trading calendar"""
+    global _trading_calendar
+
+    if _trading_calendar is None:
+        with _trading_calendar_lock:
+            if _trading_calendar is None:
+                _trading_calendar = TradingCalendar()
+
+    return _trading_calendar
 
 
 def is_trading_day(date: datetime) -> bool:
@@ -59,22 +212,16 @@ def is_trading_day(date: datetime) -> bool:
     Returns:
         True if it's a trading day (not weekend or holiday)
     """
-    # Check if weekend (Saturday=5, Sunday=6)
-    if date.weekday() in [5, 6]:
-        return False
-
-    # Check if NSE holiday
-    date_only = datetime(date.year, date.month, date.day)
-    if date_only in NSE_HOLIDAYS:
-        return False
-
-    return True
+    return get_trading_calendar().is_session(date)
 
 
 def calculate_trading_days(start_date: datetime, end_date: datetime = None) -> int:
     """
     Calculate number of trading days between two dates
 
+    Counts the days start_date, start_date + 1 day, ... up to end_date, so the
+    last day only counts once its time of day has reached start_date's.
+
     Args:
         start_date: Start date
         end_date: End date (default: today)
@@ -89,15 +236,33 @@ def calculate_trading_days(start_date: datetime, end_date: datetime = None) -> i
     if start_date > end_date:
         start_date, end_date = end_date, start_date
 
-    trading_days = 0
-    current_date = start_date
+    last_day = start_date.date() + timedelta(days=(end_date - start_date).days)
+    return get_trading_calendar().count_sessions(start_date, last_day)
+
 
-    while current_date <= end_date:
-        if is_trading_day(current_date):
-            trading_days += 1
-        current_date += timedelta(days=1)
+def calculate_trading_days_many(start_dates, end_date: datetime = None) -> np.ndarray:
+    """
+    Vectorized calculate_trading_days for many start dates (same end date)
+
+    Args:
+        start_dates: Start datetimes (array-like)
+        end_date: End date (default: now)
+
+    Returns:
+        int array of trading days
+    """
+    starts = pd.DatetimeIndex(np.atleast_1d(start_dates))
+    end = pd.Timestamp(end_date if end_date is not None else datetime.now())
+    if starts.tz is not None:
+        starts = starts.tz_localize(None)
+    if end.tz is not None:
+        end = end.tz_localize(None)
 
-    return trading_days
+    # Same last-day rule as calculate_trading_days (whole days elapsed from each start)
+    earlier = np.minimum(starts.values, end.to_datetime64())
+    elapsed = np.abs(end.to_datetime64() - starts.values) // np.timedelta64(1, 'D')
+    last_days = earlier.astype('datetime64[D]') + elapsed.astype('timedelta64[D]')
+    return get_trading_calendar().count_sessions_many(earlier, last_days)
 
 
 def get_next_trading_day(date: datetime) -> datetime:
@@ -110,12 +275,8 @@ def get_next_trading_day(date: datetime) -> datetime:
     Returns:
         Next trading day
     """
-    next_day = date + timedelta(days=1)
-
-    while not is_trading_day(next_day):
-        next_day += timedelta(days=1)
-
-    return next_day
+    gap = int((get_trading_calendar().next_session(date) - _to_day(date)).astype(int))
+    return date + timedelta(days=gap)
 
 
 def get_previous_trading_day(date: datetime) -> datetime:
@@ -128,12 +289,29 @@ def get_previous_trading_day(date: datetime) -> datetime:
     Returns:
         Previous trading day
     """
-    prev_day = date - timedelta(days=1)
+    gap = int((_to_day(date) - get_trading_calendar().previous_session(date)).astype(int))
+    return date - timedelta(days=gap)
+
+
+def latest_session(now: datetime = None) -> datetime:
+    """
+    Date of the latest daily bar: today once the market has opened on a trading day, else the previous session
+
+    Args:
+        now: Current time (default: now)
+
+    Returns:
+        Session date (midnight)
+    """
+    now = now or datetime.now()
+    today = datetime(now.year, now.month, now.day)
+    if is_trading_day(today) and now.strftime('%H:%M') >= MARKET_OPEN_TIME:
+        return today
+    return get_previous_trading_day(today)
 
-    while not is_trading_day(prev_day):
-        prev_day -= timedelta(days=1)
 
-    return prev_day
+# Holiday list (datetimes) for callers that need the raw dates
+NSE_HOLIDAYS = load_holidays()
 
 
 # Test the module